@@ -1,8 +1,34 @@
 """Адаптер для загрузки фильтра эндпоинтов из файла"""
 import os
-from typing import Set, Tuple
+import re
+import sys
+from collections import OrderedDict
+from typing import FrozenSet, Tuple
 from ports.endpoints_filter_loader import EndpointsFilterLoader
 
+# Строка фильтра: "<METHOD> <path>", комментарии (#) и пустые строки не совпадают
+_FILTER_LINE_RE = re.compile(rb'(?m)^[ \t]*(?!#)(\S+)[ \t]+(\S.*?)[ \t\r]*$')
+
+# Общие строки для стандартных HTTP методов (ключ - метод в верхнем регистре)
+_METHODS = {
+    method.encode('ascii'): method
+    for method in ('GET', 'POST', 'PUT', 'PATCH', 'DELETE', 'HEAD', 'OPTIONS', 'TRACE')
+}
+
+
+def _method_str(raw: bytes) -> str:
+    """
+    Возвращает метод в верхнем регистре как общую (интернированную) строку.
+    
+    Args:
+        raw: Метод из файла фильтра в байтах
+        
+    Returns:
+        Метод в верхнем регистре
+    """
+    upper = raw.upper()
+    return _METHODS.get(upper) or sys.intern(upper.decode('utf-8'))
+
 
 class FileEndpointsFilterLoader(EndpointsFilterLoader):
     """
@@ -10,9 +36,22 @@ class FileEndpointsFilterLoader(EndpointsFilterLoader):
     
     Формат файла: каждая строка содержит метод и путь, разделенные пробелом.
     Строки, начинающиеся с #, игнорируются как комментарии.
+    
+    Загруженные фильтры кешируются по ключу (path, mtime, inode, size) и возвращаются
+    как frozenset, чтобы повторные вызовы не разбирали файл заново.
     """
     
-    def load(self, source: str) -> Set[Tuple[str, str]]:
+    # Размер буфера чтения файла (256 КБ)
+    READ_BUFFER_SIZE = 1 << 18
+    
+    # Максимальное количество фильтров в кеше
+    CACHE_SIZE = 8
+    
+    def __init__(self):
+        """Инициализирует загрузчик с пустым кешем"""
+        self._cache: "OrderedDict[Tuple[str, int, int, int], FrozenSet[Tuple[str, str]]]" = OrderedDict()
+    
+    def load(self, source: str) -> FrozenSet[Tuple[str, str]]:
         """
         Загружает список эндпоинтов для фильтрации из файла.
         
@@ -20,36 +59,57 @@ class FileEndpointsFilterLoader(EndpointsFilterLoader):
             source: Путь к файлу с фильтром эндпоинтов
             
         Returns:
-            Множество кортежей (method, path)
+            Неизменяемое множество кортежей (method, path)
             
         Raises:
             FileNotFoundError: Если файл не найден
             IOError: Если произошла ошибка при чтении файла
         """
-        endpoints = set()
         if not source:
-            return endpoints
+            return frozenset()
         
         expanded_path = os.path.expanduser(source)
         
-        if not os.path.exists(expanded_path):
+        # Проверка существования файла (без отдельного вызова exists())
+        try:
+            stat = os.stat(expanded_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Файл фильтра {expanded_path} не найден")
+        
+        # Проверка кеша (по тому же stat, что и проверка существования)
+        cache_key = (expanded_path, stat.st_mtime_ns, stat.st_ino, stat.st_size)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self._cache.move_to_end(cache_key)
+            return cached
+        
+        # Файл читается целиком в байтах с увеличенным буфером и разбирается
+        # одним проходом регулярного выражения; некорректные строки не совпадают
+        try:
+            with open(expanded_path, 'rb', buffering=self.READ_BUFFER_SIZE) as f:
+                data = f.read()
+        except FileNotFoundError:
+            # Файл удален между stat и open
             raise FileNotFoundError(f"Файл фильтра {expanded_path} не найден")
         
-        with open(expanded_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    parts = line.split(maxsplit=1)
-                    if len(parts) == 2:
-                        method, path = parts
-                        endpoints.add((method.upper(), path))
-                    # Игнорируем некорректные строки без вывода предупреждения
+        endpoints = frozenset(
+            (_method_str(match.group(1)), match.group(2).decode('utf-8'))
+            for match in _FILTER_LINE_RE.finditer(data)
+        )
+        
+        self._cache[cache_key] = endpoints
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
         
         return endpoints
 
 
+# Общий загрузчик для legacy функции (его кеш сохраняется между вызовами)
+_DEFAULT_LOADER = FileEndpointsFilterLoader()
+
+
 # Функция для обратной совместимости (legacy)
-def load_endpoints_filter(file_path: str) -> Set[Tuple[str, str]]:
+def load_endpoints_filter(file_path: str) -> FrozenSet[Tuple[str, str]]:
     """
     Загружает список эндпоинтов для фильтрации из файла.
     
@@ -59,11 +119,10 @@ def load_endpoints_filter(file_path: str) -> Set[Tuple[str, str]]:
         file_path: Путь к файлу с фильтром эндпоинтов
         
     Returns:
-        Множество кортежей (method, path)
+        Неизменяемое множество кортежей (method, path)
         
     Raises:
         FileNotFoundError: Если файл не найден
     """
-    loader = FileEndpointsFilterLoader()
-    return loader.load(file_path)
+    return _DEFAULT_LOADER.load(file_path)
 
@@ -1,19 +1,179 @@
 """Адаптер для загрузки OpenAPI спецификаций из файла"""
 import os
 import json
-from pathlib import Path
-from typing import Dict
-from ports.spec_loader import SpecLoader
-from domain.models import OpenAPISpec
+import mmap
+import pickle
+import hashlib
+from collections import OrderedDict
+from typing import AbstractSet, Dict, Iterator, Optional, Tuple
+from ports.spec_loader import StreamingSpecLoader
+from domain.models import OpenAPISpec, Endpoint
+from domain.services import EndpointFinder
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson опционален
+    orjson = None
 
-class FileSpecLoader(SpecLoader):
+try:
+    import ujson
+except ImportError:  # pragma: no cover - ujson опционален
+    ujson = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - ijson опционален
+    ijson = None
+
+
+# Ошибки разбора JSON всех поддерживаемых парсеров
+# (orjson.JSONDecodeError наследуется от json.JSONDecodeError)
+_DECODE_ERRORS = (json.JSONDecodeError,) if ujson is None else (json.JSONDecodeError, ujson.JSONDecodeError)
+
+# Таблица для bytes.translate: цифры переводятся в b'0', остальные байты - в b'x'.
+# Целое больше 64 бит записывается не менее чем 20 цифрами подряд
+_DIGITS_TABLE = bytes(0x30 if 0x30 <= byte <= 0x39 else 0x78 for byte in range(256))
+_LONG_DIGITS = b'0' * 20
+
+# Размер блока, которым проверяются на длинные числа отображенные в память файлы
+_SCAN_CHUNK_SIZE = 1 << 20
+
+# Версия формата дискового кеша; увеличивается, когда меняется результат
+# разбора, чтобы не читать записи, сохраненные прежними версиями
+_DISK_CACHE_VERSION = 2
+
+
+def _has_long_number(data) -> bool:
+    """
+    Проверяет, есть ли в данных 20 и более цифр подряд.
+    
+    orjson читает целые числа больше 64 бит как float с потерей точности,
+    поэтому такие данные разбираются другим парсером. Данные проверяются
+    блоками: bytes.translate и bytes.find работают на скорости C и
+    заметно быстрее поиска регулярным выражением. Ложные срабатывания
+    (длинные цифры в строках) лишь отключают orjson для файла.
+    
+    Args:
+        data: Содержимое файла (bytes или mmap)
+        
+    Returns:
+        True если найдена последовательность из 20 и более цифр
+    """
+    overlap = len(_LONG_DIGITS) - 1
+    for start in range(0, len(data), _SCAN_CHUNK_SIZE):
+        # Блоки перекрываются, чтобы не пропустить число на границе блоков
+        chunk = data[max(start - overlap, 0):start + _SCAN_CHUNK_SIZE]
+        if chunk.translate(_DIGITS_TABLE).find(_LONG_DIGITS) != -1:
+            return True
+    return False
+
+
+def _parse_json(data: bytes) -> Dict:
+    """
+    Парсит JSON из байтов, используя orjson или ujson при наличии.
+    
+    orjson не принимает NaN и Infinity, которые допускает стандартный json:
+    при ошибке разбора через orjson данные повторно разбираются через json.
+    Целые числа больше 64 бит orjson возвращает как float, поэтому данные
+    с такими числами разбираются через ujson или json, сохраняющие их точными.
+    
+    Args:
+        data: Содержимое файла в байтах
+        
+    Returns:
+        Распарсенный словарь
+        
+    Raises:
+        json.JSONDecodeError: Если JSON невалиден
+        ujson.JSONDecodeError: Если JSON невалиден (при разборе через ujson)
+    """
+    if orjson is not None and not _has_long_number(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+    if ujson is not None:
+        return ujson.loads(data)
+    return json.loads(data)
+
+
+def _parse_json_mmap(f) -> Dict:
+    """
+    Парсит JSON из файла, отображенного в память.
+    
+    orjson принимает memoryview, поэтому содержимое большого файла
+    передается парсеру без промежуточной копии в bytes. Файлы с NaN,
+    Infinity или целыми больше 64 бит разбираются через json, как в _parse_json.
+    
+    Args:
+        f: Открытый в бинарном режиме файл
+        
+    Returns:
+        Распарсенный словарь
+        
+    Raises:
+        json.JSONDecodeError: Если JSON невалиден
+    """
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if not _has_long_number(mm):
+            with memoryview(mm) as view:
+                try:
+                    return orjson.loads(view)
+                except orjson.JSONDecodeError:
+                    pass
+        return json.loads(mm[:])
+
+
+def default_cache_dir() -> str:
+    """
+    Возвращает каталог дискового кеша спецификаций.
+    
+    Учитывает XDG_CACHE_HOME; по умолчанию ~/.cache/openapi-scribe.
+    
+    Returns:
+        Путь к каталогу кеша
+    """
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'openapi-scribe')
+
+
+class FileSpecLoader(StreamingSpecLoader):
     """
     Адаптер для загрузки OpenAPI спецификаций из файла.
     
     Мигрировано из oatools/utils.py::load_openapi_spec().
+    
+    Распарсенные спецификации кешируются по ключу (realpath, mtime, inode, size),
+    поэтому повторная загрузка неизмененного файла не требует парсинга.
+    Если задан cache_dir, большие спецификации дополнительно сохраняются
+    на диск в pickle, и повторные запуски CLI обходятся без парсинга JSON.
     """
     
+    # Максимальное количество спецификаций в кеше
+    CACHE_SIZE = 8
+    
+    # Размер файла, начиная с которого он отображается в память (1 МБ)
+    MMAP_THRESHOLD = 1 << 20
+    
+    # Размер файла, начиная с которого эндпоинты читаются потоком через ijson (50 МБ)
+    STREAM_THRESHOLD = 50 << 20
+    
+    # Размер файла, начиная с которого спецификация кешируется на диске (1 МБ)
+    DISK_CACHE_THRESHOLD = 1 << 20
+    
+    # Максимальный суммарный размер дискового кеша (200 МБ)
+    DISK_CACHE_MAX_BYTES = 200 << 20
+    
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Инициализирует загрузчик с пустым кешем.
+        
+        Args:
+            cache_dir: Каталог дискового кеша (None - дисковый кеш отключен)
+        """
+        self._cache: "OrderedDict[Tuple[str, int, int, int], OpenAPISpec]" = OrderedDict()
+        self.cache_dir = cache_dir
+    
     def load(self, source: str) -> OpenAPISpec:
         """
         Загружает OpenAPI спецификацию из файла.
@@ -29,26 +189,264 @@ class FileSpecLoader(SpecLoader):
             ValueError: Если JSON невалиден
             IOError: Если произошла ошибка при чтении файла
         """
-        # Расширение пути с тильдой
-        expanded_spec = os.path.expanduser(source)
+        resolved_spec, stat = self._stat(source)
         
-        # Разрешение реального пути (убирает символические ссылки)
-        resolved_spec = os.path.realpath(expanded_spec)
-        spec_path_obj = Path(resolved_spec)
+        # Проверка кеша (по тому же stat, что и проверка существования)
+        cache_key = (resolved_spec, stat.st_mtime_ns, stat.st_ino, stat.st_size)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self._cache.move_to_end(cache_key)
+            return cached
         
-        # Проверка существования файла
-        if not spec_path_obj.exists():
-            raise FileNotFoundError(f"Файл спецификации не найден: {resolved_spec}")
+        # Дисковый кеш для больших файлов (ключ тот же, что и у кеша в памяти)
+        use_disk_cache = self.cache_dir is not None and stat.st_size > self.DISK_CACHE_THRESHOLD
+        if use_disk_cache:
+            spec_dict = self._load_from_disk(cache_key)
+            if spec_dict is not None:
+                return self._remember(cache_key, OpenAPISpec.from_dict(spec_dict))
         
-        # Чтение и парсинг JSON
+        # Чтение и парсинг JSON (файл читается в байтах, без текстового декодера)
         try:
-            with open(spec_path_obj, 'r', encoding='utf-8') as f:
-                spec_dict = json.load(f)
-        except json.JSONDecodeError as e:
+            with open(resolved_spec, 'rb') as f:
+                if orjson is not None and stat.st_size > self.MMAP_THRESHOLD:
+                    spec_dict = _parse_json_mmap(f)
+                else:
+                    spec_dict = _parse_json(f.read())
+        except _DECODE_ERRORS as e:
             raise ValueError(f"Невалидный JSON в файле {resolved_spec}: {e}")
+        except FileNotFoundError:
+            # Файл удален между stat и open
+            raise FileNotFoundError(f"Файл спецификации не найден: {resolved_spec}")
         except IOError as e:
             raise IOError(f"Ошибка чтения файла {resolved_spec}: {e}")
         
+        if use_disk_cache:
+            self._store_on_disk(cache_key, spec_dict)
+        
         # Создание OpenAPISpec из словаря
-        return OpenAPISpec.from_dict(spec_dict)
-
+        return self._remember(cache_key, OpenAPISpec.from_dict(spec_dict))
+    
+    def clear_cache(self):
+        """Очищает кеш загруженных спецификаций"""
+        self._cache.clear()
+    
+    def _remember(self, cache_key: Tuple[str, int, int, int], spec: OpenAPISpec) -> OpenAPISpec:
+        """
+        Сохраняет спецификацию в кеше в памяти, вытесняя самую старую запись.
+        
+        Args:
+            cache_key: Ключ кеша
+            spec: Загруженная спецификация
+            
+        Returns:
+            Та же спецификация
+        """
+        self._cache[cache_key] = spec
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return spec
+    
+    def _disk_cache_path(self, cache_key: Tuple[str, int, int, int]) -> str:
+        """
+        Возвращает путь к файлу дискового кеша для ключа.
+        
+        Args:
+            cache_key: Ключ кеша (realpath, mtime, inode, size)
+            
+        Returns:
+            Путь к pickle-файлу в cache_dir
+        """
+        digest = hashlib.blake2b(repr((_DISK_CACHE_VERSION, cache_key)).encode('utf-8'), digest_size=8).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.pkl")
+    
+    def _load_from_disk(self, cache_key: Tuple[str, int, int, int]) -> Optional[Dict]:
+        """
+        Загружает распарсенную спецификацию из дискового кеша.
+        
+        Поврежденные или недоступные записи считаются промахом кеша.
+        
+        Args:
+            cache_key: Ключ кеша
+            
+        Returns:
+            Словарь спецификации или None, если записи нет
+        """
+        try:
+            with open(self._disk_cache_path(cache_key), 'rb') as f:
+                stored_key, spec_dict = pickle.load(f)
+        except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError):
+            return None
+        
+        # Защита от коллизий укороченного хеша
+        if stored_key != cache_key:
+            return None
+        return spec_dict
+    
+    def _store_on_disk(self, cache_key: Tuple[str, int, int, int], spec_dict: Dict):
+        """
+        Сохраняет распарсенную спецификацию в дисковый кеш.
+        
+        Запись атомарна (через временный файл); ошибки записи игнорируются,
+        так как кеш лишь ускоряет повторную загрузку.
+        
+        Args:
+            cache_key: Ключ кеша
+            spec_dict: Словарь спецификации
+        """
+        cache_path = self._disk_cache_path(cache_key)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((cache_key, spec_dict), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except (OSError, pickle.PicklingError):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+        
+        self._evict_disk_cache()
+    
+    def _evict_disk_cache(self):
+        """
+        Удаляет самые давно использованные записи дискового кеша,
+        пока его суммарный размер превышает DISK_CACHE_MAX_BYTES.
+        """
+        try:
+            entries = []
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.name.endswith('.pkl'):
+                        entry_stat = entry.stat()
+                        entries.append((entry_stat.st_atime, entry_stat.st_size, entry.path))
+        except OSError:
+            return
+        
+        total = sum(size for _, size, _ in entries)
+        # Самые давно использованные записи удаляются первыми
+        for _, size, path in sorted(entries):
+            if total <= self.DISK_CACHE_MAX_BYTES:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+    
+    def iter_endpoints(self, source: str) -> Iterator[Endpoint]:
+        """
+        Последовательно возвращает эндпоинты спецификации.
+        
+        Для файлов больше STREAM_THRESHOLD (при установленном ijson) секция
+        paths разбирается потоково, без построения всей спецификации в памяти.
+        Остальные файлы загружаются обычным образом через load().
+        
+        Args:
+            source: Путь к файлу спецификации
+            
+        Returns:
+            Итератор эндпоинтов в порядке секции paths
+            
+        Raises:
+            FileNotFoundError: Если файл не найден
+            ValueError: Если JSON невалиден
+            IOError: Если произошла ошибка при чтении файла
+        """
+        resolved_spec, stat = self._stat(source)
+        cache_key = (resolved_spec, stat.st_mtime_ns, stat.st_ino, stat.st_size)
+        
+        if ijson is None or stat.st_size <= self.STREAM_THRESHOLD or cache_key in self._cache:
+            return EndpointFinder.iter_all(self.load(source))
+        
+        return self._stream_endpoints(resolved_spec)
+    
+    def load_path_items(self, source: str, paths: AbstractSet[str]) -> Dict[str, Dict]:
+        """
+        Возвращает элементы секции paths только для указанных путей.
+        
+        Для файлов больше STREAM_THRESHOLD (при установленном ijson) секция
+        paths разбирается потоково: материализуются только искомые элементы,
+        а чтение прекращается, как только все они найдены.
+        
+        Args:
+            source: Путь к файлу спецификации
+            paths: Множество искомых путей
+            
+        Returns:
+            Словарь {путь: словарь методов} для найденных путей
+            
+        Raises:
+            FileNotFoundError: Если файл не найден
+            ValueError: Если JSON невалиден
+            IOError: Если произошла ошибка при чтении файла
+        """
+        resolved_spec, stat = self._stat(source)
+        cache_key = (resolved_spec, stat.st_mtime_ns, stat.st_ino, stat.st_size)
+        
+        if ijson is None or stat.st_size <= self.STREAM_THRESHOLD or cache_key in self._cache:
+            return super().load_path_items(source, paths)
+        
+        found = {}
+        try:
+            with open(resolved_spec, 'rb') as f:
+                for path, path_item in ijson.kvitems(f, 'paths', use_float=True):
+                    if path in paths:
+                        found[path] = path_item
+                        if len(found) == len(paths):
+                            break
+        except ijson.JSONError as e:
+            raise ValueError(f"Невалидный JSON в файле {resolved_spec}: {e}")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Файл спецификации не найден: {resolved_spec}")
+        except IOError as e:
+            raise IOError(f"Ошибка чтения файла {resolved_spec}: {e}")
+        
+        return found
+    
+    def _stream_endpoints(self, resolved_spec: str) -> Iterator[Endpoint]:
+        """
+        Потоково разбирает секцию paths файла через ijson.
+        
+        Args:
+            resolved_spec: Реальный путь к файлу спецификации
+            
+        Yields:
+            Endpoint для каждой операции
+        """
+        try:
+            with open(resolved_spec, 'rb') as f:
+                path_items = ijson.kvitems(f, 'paths', use_float=True)
+                yield from EndpointFinder.iter_from_paths(path_items)
+        except ijson.JSONError as e:
+            raise ValueError(f"Невалидный JSON в файле {resolved_spec}: {e}")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Файл спецификации не найден: {resolved_spec}")
+        except IOError as e:
+            raise IOError(f"Ошибка чтения файла {resolved_spec}: {e}")
+    
+    def _stat(self, source: str) -> Tuple[str, os.stat_result]:
+        """
+        Разрешает путь к файлу спецификации и получает его stat.
+        
+        Args:
+            source: Путь к файлу спецификации
+            
+        Returns:
+            Кортеж (реальный путь, результат os.stat)
+            
+        Raises:
+            FileNotFoundError: Если файл не найден
+        """
+        # Расширение пути с тильдой
+        expanded_spec = os.path.expanduser(source)
+        
+        # Разрешение реального пути (убирает символические ссылки)
+        resolved_spec = os.path.realpath(expanded_spec)
+        
+        # Проверка существования файла (без отдельного вызова exists())
+        try:
+            return resolved_spec, os.stat(resolved_spec)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Файл спецификации не найден: {resolved_spec}")
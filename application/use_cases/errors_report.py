@@ -1,10 +1,16 @@
 """Use case для генерации отчета по эндпоинтам с кодами ошибок"""
 from typing import List, Dict, Set
-from ports.spec_loader import SpecLoader
+from ports.spec_loader import SpecLoader, StreamingSpecLoader
 from domain.models import Endpoint
 from domain.services import EndpointFinder
 from rendering.errors_report_formatter import ErrorsReportFormatter
 
+# Коды ошибок (4xx, 5xx) и их диапазоны в верхнем регистре
+_ERROR_CODES = frozenset(str(code) for code in range(400, 600)) | {'4XX', '5XX'}
+
+# Порядковый номер каждого кода в отчете: 400..499, 4XX, 500..599, 5XX
+_CODE_ORDER = {code: index for index, code in enumerate(sorted(_ERROR_CODES))}
+
 
 class ErrorsReportUseCase:
     """
@@ -45,20 +51,25 @@ class ErrorsReportUseCase:
             FileNotFoundError: Если файл спецификации не найден
             IOError: Если произошла ошибка при чтении файла
         """
-        # Загрузка спецификации
-        spec = self.spec_loader.load(spec_source)
-        
-        # Получение списка эндпоинтов
-        endpoints = self.finder.list_all(spec)
+        # Получение списка эндпоинтов (потоковый загрузчик отдает их
+        # без загрузки всей спецификации)
+        if isinstance(self.spec_loader, StreamingSpecLoader):
+            endpoints = self.spec_loader.iter_endpoints(spec_source)
+        else:
+            spec = self.spec_loader.load(spec_source)
+            endpoints = self.finder.iter_all(spec)
         
         # Извлечение информации об ошибках для каждого эндпоинта
         report_data = []
+        extract_error_codes = self._extract_error_codes
+        append = report_data.append
+        code_order = _CODE_ORDER.__getitem__
         for endpoint in endpoints:
-            error_codes = self._extract_error_codes(endpoint)
-            report_data.append({
+            error_codes = extract_error_codes(endpoint)
+            append({
                 'path': endpoint.path,
                 'method': endpoint.method,
-                'error_codes': sorted(error_codes) if error_codes else []
+                'error_codes': sorted(error_codes, key=code_order)
             })
         
         return report_data
@@ -90,21 +101,8 @@ class ErrorsReportUseCase:
         Returns:
             Множество кодов ошибок
         """
-        error_codes = set()
         responses = endpoint.operation.get('responses', {})
         
-        for code_str in responses.keys():
-            # Пропускаем диапазоны типа "default" или "2XX"
-            if not code_str.isdigit():
-                # Проверяем диапазоны типа "4XX", "5XX"
-                if code_str.upper() in ('4XX', '5XX'):
-                    error_codes.add(code_str.upper())
-                continue
-            
-            code = int(code_str)
-            # Извлекаем только коды ошибок (4xx и 5xx)
-            if 400 <= code < 600:
-                error_codes.add(code_str)
-        
-        return error_codes
-
+        # Одна проверка принадлежности вместо разбора каждого кода;
+        # "default", "2XX" и коды успеха в множество не входят
+        return {code for code in map(str.upper, responses) if code in _ERROR_CODES}
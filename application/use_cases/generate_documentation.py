@@ -1,8 +1,8 @@
 """Use case для генерации Markdown документации"""
-from typing import Optional
+from typing import Optional, TextIO, Tuple
 from ports.spec_loader import SpecLoader
 from ports.endpoints_filter_loader import EndpointsFilterLoader
-from domain.models import EndpointFilter
+from domain.models import EndpointFilter, OpenAPISpec
 from rendering.markdown import MarkdownGenerator
 
 
@@ -13,23 +13,30 @@ class GenerateDocumentationUseCase:
     Координирует работу SpecLoader и MarkdownGenerator для генерации документации.
     """
     
-    def __init__(self, spec_loader: SpecLoader, filter_loader: Optional[EndpointsFilterLoader] = None):
+    def __init__(
+        self,
+        spec_loader: SpecLoader,
+        filter_loader: Optional[EndpointsFilterLoader] = None,
+        template_cache_dir: Optional[str] = None
+    ):
         """
         Инициализирует use case.
         
         Args:
             spec_loader: Адаптер для загрузки спецификаций
             filter_loader: Адаптер для загрузки фильтров эндпоинтов (опционально)
+            template_cache_dir: Каталог дискового кеша скомпилированных шаблонов (опционально)
         """
         self.spec_loader = spec_loader
         self.filter_loader = filter_loader
-        self.markdown_generator = MarkdownGenerator()
+        self.markdown_generator = MarkdownGenerator(bytecode_cache_dir=template_cache_dir)
     
     def execute(
         self,
         spec_source: str,
         endpoints_filter: Optional[str] = None,
-        include_all_schemas: bool = False
+        include_all_schemas: bool = False,
+        max_workers: Optional[int] = None
     ) -> str:
         """
         Выполняет генерацию Markdown документации.
@@ -38,6 +45,7 @@ class GenerateDocumentationUseCase:
             spec_source: Путь к файлу спецификации
             endpoints_filter: Путь к файлу с фильтром эндпоинтов (опционально)
             include_all_schemas: Включить все схемы, а не только используемые
+            max_workers: Количество процессов для рендеринга эндпоинтов (опционально)
             
         Returns:
             Сгенерированная Markdown документация
@@ -46,6 +54,56 @@ class GenerateDocumentationUseCase:
             FileNotFoundError: Если файл спецификации не найден
             IOError: Если произошла ошибка при чтении файла
         """
+        spec_obj, endpoint_filter = self._load(spec_source, endpoints_filter)
+        
+        # Генерация документации через новый MarkdownGenerator
+        return self.markdown_generator.generate(
+            spec=spec_obj,
+            endpoints_filter=endpoint_filter,
+            include_all_schemas=include_all_schemas,
+            max_workers=max_workers
+        )
+    
+    def execute_to(
+        self,
+        output: TextIO,
+        spec_source: str,
+        endpoints_filter: Optional[str] = None,
+        include_all_schemas: bool = False,
+        max_workers: Optional[int] = None
+    ) -> None:
+        """
+        Выполняет генерацию Markdown документации с записью в файл по частям.
+        
+        Спецификация и фильтр загружаются до первой записи в output.
+        
+        Args:
+            output: Открытый текстовый файл для записи
+            spec_source: Путь к файлу спецификации
+            endpoints_filter: Путь к файлу с фильтром эндпоинтов (опционально)
+            include_all_schemas: Включить все схемы, а не только используемые
+            max_workers: Количество процессов для рендеринга эндпоинтов (опционально)
+            
+        Raises:
+            FileNotFoundError: Если файл спецификации не найден
+            IOError: Если произошла ошибка при чтении файла
+        """
+        spec_obj, endpoint_filter = self._load(spec_source, endpoints_filter)
+        
+        self.markdown_generator.generate_to(
+            output,
+            spec=spec_obj,
+            endpoints_filter=endpoint_filter,
+            include_all_schemas=include_all_schemas,
+            max_workers=max_workers
+        )
+    
+    def _load(
+        self,
+        spec_source: str,
+        endpoints_filter: Optional[str]
+    ) -> Tuple[OpenAPISpec, Optional[EndpointFilter]]:
+        """Загружает спецификацию и фильтр эндпоинтов"""
         # Загрузка спецификации
         spec_obj = self.spec_loader.load(spec_source)
         
@@ -59,10 +117,4 @@ class GenerateDocumentationUseCase:
                 # Если файл фильтра не найден, продолжаем без фильтра
                 endpoint_filter = None
         
-        # Генерация документации через новый MarkdownGenerator
-        return self.markdown_generator.generate(
-            spec=spec_obj,
-            endpoints_filter=endpoint_filter,
-            include_all_schemas=include_all_schemas
-        )
-
+        return spec_obj, endpoint_filter
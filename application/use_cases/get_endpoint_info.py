@@ -1,8 +1,11 @@
 """Use case для получения информации об эндпоинте"""
-from typing import Optional, List, Dict
-from ports.spec_loader import SpecLoader
-from domain.models import Endpoint
-from domain.services import EndpointFinder, SchemaResolver
+from typing import Optional, List, Dict, Tuple
+from ports.spec_loader import SpecLoader, StreamingSpecLoader
+from domain.models import OpenAPISpec, Endpoint
+from domain.services import EndpointFinder, SchemaCollector, SchemaResolver
+
+# Префикс ссылок на схемы из components/schemas
+_SCHEMA_REF_PREFIX = '#/components/schemas/'
 
 
 class GetEndpointInfoUseCase:
@@ -21,6 +24,7 @@ class GetEndpointInfoUseCase:
         """
         self.spec_loader = spec_loader
         self.finder = EndpointFinder()
+        self._collector: Optional[SchemaCollector] = None
     
     def execute(self, spec_source: str, path: str, method: str, expand_schemas: bool = False) -> Optional[Endpoint]:
         """
@@ -40,6 +44,14 @@ class GetEndpointInfoUseCase:
             ValueError: Если путь или метод не найдены
             IOError: Если произошла ошибка при чтении файла
         """
+        # Потоковый загрузчик разбирает только элемент paths для искомого пути
+        if isinstance(self.spec_loader, StreamingSpecLoader):
+            endpoint_path = path.rstrip('/')
+            path_items = self.spec_loader.load_path_items(
+                spec_source, {endpoint_path, endpoint_path + '/'}
+            )
+            return self.finder.find_in_paths(path_items, path, method)
+        
         # Загрузка спецификации
         spec = self.spec_loader.load(spec_source)
         
@@ -63,48 +75,102 @@ class GetEndpointInfoUseCase:
         """
         # Загрузка спецификации
         spec = self.spec_loader.load(spec_source)
-        resolver = SchemaResolver(spec)
-        visited_schemas = set()
-        related_schemas = []
+        return self._collect_related_schemas(spec, endpoint)
+    
+    def execute_with_schemas(
+        self,
+        spec_source: str,
+        path: str,
+        method: str
+    ) -> Tuple[Endpoint, List[Dict[str, Dict]]]:
+        """
+        Находит эндпоинт и его связанные схемы за одну загрузку спецификации.
         
-        def find_schemas(node):
-            """Рекурсивно находит все схемы в узле"""
-            if isinstance(node, dict):
-                # Обработка ссылок
-                if '$ref' in node:
-                    ref = node['$ref']
-                    if ref.startswith('#/components/schemas/'):
-                        schema_name = ref.split('/')[-1]
-                        if schema_name not in visited_schemas:
-                            visited_schemas.add(schema_name)
-                            resolved_schema = resolver.resolve(ref)
-                            if resolved_schema:
-                                related_schemas.append({
-                                    "name": schema_name,
-                                    "definition": resolved_schema
-                                })
-                                # Рекурсивный обход свойств схемы
-                                find_schemas(resolved_schema)
-                
-                # Рекурсивный обход вложенных элементов
-                for key, value in node.items():
-                    find_schemas(value)
+        Args:
+            spec_source: Путь к файлу спецификации
+            path: Путь эндпоинта
+            method: HTTP метод
+            
+        Returns:
+            Кортеж (эндпоинт, список связанных схем)
             
-            elif isinstance(node, list):
-                for item in node:
-                    find_schemas(item)
+        Raises:
+            FileNotFoundError: Если файл спецификации не найден
+            ValueError: Если путь или метод не найдены
+            IOError: Если произошла ошибка при чтении файла
+        """
+        spec = self.spec_loader.load(spec_source)
+        endpoint = self.finder.find(spec, path, method)
+        return endpoint, self._collect_related_schemas(spec, endpoint)
+    
+    def _collect_related_schemas(self, spec: OpenAPISpec, endpoint: Endpoint) -> List[Dict[str, Dict]]:
+        """
+        Обходит операцию эндпоинта и собирает схемы, на которые она ссылается.
         
-        # Поиск схем в параметрах
-        for param in endpoint.operation.get('parameters', []):
-            find_schemas(param)
+        Args:
+            spec: OpenAPI спецификация
+            endpoint: Эндпоинт для анализа
+            
+        Returns:
+            Список словарей вида [{"name": "SchemaName", "definition": {...}}, ...]
+        """
+        resolver = self._get_resolver(spec)
+        collector = self._get_collector(resolver)
+        resolve = resolver.resolve
         
-        # Поиск схем в теле запроса
-        request_body = endpoint.operation.get('requestBody', {})
-        find_schemas(request_body)
+        # Параметры, тело запроса и ответы - в порядке вывода схем
+        operation = endpoint.operation
+        roots = list(operation.get('parameters', []))
+        roots.append(operation.get('requestBody', {}))
+        # Ответы передаются по одному: ключи словаря ответов - коды
+        # (в том числе 'default'), а не ключевые слова схемы
+        responses = operation.get('responses', {})
+        if type(responses) is dict:
+            roots.extend(responses.values())
+        else:
+            roots.append(responses)
         
-        # Поиск схем в ответах
-        responses = endpoint.operation.get('responses', {})
-        find_schemas(responses)
+        # Схемы идут в порядке обхода в глубину; граф ссылок между схемами
+        # кешируется коллектором и переиспользуется следующими вызовами.
+        # Схемы с пустым определением не выводятся (и не обходятся коллектором)
+        related_schemas = []
+        related_append = related_schemas.append
+        for schema_name in collector.collect_ordered(roots):
+            resolved_schema = resolve(_SCHEMA_REF_PREFIX + schema_name)
+            if resolved_schema:
+                related_append({
+                    "name": schema_name,
+                    "definition": resolved_schema
+                })
         
         return related_schemas
-
+    
+    def _get_collector(self, resolver: SchemaResolver) -> SchemaCollector:
+        """
+        Возвращает коллектор схем для резолвера, переиспользуя его кеш ссылок.
+        
+        Args:
+            resolver: Резолвер спецификации
+            
+        Returns:
+            SchemaCollector для спецификации резолвера
+        """
+        if self._collector is None or self._collector.resolver is not resolver:
+            self._collector = SchemaCollector(resolver.spec, resolver)
+        return self._collector
+    
+    def _get_resolver(self, spec: OpenAPISpec) -> SchemaResolver:
+        """
+        Возвращает резолвер для спецификации, переиспользуя его кеш ссылок.
+        
+        Резолвер общий с другими use case и генератором Markdown
+        (см. SchemaResolver.for_spec) и пересоздается только для нового
+        объекта спецификации.
+        
+        Args:
+            spec: OpenAPI спецификация
+            
+        Returns:
+            SchemaResolver для этой спецификации
+        """
+        return SchemaResolver.for_spec(spec)
@@ -1,6 +1,6 @@
 """Use case для получения списка всех эндпоинтов"""
-from typing import List
-from ports.spec_loader import SpecLoader
+from typing import List, Tuple
+from ports.spec_loader import SpecLoader, StreamingSpecLoader
 from domain.models import Endpoint
 from domain.services import EndpointFinder
 from rendering.formatters import StatsFormatter
@@ -37,12 +37,33 @@ class ListEndpointsUseCase:
             FileNotFoundError: Если файл спецификации не найден
             IOError: Если произошла ошибка при чтении файла
         """
+        # Потоковый загрузчик отдает эндпоинты без загрузки всей спецификации
+        if isinstance(self.spec_loader, StreamingSpecLoader):
+            return list(self.spec_loader.iter_endpoints(spec_source))
+        
         # Загрузка спецификации
         spec = self.spec_loader.load(spec_source)
         
         # Получение списка эндпоинтов
         return self.finder.list_all(spec)
     
+    def list_keys(self, spec_source: str) -> Tuple[List[str], List[str]]:
+        """
+        Возвращает методы и пути всех эндпоинтов без создания объектов Endpoint.
+        
+        Args:
+            spec_source: Путь к файлу спецификации
+            
+        Returns:
+            Кортеж (методы, пути) в виде параллельных списков
+            
+        Raises:
+            FileNotFoundError: Если файл спецификации не найден
+            IOError: Если произошла ошибка при чтении файла
+        """
+        spec = self.spec_loader.load(spec_source)
+        return self.finder.list_keys(spec)
+    
     def get_stats(self, endpoints: List[Endpoint]) -> str:
         """
         Вычисляет и форматирует статистику по эндпоинтам.
@@ -1,9 +1,43 @@
 """Use case для проверки информационных потерь в документации"""
+import os
+import mmap
 from typing import List, Dict, Optional
 from ports.spec_loader import SpecLoader
 from domain.models import Endpoint
 from domain.services import EndpointFinder
-from rendering.verifier import DocumentationVerifier
+from rendering.verifier import DocumentationVerifier, MarkdownIndex
+
+
+# Состояние процесса-воркера: Markdown и индекс передаются один раз
+# при запуске процесса, а не с каждым эндпоинтом
+_worker_verifier: Optional[DocumentationVerifier] = None
+_worker_index: Optional[MarkdownIndex] = None
+
+
+def _init_worker(verifier: DocumentationVerifier, markdown_content: str):
+    """
+    Инициализирует процесс-воркер для проверки эндпоинтов.
+    
+    Args:
+        verifier: Верификатор документации
+        markdown_content: Содержимое Markdown документации
+    """
+    global _worker_verifier, _worker_index
+    _worker_verifier = verifier
+    _worker_index = MarkdownIndex(markdown_content)
+
+
+def _verify_in_worker(endpoint: Endpoint) -> Dict:
+    """
+    Проверяет эндпоинт в процессе-воркере.
+    
+    Args:
+        endpoint: Эндпоинт для проверки
+        
+    Returns:
+        Результат проверки эндпоинта
+    """
+    return _worker_verifier.verify_endpoint(endpoint, _worker_index.markdown, _worker_index)
 
 
 class VerifyDocumentationUseCase:
@@ -13,6 +47,18 @@ class VerifyDocumentationUseCase:
     Сравнивает данные из OpenAPI спецификации с Markdown и находит информационные потери.
     """
     
+    # Размер буфера чтения Markdown файла (1 МБ)
+    READ_BUFFER_SIZE = 1 << 20
+    
+    # Размер файла, начиная с которого он отображается в память (1 МБ)
+    MMAP_THRESHOLD = 1 << 20
+    
+    # Минимальное количество эндпоинтов, при котором запуск процессов окупается
+    PARALLEL_MIN_ENDPOINTS = 8
+    
+    # Количество эндпоинтов, передаваемых воркеру за одну отправку
+    PARALLEL_CHUNK_SIZE = 16
+    
     def __init__(self, spec_loader: SpecLoader):
         """
         Инициализирует use case.
@@ -52,11 +98,7 @@ class VerifyDocumentationUseCase:
             raise ValueError(f"Эндпоинт {method} {path} не найден в спецификации")
         
         # Чтение Markdown файла
-        try:
-            with open(markdown_file, 'r', encoding='utf-8') as f:
-                markdown_content = f.read()
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Файл Markdown не найден: {markdown_file}")
+        markdown_content = self._read_markdown(markdown_file)
         
         # Проверка
         return self.verifier.verify_endpoint(endpoint, markdown_content)
@@ -65,7 +107,8 @@ class VerifyDocumentationUseCase:
         self,
         spec_source: str,
         markdown_file: str,
-        endpoints_filter: Optional[List[tuple]] = None
+        endpoints_filter: Optional[List[tuple]] = None,
+        max_workers: Optional[int] = None
     ) -> Dict:
         """
         Проверяет полноту информации для всех эндпоинтов в Markdown.
@@ -74,6 +117,9 @@ class VerifyDocumentationUseCase:
             spec_source: Путь к файлу спецификации
             markdown_file: Путь к файлу с Markdown документацией
             endpoints_filter: Список кортежей (method, path) для фильтрации (опционально)
+            max_workers: Количество процессов для параллельной проверки эндпоинтов
+                (по умолчанию, а также при числе эндпоинтов меньше
+                PARALLEL_MIN_ENDPOINTS проверка выполняется последовательно)
             
         Returns:
             Словарь с результатами проверки всех эндпоинтов
@@ -81,37 +127,73 @@ class VerifyDocumentationUseCase:
         # Загрузка спецификации
         spec = self.spec_loader.load(spec_source)
         
-        # Получение списка эндпоинтов
-        endpoints = self.finder.list_all(spec)
-        
-        # Фильтрация (если указана)
+        # Получение списка эндпоинтов (фильтр применяется до создания Endpoint)
+        filter_set = None
         if endpoints_filter:
-            filter_set = {(m.upper(), p) for m, p in endpoints_filter}
-            endpoints = [
-                e for e in endpoints
-                if (e.method.upper(), e.path) in filter_set
-            ]
+            filter_set = frozenset((m.upper(), p) for m, p in endpoints_filter)
+        endpoints = self.finder.list_all(spec, filter_set)
         
         # Чтение Markdown файла
-        try:
-            with open(markdown_file, 'r', encoding='utf-8') as f:
-                markdown_content = f.read()
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Файл Markdown не найден: {markdown_file}")
+        markdown_content = self._read_markdown(markdown_file)
         
-        # Проверка каждого эндпоинта
-        results = []
-        total_issues = 0
-        
-        for endpoint in endpoints:
-            result = self.verifier.verify_endpoint(endpoint, markdown_content)
-            results.append(result)
-            total_issues += result['issues_count']
+        # Проверка каждого эндпоинта. Проверка упирается в CPU (регулярные
+        # выражения и обход словарей), поэтому параллелится процессами;
+        # map сохраняет порядок результатов
+        if max_workers and max_workers > 1 and len(endpoints) >= self.PARALLEL_MIN_ENDPOINTS:
+            # multiprocessing импортируется только при параллельной проверке,
+            # чтобы не замедлять запуск остальных команд CLI
+            from concurrent.futures import ProcessPoolExecutor
+            
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker,
+                initargs=(self.verifier, markdown_content)
+            ) as executor:
+                results = list(executor.map(
+                    _verify_in_worker, endpoints, chunksize=self.PARALLEL_CHUNK_SIZE
+                ))
+        else:
+            # Индекс заголовков строится один раз для всех эндпоинтов
+            markdown_index = MarkdownIndex(markdown_content)
+            verify = self.verifier.verify_endpoint
+            results = [verify(endpoint, markdown_content, markdown_index) for endpoint in endpoints]
         
         return {
             'total_endpoints': len(endpoints),
             'endpoints_with_issues': sum(1 for r in results if r['has_issues']),
-            'total_issues': total_issues,
+            'total_issues': sum(r['issues_count'] for r in results),
             'results': results
         }
-
+    
+    def _read_markdown(self, markdown_file: str) -> str:
+        """
+        Читает Markdown файл целиком.
+        
+        Файл читается в байтах с большим буфером и декодируется одним вызовом
+        вместо построчной работы текстового декодера. Файлы больше
+        MMAP_THRESHOLD отображаются в память и декодируются прямо из
+        отображения, без промежуточного объекта bytes.
+        
+        Args:
+            markdown_file: Путь к файлу с Markdown документацией
+            
+        Returns:
+            Содержимое файла
+            
+        Raises:
+            FileNotFoundError: Если файл не найден
+        """
+        try:
+            with open(markdown_file, 'rb', buffering=self.READ_BUFFER_SIZE) as f:
+                if os.fstat(f.fileno()).st_size > self.MMAP_THRESHOLD:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        content = str(mm, 'utf-8')
+                else:
+                    content = f.read().decode('utf-8')
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Файл Markdown не найден: {markdown_file}")
+        
+        # Нормализация переводов строк, как при чтении в текстовом режиме
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
@@ -2,9 +2,11 @@
 import sys
 import os
 import json
+import codecs
 import click
-from io import BytesIO
-from adapters.input.file_spec_loader import FileSpecLoader
+from operator import itemgetter
+from typing import List, Optional
+from adapters.input.file_spec_loader import FileSpecLoader, default_cache_dir
 from adapters.input.endpoints_filter_loader import FileEndpointsFilterLoader
 from application.use_cases import (
     GetEndpointInfoUseCase,
@@ -15,21 +17,160 @@ from application.use_cases import (
     ErrorsReportUseCase
 )
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson опционален
+    orjson = None
+
+# Группа для эндпоинтов без тегов в команде list
+_NO_TAG = ('Без тега',)
+
+# Размер буфера файла при потоковой записи документации
+_OUTPUT_BUFFER_SIZE = 1 << 20
+
+
+def _template_cache_dir() -> str:
+    """Каталог дискового кеша скомпилированных Jinja2 шаблонов"""
+    return os.path.join(default_cache_dir(), 'templates')
+
+
 # Инициализация зависимостей
-_spec_loader = FileSpecLoader()
+_spec_loader = FileSpecLoader(cache_dir=default_cache_dir())
 _filter_loader = FileEndpointsFilterLoader()
 _endpoint_use_case = GetEndpointInfoUseCase(_spec_loader)
 _schema_use_case = GetSchemaInfoUseCase(_spec_loader)
 _list_use_case = ListEndpointsUseCase(_spec_loader)
-_generate_use_case = GenerateDocumentationUseCase(_spec_loader, _filter_loader)
+_generate_use_case = GenerateDocumentationUseCase(_spec_loader, _filter_loader, _template_cache_dir())
 _verify_use_case = VerifyDocumentationUseCase(_spec_loader)
 _errors_report_use_case = ErrorsReportUseCase(_spec_loader)
 
 
+# Кодировщик для случаев без orjson: создается один раз на модуль
+_JSON_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+
+def _orjson_dumps(obj) -> Optional[bytes]:
+    """
+    Сериализует объект через orjson с отступом в 2 пробела.
+    
+    Args:
+        obj: Объект для сериализации
+        
+    Returns:
+        JSON в байтах или None, если orjson не установлен или не может
+        сериализовать объект (например, целые за пределами 64 бит)
+    """
+    if orjson is None:
+        return None
+    try:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError:
+        return None
+
+
+def _dump_json(obj) -> str:
+    """
+    Сериализует объект в JSON строку с отступом в 2 пробела.
+    
+    Args:
+        obj: Объект для сериализации
+        
+    Returns:
+        JSON строка
+    """
+    data = _orjson_dumps(obj)
+    if data is not None:
+        return data.decode('utf-8')
+    return _JSON_ENCODER.encode(obj)
+
+
+def _dump_json_bytes(obj) -> bytes:
+    """
+    Сериализует объект в JSON с отступом в 2 пробела в байтах UTF-8.
+    
+    Args:
+        obj: Объект для сериализации
+        
+    Returns:
+        JSON в байтах
+    """
+    data = _orjson_dumps(obj)
+    if data is not None:
+        return data
+    return _JSON_ENCODER.encode(obj).encode('utf-8')
+
+
+def _is_utf8_stream(stream) -> bool:
+    """
+    Проверяет, что у текстового потока есть бинарный буфер и кодировка UTF-8.
+    
+    Args:
+        stream: Текстовый поток (например, sys.stdout)
+        
+    Returns:
+        True если байты UTF-8 можно писать напрямую в stream.buffer
+    """
+    if getattr(stream, 'buffer', None) is None:
+        return False
+    try:
+        return codecs.lookup(stream.encoding).name == 'utf-8'
+    except (AttributeError, LookupError, TypeError):
+        return False
+
+
+def _echo_lines(lines: List[bytes]):
+    """
+    Выводит строки в байтах UTF-8 напрямую в бинарный stdout.
+    
+    JSON из orjson уже закодирован, поэтому он пишется без декодирования
+    в str и повторного кодирования в click.echo; после каждой строки
+    добавляется перевод строки, как у click.echo. Если stdout не в UTF-8
+    или у него нет бинарного буфера, текст выводится через click.echo,
+    который перекодирует его для консоли.
+    
+    Args:
+        lines: Строки для вывода
+    """
+    if not _is_utf8_stream(sys.stdout):
+        click.echo(b'\n'.join(lines).decode('utf-8'))
+        return
+    
+    # Текстовый слой сбрасывается, чтобы не нарушить порядок с click.echo
+    sys.stdout.flush()
+    stream = sys.stdout.buffer
+    for line in lines:
+        stream.write(line)
+        stream.write(b'\n')
+    stream.flush()
+
+
+def _write_json(obj, path: str):
+    """
+    Сохраняет объект в файл в формате JSON с отступом в 2 пробела.
+    
+    Результат orjson записывается в файл одним буфером; без orjson JSON
+    записывается по частям, без построения всей строки в памяти.
+    
+    Args:
+        obj: Объект для сериализации
+        path: Путь к файлу
+    """
+    data = _orjson_dumps(obj)
+    if data is not None:
+        with open(path, 'wb') as f:
+            f.write(data)
+        return
+    
+    with open(path, 'w', encoding='utf-8') as f:
+        f.writelines(_JSON_ENCODER.iterencode(obj))
+
+
 @click.group()
-def cli():
+@click.option('--no-cache', is_flag=True, help='Не использовать дисковый кеш распарсенных спецификаций и шаблонов')
+def cli(no_cache):
     """Утилита для работы с OpenAPI спецификациями"""
-    pass
+    _spec_loader.cache_dir = None if no_cache else default_cache_dir()
+    _generate_use_case.markdown_generator.bytecode_cache_dir = None if no_cache else _template_cache_dir()
 
 
 # ============================================================================
@@ -44,25 +185,31 @@ def cli():
 def find_endpoint_info(spec, path, method, expand_schemas):
     """Находит информацию об эндпоинте в OpenAPI спецификации"""
     try:
-        # Использование use case для поиска эндпоинта
-        endpoint = _endpoint_use_case.execute(spec, path, method)
+        # Использование use case для поиска эндпоинта (и связанных схем
+        # за ту же загрузку спецификации)
+        if expand_schemas:
+            endpoint, related_schemas = _endpoint_use_case.execute_with_schemas(spec, path, method)
+        else:
+            endpoint = _endpoint_use_case.execute(spec, path, method)
         
-        # Форматированный вывод
-        click.echo(f"\nИнформация для {endpoint.method} {endpoint.path}:")
-        click.echo(json.dumps(endpoint.operation, indent=2, ensure_ascii=False))
-
-        # Рекурсивный вывод схем
+        # Форматированный вывод: JSON выводится байтами без промежуточной
+        # общей строки (см. _echo_lines)
+        lines = [
+            f"\nИнформация для {endpoint.method} {endpoint.path}:".encode('utf-8'),
+            _dump_json_bytes(endpoint.operation)
+        ]
+
+        # Вывод связанных схем
         if expand_schemas:
-            related_schemas = _endpoint_use_case.get_related_schemas(spec, endpoint)
-            
+            lines.append("\n\n### 🔍 Связанные схемы:".encode('utf-8'))
             if related_schemas:
-                click.echo("\n\n### 🔍 Связанные схемы:")
                 for schema_info in related_schemas:
-                    click.echo(f"\n### Схема: {schema_info['name']}")
-                    click.echo(json.dumps(schema_info['definition'], indent=2, ensure_ascii=False))
+                    lines.append(f"\n### Схема: {schema_info['name']}".encode('utf-8'))
+                    lines.append(_dump_json_bytes(schema_info['definition']))
             else:
-                click.echo("\n\n### 🔍 Связанные схемы:")
-                click.echo("Связанные схемы не обнаружены")
+                lines.append("Связанные схемы не обнаружены".encode('utf-8'))
+        
+        _echo_lines(lines)
         
     except Exception as e:
         click.echo(f"Ошибка: {str(e)}", err=True)
@@ -104,8 +251,10 @@ def find_schema_info(spec, name, list_schemas):
             )
             
         # Форматированный вывод
-        click.echo(f"\nСхема '{schema.name}':")
-        click.echo(json.dumps(schema.definition, indent=2, ensure_ascii=False))
+        _echo_lines([
+            f"\nСхема '{schema.name}':".encode('utf-8'),
+            _dump_json_bytes(schema.definition)
+        ])
         
     except Exception as e:
         click.echo(f"Ошибка: {str(e)}", err=True)
@@ -131,7 +280,11 @@ def list_endpoints(spec, output, summary, group_by_tags, stats):
     """
     try:
         # Использование use case для получения списка эндпоинтов
-        endpoints_list = _list_use_case.execute(spec)
+        # (простому списку достаточно пар method/path без объектов Endpoint)
+        if summary or group_by_tags or stats:
+            endpoints_list = _list_use_case.execute(spec)
+        else:
+            endpoints_list = None
         
         # Вычисление и вывод статистики (если запрошена)
         stats_text = ""
@@ -149,58 +302,58 @@ def list_endpoints(spec, output, summary, group_by_tags, stats):
                 click.echo(stats_text)
             return
         
-        # Группировка по тегам (если опция включена)
-        if group_by_tags:
-            from collections import defaultdict
-            tags_dict = defaultdict(list)
-            
-            # Группируем эндпоинты по тегам
+        # Строка эндпоинта форматируется один раз (с учетом опции summary)
+        # и переиспользуется во всех группах тегов
+        if summary or group_by_tags:
+            formatted = []
+            formatted_append = formatted.append
             for e in endpoints_list:
-                # Форматирование эндпоинта с учетом опции summary
-                endpoint_str = f"{e.method} {e.path}"
-                if summary:
-                    endpoint_summary = e.operation.get('summary', '')
-                    if endpoint_summary:
-                        endpoint_str += f" - {endpoint_summary}"
-                
-                # Добавляем эндпоинт в каждую группу тегов
-                # Если у эндпоинта несколько тегов, он появится в каждой группе
-                if e.tags:
-                    for tag in e.tags:
-                        tags_dict[tag].append(endpoint_str)
+                # summary читается один раз, строка собирается одним f-string
+                if summary and (endpoint_summary := e.operation.get('summary')):
+                    endpoint_str = f"{e.method} {e.path} - {endpoint_summary}"
                 else:
-                    # Если тегов нет, добавляем в группу "Без тега"
-                    tags_dict['Без тега'].append(endpoint_str)
+                    endpoint_str = f"{e.method} {e.path}"
+                formatted_append(((e.method, e.path), endpoint_str, e.tags))
             
-            # Формируем вывод с группировкой
-            # Сортировка тегов и эндпоинтов внутри групп для читаемости
-            sorted_tags = sorted(tags_dict.keys())
-            output_lines = []
+            # Одна общая сортировка по ключу (method, path), а не по всей
+            # строке с summary; группировка сохраняет порядок,
+            # поэтому эндпоинты внутри групп уже отсортированы
+            formatted.sort(key=itemgetter(0))
+        
+        # Группировка по тегам (если опция включена)
+        if group_by_tags:
+            tags_dict = {}
             
-            for tag in sorted_tags:
-                output_lines.append(f"\n## {tag}")
-                endpoints_in_tag = sorted(tags_dict[tag])
-                output_lines.extend(endpoints_in_tag)
+            # Добавляем эндпоинт в каждую группу тегов
+            # Если у эндпоинта несколько тегов, он появится в каждой группе
+            # (все группы ссылаются на одну и ту же строку)
+            # Если тегов нет, он попадает в группу "Без тега"
+            get_bucket = tags_dict.get
+            for _, endpoint_str, tags in formatted:
+                for tag in tags or _NO_TAG:
+                    bucket = get_bucket(tag)
+                    if bucket is None:
+                        tags_dict[tag] = [endpoint_str]
+                    else:
+                        bucket.append(endpoint_str)
             
-            result_text = '\n'.join(output_lines)
+            # Формируем вывод с группировкой
+            # Сортировка тегов для читаемости
+            result_text = '\n'.join(
+                f"\n## {tag}\n" + '\n'.join(tags_dict[tag])
+                for tag in sorted(tags_dict)
+            )
             
         else:
             # Обычный список без группировки
             if summary:
-                # Форматирование с summary
-                endpoints = []
-                for e in endpoints_list:
-                    endpoint_str = f"{e.method} {e.path}"
-                    endpoint_summary = e.operation.get('summary', '')
-                    if endpoint_summary:
-                        endpoint_str += f" - {endpoint_summary}"
-                    endpoints.append(endpoint_str)
+                endpoints = [endpoint_str for _, endpoint_str, _ in formatted]
             else:
                 # Простое форматирование без summary
-                endpoints = [f"{e.method} {e.path}" for e in endpoints_list]
+                # Сортировка по парам (method, path) для удобства чтения
+                methods, paths = _list_use_case.list_keys(spec)
+                endpoints = [f"{m} {p}" for m, p in sorted(zip(methods, paths))]
             
-            # Сортировка для удобства чтения
-            endpoints.sort()
             result_text = '\n'.join(endpoints)
 
         # Сохранение или вывод результата
@@ -212,16 +365,18 @@ def list_endpoints(spec, output, summary, group_by_tags, stats):
                 f.write(content)
             click.echo(f"Отчёт сохранён в: {expanded_output}")
         else:
-            # Вывод в консоль
-            # Сначала статистика (если есть)
+            # Вывод в консоль одной записью
+            # Сначала статистика (если есть) и пустая строка после нее
+            parts = []
             if stats_text:
-                click.echo(stats_text)
-                click.echo()  # Пустая строка между статистикой и списком
+                parts.append(stats_text)
+                parts.append('')
             
             # Затем список (заголовок только для обычного списка)
             if not group_by_tags:
-                click.echo("\nСписок эндпоинтов:")
-            click.echo(result_text)
+                parts.append("\nСписок эндпоинтов:")
+            parts.append(result_text)
+            click.echo('\n'.join(parts))
             
     except Exception as e:
         click.echo(f"Ошибка: {str(e)}", err=True)
@@ -233,23 +388,41 @@ def list_endpoints(spec, output, summary, group_by_tags, stats):
 @click.option('--endpoints', '-e', help='Файл со списком эндпоинтов для фильтрации (опционально)')
 @click.option('--output', '-o', help='Файл для вывода документации (опционально)')
 @click.option('--all-schemas', is_flag=True, help='Включить все схемы, а не только используемые')
-def generate_markdown_command(spec, endpoints, output, all_schemas):
+@click.option('--workers', '-j', type=int, default=None, help='Количество процессов для рендеринга эндпоинтов (опционально)')
+def generate_markdown_command(spec, endpoints, output, all_schemas, workers):
     """Генерирует Markdown документацию из OpenAPI спецификации"""
     try:
-        # Использование use case для генерации документации
-        markdown = _generate_use_case.execute(
-            spec_source=spec,
-            endpoints_filter=endpoints,
-            include_all_schemas=all_schemas
-        )
-        
         # Вывод результата
         if output:
             expanded_output = os.path.expanduser(output)
-            with open(expanded_output, 'w', encoding='utf-8') as f:
-                f.write(markdown)
+            # Документ пишется по частям во временный файл, который заменяет
+            # целевой только после успешной генерации
+            tmp_output = f"{expanded_output}.{os.getpid()}.tmp"
+            try:
+                with open(tmp_output, 'w', encoding='utf-8', buffering=_OUTPUT_BUFFER_SIZE) as f:
+                    _generate_use_case.execute_to(
+                        f,
+                        spec_source=spec,
+                        endpoints_filter=endpoints,
+                        include_all_schemas=all_schemas,
+                        max_workers=workers
+                    )
+                os.replace(tmp_output, expanded_output)
+            except BaseException:
+                try:
+                    os.remove(tmp_output)
+                except OSError:
+                    pass
+                raise
             click.echo(f"✅ Документация успешно сохранена в {expanded_output}")
         else:
+            # Использование use case для генерации документации
+            markdown = _generate_use_case.execute(
+                spec_source=spec,
+                endpoints_filter=endpoints,
+                include_all_schemas=all_schemas,
+                max_workers=workers
+            )
             click.echo(markdown)
             
     except Exception as e:
@@ -263,7 +436,8 @@ def generate_markdown_command(spec, endpoints, output, all_schemas):
 @click.option('--path', '-p', help='Путь эндпоинта для проверки (опционально, если не указан - проверяются все)')
 @click.option('--method', help='HTTP метод (требуется вместе с --path)')
 @click.option('--output', '-o', help='Путь для сохранения отчёта (опционально)')
-def verify_documentation(spec, markdown, path, method, output):
+@click.option('--workers', '-j', type=int, default=None, help='Количество процессов для проверки всех эндпоинтов (опционально)')
+def verify_documentation(spec, markdown, path, method, output, workers):
     """
     Проверяет полноту информации в сгенерированной Markdown документации.
     
@@ -323,14 +497,14 @@ def verify_documentation(spec, markdown, path, method, output):
             # Сохранение отчёта
             if output:
                 expanded_output = os.path.expanduser(output)
-                with open(expanded_output, 'w', encoding='utf-8') as f:
-                    json.dump(result, f, indent=2, ensure_ascii=False)
+                _write_json(result, expanded_output)
                 click.echo(f"\n📄 Отчёт сохранён в: {expanded_output}")
         else:
             # Проверка всех эндпоинтов
             result = _verify_use_case.verify_all_endpoints(
                 spec_source=spec,
-                markdown_file=expanded_markdown
+                markdown_file=expanded_markdown,
+                max_workers=workers
             )
             
             # Форматированный вывод
@@ -360,8 +534,7 @@ def verify_documentation(spec, markdown, path, method, output):
             # Сохранение отчёта
             if output:
                 expanded_output = os.path.expanduser(output)
-                with open(expanded_output, 'w', encoding='utf-8') as f:
-                    json.dump(result, f, indent=2, ensure_ascii=False)
+                _write_json(result, expanded_output)
                 click.echo(f"\n📄 Отчёт сохранён в: {expanded_output}")
             
     except Exception as e:
@@ -373,7 +546,7 @@ def verify_documentation(spec, markdown, path, method, output):
 # Markdown конвертация команды
 # ============================================================================
 
-def convert_with_mammoth(md_content, output_path):
+def convert_with_mammoth(md_bytes, output_path):
     """Конвертация через Mammoth (чистый Python)"""
     try:
         import mammoth
@@ -382,13 +555,14 @@ def convert_with_mammoth(md_content, output_path):
 
     # Поддержка разных версий Mammoth
     if hasattr(mammoth, 'convert_to_docx'):
-        # Старая версия (<1.6.0)
-        result = mammoth.convert_to_docx(md_content)
+        # Старая версия (<1.6.0) принимает строку
+        result = mammoth.convert_to_docx(md_bytes.decode('utf-8'))
         docx_bytes = result.value
     else:
         # Новая версия (1.6.0+)
-        # Создаем байтовый поток из содержимого
-        file_obj = BytesIO(md_content.encode('utf-8'))
+        # Байтовый поток строится прямо из прочитанных байтов (io нужен только здесь)
+        from io import BytesIO
+        file_obj = BytesIO(md_bytes)
         result = mammoth.convert(file_obj)
         docx_bytes = result.value
 
@@ -442,8 +616,8 @@ def errors_report(spec, output, format):
         sys.exit(1)
 
 
-def convert_with_pandoc(md_content, output_path):
-    """Конвертация через Pandoc (требует установки pandoc)"""
+def convert_with_pandoc(input_path, output_path):
+    """Конвертация через Pandoc (требует установки pandoc); pandoc сам читает входной файл"""
     try:
         import pypandoc
     except ImportError:
@@ -473,8 +647,8 @@ def convert_with_pandoc(md_content, output_path):
             "--columns=10000",  # Широкие таблицы
         ])
     
-    pypandoc.convert_text(
-        md_content,
+    pypandoc.convert_file(
+        input_path,
         output_ext,
         format="gfm",  # GitHub Flavored Markdown для лучшей поддержки таблиц
         outputfile=actual_output_path,
@@ -515,15 +689,6 @@ def md2doc_command(input, output, engine):
         click.secho("Ошибка: выходной файл должен быть .docx, .doc или .rtf", fg='red')
         sys.exit(1)
 
-    # Чтение исходного файла
-    try:
-        with open(input, "r", encoding="utf-8") as f:
-            md_content = f.read()
-        click.secho(f"✓ Файл прочитан: {input}", fg='green')
-    except Exception as e:
-        click.secho(f"Ошибка чтения файла: {e}", fg='red')
-        sys.exit(1)
-
     # Выбор движка
     output_ext = os.path.splitext(output)[1].lower()
     
@@ -531,6 +696,17 @@ def md2doc_command(input, output, engine):
         engine = "pandoc" if output_ext == ".doc" else "mammoth"
         click.secho(f"Автовыбор движка: {engine}", fg='blue')
 
+    # Чтение исходного файла: Mammoth получает байты без декодирования,
+    # Pandoc читает файл сам
+    if engine == "mammoth":
+        try:
+            with open(input, "rb") as f:
+                md_bytes = f.read()
+            click.secho(f"✓ Файл прочитан: {input}", fg='green')
+        except Exception as e:
+            click.secho(f"Ошибка чтения файла: {e}", fg='red')
+            sys.exit(1)
+
     # Конвертация
     try:
         if engine == "mammoth":
@@ -538,19 +714,21 @@ def md2doc_command(input, output, engine):
                 click.secho("Ошибка: Mammoth поддерживает только DOCX", fg='red')
                 sys.exit(1)
                 
-            convert_with_mammoth(md_content, output)
+            convert_with_mammoth(md_bytes, output)
             click.secho(f"✓ Успешно! Конвертировано через Mammoth -> {output}", fg='green')
         
         elif engine == "pandoc":
-            actual_output = convert_with_pandoc(md_content, output)
+            actual_output = convert_with_pandoc(input, output)
             
             # Если указан .doc, но создан .rtf файл, переименовываем обратно в .doc
+            # (os.replace атомарно заменяет существующий файл и на Windows)
             if output_ext == ".doc" and actual_output != output:
-                if os.path.exists(actual_output):
-                    os.rename(actual_output, output)
-                    click.secho(f"✓ Успешно! Конвертировано через Pandoc -> {output}", fg='green')
-                else:
+                try:
+                    os.replace(actual_output, output)
+                except FileNotFoundError:
                     click.secho(f"✓ Успешно! Конвертировано через Pandoc -> {actual_output}", fg='green')
+                else:
+                    click.secho(f"✓ Успешно! Конвертировано через Pandoc -> {output}", fg='green')
             else:
                 click.secho(f"✓ Успешно! Конвертировано через Pandoc -> {output}", fg='green')
     
@@ -1,6 +1,42 @@
 """Value objects для доменной модели"""
 from dataclasses import dataclass
-from typing import Dict, List, Set, Tuple, Optional
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Tuple, Optional
+
+
+# HTTP метод -> общая строка метода в верхнем регистре. Эндпоинты с одним
+# методом ссылаются на один объект строки вместо отдельной копии от upper()
+_CANONICAL_METHODS: Dict[str, str] = {}
+for _method in ('GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'HEAD', 'OPTIONS', 'TRACE'):
+    _CANONICAL_METHODS[_method] = _CANONICAL_METHODS[_method.lower()] = _method
+del _method
+
+
+def _slots_getstate(self) -> Tuple:
+    """Возвращает состояние объекта со __slots__ для pickle/copy"""
+    return tuple(getattr(self, name) for name in self.__slots__)
+
+
+def _slots_setstate(self, state: Tuple):
+    """Восстанавливает состояние frozen-объекта со __slots__ для pickle/copy"""
+    for name, value in zip(self.__slots__, state):
+        object.__setattr__(self, name, value)
+
+
+def _readonly(section: Any) -> Any:
+    """
+    Оборачивает секцию спецификации в представление только для чтения.
+    
+    Представление не копирует словарь; значения других типов
+    (например, null в невалидной спецификации) возвращаются как есть.
+    
+    Args:
+        section: Секция спецификации
+        
+    Returns:
+        MappingProxyType для словаря, иначе исходное значение
+    """
+    return MappingProxyType(section) if type(section) is dict else section
 
 
 @dataclass(frozen=True)
@@ -14,16 +50,57 @@ class OpenAPISpec:
         schemas: Секция components/schemas из спецификации
         info: Секция info из спецификации
     """
+    # _paths_index - не поле dataclass, а лениво заполняемый слот
+    # (см. paths_normalized); в __eq__/__repr__ не участвует
+    __slots__ = ('raw', 'paths', 'schemas', 'info', '_paths_index')
+    
     raw: Dict
-    paths: Dict
-    schemas: Dict
-    info: Dict
+    paths: Mapping
+    schemas: Mapping
+    info: Mapping
+    
+    def __reduce__(self):
+        """Сериализует спецификацию через raw (секции восстанавливаются from_dict)"""
+        return (type(self).from_dict, (self.raw,))
+    
+    @property
+    def paths_normalized(self) -> Dict[str, Tuple[str, Mapping]]:
+        """
+        Индекс путей без trailing slash.
+        
+        Ключ - путь после rstrip('/'), значение - пара (путь в спецификации,
+        path item). Если в спецификации есть оба варианта ('/users' и
+        '/users/'), предпочитается путь без trailing slash. Индекс строится
+        один раз при первом обращении.
+        
+        Returns:
+            Словарь {нормализованный путь: (исходный путь, path item)}
+        """
+        try:
+            return self._paths_index
+        except AttributeError:
+            pass
+        
+        index: Dict[str, Tuple[str, Mapping]] = {}
+        for path, path_item in self.paths.items():
+            normalized = path.rstrip('/')
+            if path == normalized:
+                index[normalized] = (path, path_item)
+            elif path == normalized + '/':
+                index.setdefault(normalized, (path, path_item))
+        object.__setattr__(self, '_paths_index', index)
+        return index
     
     @classmethod
     def from_dict(cls, spec_dict: Dict) -> 'OpenAPISpec':
         """
         Создает OpenAPISpec из словаря OpenAPI спецификации.
         
+        Секции не копируются и не обходятся: атрибуты ссылаются на словари
+        внутри spec_dict, поэтому создание выполняется за O(1). paths, schemas
+        и info оборачиваются в MappingProxyType: это представления только
+        для чтения, и вызывающему коду не нужно защитно копировать секции.
+        
         Args:
             spec_dict: Словарь с OpenAPI спецификацией
             
@@ -32,9 +109,9 @@ class OpenAPISpec:
         """
         return cls(
             raw=spec_dict,
-            paths=spec_dict.get('paths', {}),
-            schemas=spec_dict.get('components', {}).get('schemas', {}),
-            info=spec_dict.get('info', {})
+            paths=_readonly(spec_dict.get('paths', {})),
+            schemas=_readonly(spec_dict.get('components', {}).get('schemas', {})),
+            info=_readonly(spec_dict.get('info', {}))
         )
 
 
@@ -49,6 +126,12 @@ class Endpoint:
         operation: Словарь с данными операции из спецификации
         tags: Список тегов операции
     """
+    # Эндпоинты создаются тысячами при обходе спецификации: __slots__
+    # убирает __dict__ у каждого экземпляра и ускоряет доступ к полям
+    __slots__ = ('path', 'method', 'operation', 'tags')
+    __getstate__ = _slots_getstate
+    __setstate__ = _slots_setstate
+    
     path: str
     method: str
     operation: Dict
@@ -56,7 +139,8 @@ class Endpoint:
     
     def __post_init__(self):
         """Нормализует метод к верхнему регистру"""
-        object.__setattr__(self, 'method', self.method.upper())
+        method = self.method
+        object.__setattr__(self, 'method', _CANONICAL_METHODS.get(method) or method.upper())
 
 
 @dataclass(frozen=True)
@@ -68,6 +152,10 @@ class Schema:
         name: Имя схемы
         definition: Определение схемы из спецификации
     """
+    __slots__ = ('name', 'definition')
+    __getstate__ = _slots_getstate
+    __setstate__ = _slots_setstate
+    
     name: str
     definition: Dict
 
@@ -78,14 +166,29 @@ class EndpointFilter:
     Value object для фильтрации эндпоинтов.
     
     Attributes:
-        endpoints: Множество кортежей (method, path) для фильтрации
+        endpoints: Неизменяемое множество кортежей (method, path) для фильтрации;
+            для каждого пути хранятся варианты без trailing slash и с ним
     """
-    endpoints: Set[Tuple[str, str]]
+    endpoints: FrozenSet[Tuple[str, str]]
+    
+    def __post_init__(self):
+        """Приводит endpoints к frozenset с обоими вариантами каждого пути"""
+        # matches вызывается для каждого метода каждого пути: вместо двух
+        # проверок или поиска в списке делается одна проверка по множеству
+        expanded = set()
+        for method, path in self.endpoints:
+            stripped_path = path.rstrip('/')
+            expanded.add((method, stripped_path))
+            expanded.add((method, stripped_path + '/'))
+        object.__setattr__(self, 'endpoints', frozenset(expanded))
     
     def matches(self, method: str, path: str) -> bool:
         """
         Проверяет, соответствует ли эндпоинт фильтру.
         
+        Оба варианта пути (с trailing slash и без) уже лежат в множестве,
+        поэтому достаточно одной проверки по нормализованному ключу.
+        
         Args:
             method: HTTP метод
             path: Путь эндпоинта
@@ -93,33 +196,36 @@ class EndpointFilter:
         Returns:
             True если эндпоинт соответствует фильтру, False иначе
         """
-        normalized_method = method.upper()
-        normalized_path = path.rstrip('/')
-        
-        # Проверяем точное совпадение
-        if (normalized_method, normalized_path) in self.endpoints:
-            return True
+        return (method.upper(), path.rstrip('/')) in self.endpoints
+    
+    def paths_by_method(self) -> Dict[str, FrozenSet[str]]:
+        """
+        Группирует пути фильтра по HTTP методу.
         
-        # Проверяем вариант с trailing slash
-        if (normalized_method, normalized_path + '/') in self.endpoints:
-            return True
+        Позволяет проверять путь без создания кортежа (method, path) и
+        пропускать методы, для которых в фильтре нет ни одного пути.
         
-        return False
+        Returns:
+            Словарь {METHOD: множество путей} с теми же вариантами путей, что в endpoints
+        """
+        by_method: Dict[str, List[str]] = {}
+        for method, path in self.endpoints:
+            by_method.setdefault(method, []).append(path)
+        return {method: frozenset(paths) for method, paths in by_method.items()}
     
     @classmethod
-    def from_set(cls, endpoints: Set[Tuple[str, str]]) -> 'EndpointFilter':
+    def from_set(cls, endpoints: Iterable[Tuple[str, str]]) -> 'EndpointFilter':
         """
         Создает EndpointFilter из множества кортежей.
         
         Args:
-            endpoints: Множество кортежей (method, path)
+            endpoints: Множество (или любая коллекция) кортежей (method, path)
             
         Returns:
             EndpointFilter instance
         """
-        # Нормализуем методы к верхнему регистру
-        normalized = {(method.upper(), path) for method, path in endpoints}
-        return cls(endpoints=normalized)
+        # Нормализуем методы к верхнему регистру; варианты пути добавит __post_init__
+        return cls(endpoints=frozenset((method.upper(), path) for method, path in endpoints))
     
     @classmethod
     def empty(cls) -> 'EndpointFilter':
@@ -129,4 +235,4 @@ class EndpointFilter:
         Returns:
             EndpointFilter с пустым множеством
         """
-        return cls(endpoints=set())
+        return cls(endpoints=frozenset())
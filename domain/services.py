@@ -1,8 +1,66 @@
 """Доменные сервисы"""
-from typing import Dict, List, Optional, Set
+from collections import OrderedDict
+from typing import AbstractSet, Any, ClassVar, Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
 from .models import OpenAPISpec, Endpoint
 
 
+# Стандартные HTTP методы операций OpenAPI (в верхнем регистре)
+HTTP_METHODS = frozenset({'GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'HEAD', 'OPTIONS'})
+
+# Ключ path item -> метод в верхнем регистре; покрывает обычные написания
+# ('get', 'GET'), остальные нормализуются через upper()
+_METHOD_UPPER: Dict[str, str] = {
+    **{m: m for m in HTTP_METHODS},
+    **{m.lower(): m for m in HTTP_METHODS},
+}
+
+
+# Маркер отсутствия записи в кеше резолвера
+_MISSING = object()
+
+# Запись кеша резолвера для неразрешенной ссылки; вызывающий код получает
+# вместо нее новый пустой словарь, общий изменяемый {} не раздается
+_NOT_FOUND = object()
+
+# Общие пустые значения по умолчанию для отсутствующих секций операции:
+# только читаются, поэтому одни объекты используются для всех вызовов
+_EMPTY: Dict = {}
+_NO_ITEMS: Tuple = ()
+
+# Теги эндпоинта без тегов; эндпоинту передается копия в виде списка
+_DEFAULT_TAGS = ('Без тега',)
+
+# Ключевые слова, значения которых - данные (примеры, перечисления, значения
+# по умолчанию), а не схемы: ссылки на схемы внутри них не ищутся. Так же
+# пропускаются расширения x-*
+_NO_SCHEMA_KEYS = frozenset({'example', 'examples', 'enum', 'default', 'const'})
+
+# Ключи, значения которых - словари с произвольными именами (свойства, коды
+# ответов, заголовки и т.д.). Имена в них не являются ключевыми словами:
+# свойство 'default' или заголовок 'x-request-id' обходятся как обычно
+_NAME_MAP_KEYS = frozenset({
+    'properties', 'patternProperties', 'definitions', '$defs', 'dependentSchemas',
+    'responses', 'content', 'headers', 'links', 'callbacks', 'encoding',
+    'schemas', 'parameters', 'requestBodies', 'securitySchemes', 'pathItems',
+    'paths', 'webhooks', 'variables',
+})
+
+# Виды обхода значения по ключу словаря (см. SchemaCollector._key_kind)
+_KEY_SCHEMA = object()
+_KEY_SKIP = object()
+_KEY_NAME_MAP = object()
+
+
+def _http_method_upper(method: str) -> Optional[str]:
+    """Нормализует ключ, не найденный в _METHOD_UPPER (например, 'Get').
+
+    Returns:
+        Метод в верхнем регистре или None для не-HTTP ключей
+    """
+    method_upper = method.upper()
+    return method_upper if method_upper in HTTP_METHODS else None
+
+
 class EndpointFinder:
     """
     Сервис для поиска эндпоинтов в OpenAPI спецификации.
@@ -23,6 +81,31 @@ class EndpointFinder:
         Returns:
             Endpoint если найден, None иначе
             
+        Raises:
+            ValueError: Если путь или метод не найдены
+        """
+        # Один поиск по индексу вместо двух попыток с trailing slash и без
+        endpoint_path, path_item = spec.paths_normalized.get(path.rstrip('/'), ('', None))
+        if not path_item:
+            raise ValueError(f"Путь '{path}' не найден в спецификации")
+        return EndpointFinder._endpoint_from_path_item(endpoint_path, path_item, method)
+    
+    @staticmethod
+    def find_in_paths(paths: Mapping[str, Dict], path: str, method: str) -> Optional[Endpoint]:
+        """
+        Находит эндпоинт по пути и методу в секции paths.
+        
+        Позволяет искать как в загруженной спецификации, так и в частично
+        разобранной секции paths (см. StreamingSpecLoader.load_path_items).
+        
+        Args:
+            paths: Секция paths или ее часть
+            path: Путь эндпоинта
+            method: HTTP метод
+            
+        Returns:
+            Endpoint если найден, None иначе
+            
         Raises:
             ValueError: Если путь или метод не найдены
         """
@@ -30,31 +113,51 @@ class EndpointFinder:
         endpoint_path = path.rstrip('/')
         
         # Поиск совпадения по URL
-        exact_match = spec.paths.get(endpoint_path)
+        exact_match = paths.get(endpoint_path)
         
         if not exact_match:
             # Попытка найти вариант с trailing slash
             alt_path = endpoint_path + '/'
-            exact_match = spec.paths.get(alt_path)
+            exact_match = paths.get(alt_path)
             if exact_match:
                 endpoint_path = alt_path
         
         if not exact_match:
             raise ValueError(f"Путь '{path}' не найден в спецификации")
         
+        return EndpointFinder._endpoint_from_path_item(endpoint_path, exact_match, method)
+    
+    @staticmethod
+    def _endpoint_from_path_item(endpoint_path: str, exact_match: Mapping, method: str) -> Endpoint:
+        """
+        Создает Endpoint для метода найденного path item.
+        
+        Args:
+            endpoint_path: Путь эндпоинта в спецификации
+            exact_match: Path item этого пути
+            method: HTTP метод
+            
+        Returns:
+            Endpoint
+            
+        Raises:
+            ValueError: Если метод не найден
+        """
         # Проверка метода
         method_lower = method.lower()
         endpoint_info = exact_match.get(method_lower)
         
         if not endpoint_info:
-            available_methods = [m.upper() for m in exact_match.keys() 
-                               if m.upper() in ['GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'HEAD', 'OPTIONS']]
+            available_methods = [m.upper() for m in exact_match.keys()
+                                 if m.upper() in HTTP_METHODS]
             raise ValueError(
                 f"Метод {method.upper()} не найден. Доступные методы: {', '.join(available_methods)}"
             )
         
         # Извлечение тегов
-        tags = endpoint_info.get('tags', ['Без тега'])
+        tags = endpoint_info.get('tags', _DEFAULT_TAGS)
+        if tags is _DEFAULT_TAGS:
+            tags = list(_DEFAULT_TAGS)
         
         return Endpoint(
             path=endpoint_path,
@@ -64,31 +167,105 @@ class EndpointFinder:
         )
     
     @staticmethod
-    def list_all(spec: OpenAPISpec) -> List[Endpoint]:
+    def list_all(
+        spec: OpenAPISpec,
+        filter_set: Optional[AbstractSet[Tuple[str, str]]] = None
+    ) -> List[Endpoint]:
         """
         Возвращает список всех эндпоинтов из спецификации.
         
         Args:
             spec: OpenAPI спецификация
+            filter_set: Множество кортежей (METHOD, path) с методом в верхнем
+                регистре; если указано, Endpoint создается только для них
             
         Returns:
             Список всех эндпоинтов
         """
-        endpoints = []
+        return list(EndpointFinder.iter_all(spec, filter_set))
+    
+    @staticmethod
+    def iter_all(
+        spec: OpenAPISpec,
+        filter_set: Optional[AbstractSet[Tuple[str, str]]] = None
+    ) -> Iterator[Endpoint]:
+        """
+        Последовательно создает эндпоинты спецификации.
+        
+        Подходит для однократного обхода: эндпоинты не накапливаются в списке.
         
-        for path, methods in spec.paths.items():
+        Args:
+            spec: OpenAPI спецификация
+            filter_set: Множество кортежей (METHOD, path) с методом в верхнем
+                регистре; если указано, Endpoint создается только для них
+            
+        Yields:
+            Endpoint для каждой операции в порядке секции paths
+        """
+        return EndpointFinder.iter_from_paths(spec.paths.items(), filter_set)
+    
+    @staticmethod
+    def iter_from_paths(
+        path_items: Iterable[Tuple[str, Dict]],
+        filter_set: Optional[AbstractSet[Tuple[str, str]]] = None
+    ) -> Iterator[Endpoint]:
+        """
+        Последовательно создает эндпоинты из пар (path, path_item).
+        
+        Позволяет получать эндпоинты как из загруженной спецификации,
+        так и из потокового парсера секции paths.
+        
+        Args:
+            path_items: Пары (путь, словарь методов) из секции paths
+            filter_set: Множество кортежей (METHOD, path) для фильтрации (опционально)
+            
+        Yields:
+            Endpoint для каждой операции со стандартным HTTP методом
+        """
+        for path, methods in path_items:
             for method, operation in methods.items():
                 # Фильтрация только стандартных HTTP методов
-                if method.upper() in ['GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'HEAD', 'OPTIONS']:
-                    tags = operation.get('tags', ['Без тега'])
-                    endpoints.append(Endpoint(
-                        path=path,
-                        method=method,
-                        operation=operation,
-                        tags=tags
-                    ))
-        
-        return endpoints
+                method_upper = _METHOD_UPPER.get(method) or _http_method_upper(method)
+                if method_upper is None:
+                    continue
+                if filter_set is not None and (method_upper, path) not in filter_set:
+                    continue
+                tags = operation.get('tags', _DEFAULT_TAGS)
+                if tags is _DEFAULT_TAGS:
+                    # Endpoint.tags - список; копия создается только для операций без тегов
+                    tags = list(_DEFAULT_TAGS)
+                yield Endpoint(
+                    path=path,
+                    method=method,
+                    operation=operation,
+                    tags=tags
+                )
+    
+    @staticmethod
+    def list_keys(spec: OpenAPISpec) -> Tuple[List[str], List[str]]:
+        """
+        Возвращает методы и пути всех эндпоинтов в виде двух параллельных списков.
+        
+        В отличие от list_all не создает объекты Endpoint; подходит для
+        случаев, когда нужны только пары (method, path).
+        
+        Args:
+            spec: OpenAPI спецификация
+            
+        Returns:
+            Кортеж (методы в верхнем регистре, пути) одинаковой длины
+        """
+        methods = []
+        paths = []
+        
+        for path, path_methods in spec.paths.items():
+            for method in path_methods:
+                method_upper = _METHOD_UPPER.get(method) or _http_method_upper(method)
+                if method_upper is not None:
+                    methods.append(method_upper)
+                    paths.append(path)
+        
+        return methods, paths
 
 
 class SchemaResolver:
@@ -98,6 +275,43 @@ class SchemaResolver:
     Мигрировано из utils.py (resolve_ref, process_schema).
     """
     
+    # Максимальное число разрешенных ссылок в кеше резолвера
+    CACHE_SIZE: ClassVar[int] = 4096
+    
+    # Сколько резолверов хранит for_spec (по одному на спецификацию)
+    SHARED_CACHE_SIZE: ClassVar[int] = 8
+    _shared: ClassVar['OrderedDict[int, SchemaResolver]'] = OrderedDict()
+    
+    @classmethod
+    def for_spec(cls, spec: OpenAPISpec) -> 'SchemaResolver':
+        """
+        Возвращает общий резолвер для спецификации, переиспользуя его кеши.
+        
+        Загрузчик возвращает тот же объект OpenAPISpec для неизмененного
+        файла, поэтому резолверы различаются по идентичности спецификации.
+        Резолвер держит ссылку на спецификацию, так что ее id не может быть
+        переиспользован, пока резолвер в кеше. Хранятся последние
+        SHARED_CACHE_SIZE резолверов.
+        
+        Args:
+            spec: OpenAPI спецификация
+            
+        Returns:
+            SchemaResolver для этой спецификации
+        """
+        shared = cls._shared
+        key = id(spec)
+        resolver = shared.get(key)
+        if resolver is not None and resolver.spec is spec:
+            shared.move_to_end(key)
+            return resolver
+        
+        resolver = cls(spec)
+        shared[key] = resolver
+        if len(shared) > cls.SHARED_CACHE_SIZE:
+            shared.popitem(last=False)
+        return resolver
+    
     def __init__(self, spec: OpenAPISpec):
         """
         Инициализирует резолвер схем.
@@ -106,7 +320,39 @@ class SchemaResolver:
             spec: OpenAPI спецификация
         """
         self.spec = spec
-        self._cache: Dict[str, Dict] = {}
+        # Ограниченный LRU-кеш разрешенных ссылок (см. CACHE_SIZE)
+        self._cache: 'OrderedDict[str, Any]' = OrderedDict()
+        # Секция components/parameters извлекается один раз
+        self._parameters = spec.raw.get('components', _EMPTY).get('parameters', _EMPTY)
+        # Полная ссылка на схему -> имя схемы (строится при первом обращении)
+        self._schema_ref_names: Optional[Dict[str, str]] = None
+        # Результаты process_schema для узлов вида {"$ref": ...} по (ссылке, глубине)
+        self._processed_refs: Dict[Tuple[str, int], Dict] = {}
+    
+    @property
+    def schema_ref_names(self) -> Dict[str, str]:
+        """
+        Словарь {"#/components/schemas/Name": "Name"} для всех схем спецификации.
+        
+        Позволяет одним поиском проверить, что ссылка указывает на схему
+        из components/schemas, и получить ее имя без разбора строки.
+        """
+        if self._schema_ref_names is None:
+            prefix = '#/components/schemas/'
+            self._schema_ref_names = {prefix + name: name for name in self.spec.schemas}
+        return self._schema_ref_names
+    
+    def resolve_schema_name(self, ref: str) -> Optional[str]:
+        """
+        Возвращает имя схемы, на которую указывает ссылка.
+        
+        Args:
+            ref: Ссылка вида "#/components/schemas/User"
+            
+        Returns:
+            Имя схемы или None, если ссылка не указывает на схему из components/schemas
+        """
+        return self.schema_ref_names.get(ref)
     
     def resolve(self, ref: str, depth: int = 0) -> Optional[Dict]:
         """
@@ -118,34 +364,52 @@ class SchemaResolver:
             depth: Глубина рекурсии (для защиты от бесконечной рекурсии)
             
         Returns:
-            Разрешенная схема или None
+            Разрешенная схема или None; для неразрешенной ссылки - новый
+            пустой словарь
         """
         if depth > 10:
             return {}
         
-        # Проверка кеша
-        if ref in self._cache:
-            return self._cache[ref]
+        # Проверка кеша: один поиск, в кеше лежат ссылки на словари
+        # спецификации (без копирования) или _NOT_FOUND для неразрешенных ссылок
+        cache = self._cache
+        cached = cache.get(ref, _MISSING)
+        if cached is _MISSING:
+            cached = self._resolve_uncached(ref, depth)
+            cache[ref] = cached
+            if len(cache) > self.CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(ref)
+        
+        return {} if cached is _NOT_FOUND else cached
+    
+    def _resolve_uncached(self, ref: str, depth: int):
+        """
+        Разрешает ссылку без обращения к кешу.
         
+        Args:
+            ref: Ссылка
+            depth: Глубина рекурсии
+            
+        Returns:
+            Значение из спецификации или _NOT_FOUND
+        """
         # Обработка параметров
         if ref.startswith('#/components/parameters/'):
-            param_name = ref.split('/')[-1]
-            resolved = self.spec.raw.get('components', {}).get('parameters', {}).get(param_name, {})
-            self._cache[ref] = resolved
-            return resolved
+            return self._parameters.get(ref.rpartition('/')[2], _NOT_FOUND)
         
         # Обработка схем
         if ref.startswith('#/components/schemas/'):
-            schema_name = ref.split('/')[-1]
-            schema = self.spec.schemas.get(schema_name, {})
+            schema = self.spec.schemas.get(ref.rpartition('/')[2], _NOT_FOUND)
             
-            # Рекурсивно разрешаем вложенные ссылки
-            if isinstance(schema, dict) and '$ref' in schema:
-                resolved = self.resolve(schema['$ref'], depth + 1)
-                self._cache[ref] = resolved
-                return resolved
+            # Рекурсивно разрешаем вложенные ссылки; результат берется из кеша,
+            # чтобы неразрешенная цель осталась _NOT_FOUND, а не пустым словарем
+            if type(schema) is dict and '$ref' in schema:
+                target = schema['$ref']
+                self.resolve(target, depth + 1)
+                return self._cache.get(target, _NOT_FOUND)
             
-            self._cache[ref] = schema
             return schema
         
         # Обработка других типов ссылок
@@ -158,17 +422,18 @@ class SchemaResolver:
                 else:
                     break
             if current != self.spec.raw:
-                self._cache[ref] = current if isinstance(current, dict) else {}
-                return current if isinstance(current, dict) else {}
+                return current if isinstance(current, dict) else _NOT_FOUND
         
-        self._cache[ref] = {}
-        return {}
+        return _NOT_FOUND
     
     def process_schema(self, node: Dict, depth: int = 0) -> Dict:
         """
         Рекурсивно обрабатывает схему данных, включая разрешение ссылок
         и обработку вложенных структур с защитой от глубокой рекурсии.
         
+        Узлы без ссылок возвращаются без копирования, поэтому результат
+        может разделять словари со спецификацией и не должен изменяться.
+        
         Args:
             node: Узел схемы для обработки
             depth: Глубина рекурсии
@@ -179,31 +444,120 @@ class SchemaResolver:
         if depth > 10:
             return node
         
-        if isinstance(node, dict):
+        # Спецификация - результат JSON-парсера, подклассов dict/list в ней нет,
+        # поэтому тип узла проверяется сравнением type() вместо isinstance
+        node_type = type(node)
+        if node_type is dict:
             # Обработка ссылок
             if '$ref' in node:
-                resolved = self.resolve(node['$ref'])
+                ref = node['$ref']
+                
+                # Узел из одной ссылки обрабатывается один раз для каждой глубины:
+                # одни и те же схемы встречаются во многих эндпоинтах
+                if len(node) == 1 and type(ref) is str:
+                    key = (ref, depth)
+                    processed_ref = self._processed_refs.get(key)
+                    if processed_ref is None:
+                        processed_ref = self._process_ref_node(node, depth)
+                        self._processed_refs[key] = processed_ref
+                    return processed_ref
+                
+                resolved = self.resolve(ref)
                 if resolved:
                     # Сохраняем другие свойства вместе с разрешенной ссылкой
-                    new_node = {**resolved, **{k: v for k, v in node.items() if k != '$ref'}}
+                    new_node = dict(resolved)
+                    new_node.update((k, v) for k, v in node.items() if k != '$ref')
                     # Сохраняем оригинальную ссылку
-                    new_node['x-original-ref'] = node['$ref']
-                    return self.process_schema(new_node, depth + 1)
+                    new_node['x-original-ref'] = ref
+                    return self._process_owned(new_node, depth + 1)
             
-            # Рекурсивная обработка вложенных элементов
-            processed = {}
+            # Рекурсивная обработка вложенных элементов. Копия узла создается
+            # только если изменился хотя бы один дочерний элемент, иначе
+            # возвращается исходный словарь спецификации
+            process = self.process_schema
+            child_depth = depth + 1
+            processed = None
             for key, value in node.items():
-                processed[key] = self.process_schema(value, depth + 1) if isinstance(value, (dict, list)) else value
-            return processed
+                value_type = type(value)
+                if value_type is dict or value_type is list:
+                    new_value = process(value, child_depth)
+                    if new_value is not value:
+                        if processed is None:
+                            processed = dict(node)
+                        processed[key] = new_value
+            return node if processed is None else processed
+        
+        elif node_type is list:
+            process = self.process_schema
+            child_depth = depth + 1
+            processed_items = None
+            for index, item in enumerate(node):
+                item_type = type(item)
+                if item_type is dict or item_type is list:
+                    new_item = process(item, child_depth)
+                    if new_item is not item:
+                        if processed_items is None:
+                            processed_items = list(node)
+                        processed_items[index] = new_item
+            return node if processed_items is None else processed_items
+        
+        return node
+    
+    def _process_ref_node(self, node: Dict, depth: int) -> Dict:
+        """
+        Обрабатывает узел вида {"$ref": ...} без обращения к кешу.
+        
+        Args:
+            node: Узел схемы, содержащий только ссылку
+            depth: Глубина рекурсии
+            
+        Returns:
+            Обработанная схема
+        """
+        ref = node['$ref']
+        resolved = self.resolve(ref)
+        if resolved:
+            new_node = dict(resolved)
+            # Сохраняем оригинальную ссылку
+            new_node['x-original-ref'] = ref
+            return self._process_owned(new_node, depth + 1)
         
-        elif isinstance(node, list):
-            return [self.process_schema(item, depth + 1) if isinstance(item, (dict, list)) else item for item in node]
+        # Неразрешенная ссылка остается как есть
+        return node
+    
+    def _process_owned(self, node: Dict, depth: int) -> Dict:
+        """
+        Обрабатывает словарь, созданный самим резолвером при раскрытии ссылки.
+        
+        Такой словарь еще никому не передан, поэтому обработанные дочерние
+        элементы записываются в него на месте, без второй копии узла.
         
+        Args:
+            node: Новый словарь (копия разрешенной схемы)
+            depth: Глубина рекурсии
+            
+        Returns:
+            Обработанная схема
+        """
+        if depth > 10 or '$ref' in node:
+            return self.process_schema(node, depth)
+        
+        process = self.process_schema
+        child_depth = depth + 1
+        for key, value in node.items():
+            value_type = type(value)
+            if value_type is dict or value_type is list:
+                new_value = process(value, child_depth)
+                if new_value is not value:
+                    # Замена значения существующего ключа не меняет размер
+                    # словаря и допустима во время итерации
+                    node[key] = new_value
         return node
     
     def clear_cache(self):
         """Очищает кеш резолвера"""
         self._cache.clear()
+        self._processed_refs.clear()
 
 
 class SchemaCollector:
@@ -223,6 +577,14 @@ class SchemaCollector:
         """
         self.spec = spec
         self.resolver = resolver
+        # Результаты collect_from_endpoint по id операции: операции - словари
+        # внутри спецификации, которую держит коллектор, поэтому id стабильны
+        self._operation_schemas: Dict[int, FrozenSet[str]] = {}
+        # Имена схем, на которые напрямую ссылается тело схемы
+        self._schema_refs: Dict[str, Tuple[str, ...]] = {}
+        # Вид обхода значения по ключу словаря (см. _key_kind); ключей
+        # в спецификации немного, поэтому каждый классифицируется один раз
+        self._key_kinds: Dict[Any, object] = {}
     
     def collect_from_endpoint(self, endpoint: Endpoint) -> Set[str]:
         """
@@ -234,72 +596,272 @@ class SchemaCollector:
         Returns:
             Множество имен используемых схем
         """
+        operation = endpoint.operation
+        cached = self._operation_schemas.get(id(operation))
+        if cached is not None:
+            return set(cached)
+        
+        # Параметры, тело запроса и ответы обходятся одним общим стеком
+        roots: List = []
+        self._add_operation_roots(operation, roots)
+        
         collected: Set[str] = set()
+        self._collect_from_nodes(roots, collected)
+        self._operation_schemas[id(operation)] = frozenset(collected)
+        return collected
+    
+    def collect_from_operations(self, operations: Iterable[Dict]) -> Set[str]:
+        """
+        Собирает схемы, используемые хотя бы одной из операций.
+        
+        Все операции просматриваются одним обходом, и граф ссылок между
+        схемами замыкается один раз для их объединения, а не отдельно
+        для каждой операции.
         
-        # Собираем схемы из параметров
-        for param in endpoint.operation.get('parameters', []):
-            self._collect_from_node(param, collected)
+        Args:
+            operations: Словари операций из спецификации
+            
+        Returns:
+            Множество имен используемых схем
+        """
+        roots: List = []
+        for operation in operations:
+            self._add_operation_roots(operation, roots)
+        
+        collected: Set[str] = set()
+        self._collect_from_nodes(roots, collected)
+        return collected
+    
+    def scan_operation(self, operation: Dict) -> List[str]:
+        """
+        Находит прямые ссылки на схемы в параметрах, теле запроса и ответах операции.
         
-        # Собираем схемы из тела запроса
-        if 'requestBody' in endpoint.operation:
-            self._collect_from_node(endpoint.operation['requestBody'], collected)
+        Ссылки внутри найденных схем не разворачиваются: имена из нескольких
+        операций можно накопить и замкнуть один раз через collect_from_names.
         
-        # Собираем схемы из ответов
-        for response in endpoint.operation.get('responses', {}).values():
-            self._collect_from_node(response, collected)
+        Args:
+            operation: Словарь операции из спецификации
+            
+        Returns:
+            Список имен схем (с повторами, в порядке документа)
+        """
+        roots: List = []
+        self._add_operation_roots(operation, roots)
+        return self._scan_refs(roots)
+    
+    def collect_from_names(self, schema_names: List[str]) -> Set[str]:
+        """
+        Собирает схемы, достижимые из указанных имен по ссылкам между схемами.
         
+        Args:
+            schema_names: Имена схем (список используется как стек и изменяется)
+            
+        Returns:
+            Множество имен используемых схем
+        """
+        collected: Set[str] = set()
+        self._close_names(schema_names, collected)
         return collected
     
+    @staticmethod
+    def _add_operation_roots(operation: Dict, roots: List):
+        """Добавляет в roots параметры, тело запроса и ответы операции"""
+        roots.extend(operation.get('parameters', _NO_ITEMS))
+        if 'requestBody' in operation:
+            roots.append(operation['requestBody'])
+        roots.extend(operation.get('responses', _EMPTY).values())
+    
     def _collect_from_node(self, node, collected: Set[str]):
         """
-        Рекурсивно собирает схемы из узла спецификации.
+        Собирает схемы из узла спецификации.
         
         Args:
             node: Узел для анализа
             collected: Множество для сбора имен схем
         """
-        if isinstance(node, dict):
-            # Обработка ссылок
-            if '$ref' in node:
-                ref = node['$ref']
-                if ref.startswith('#/components/schemas/'):
-                    schema_name = ref.split('/')[-1]
-                    if schema_name not in collected:
-                        collected.add(schema_name)
-                        # Рекурсивно обрабатываем саму схему
-                        try:
-                            schema_node = self.resolver.resolve(ref)
-                            if schema_node:
-                                self._collect_from_node(schema_node, collected)
-                        except Exception:
-                            pass  # Игнорируем ошибки разрешения ссылок
+        self._collect_from_nodes([node], collected)
+    
+    def _collect_from_nodes(self, nodes: List, collected: Set[str]):
+        """
+        Собирает схемы из нескольких узлов спецификации.
+        
+        Узлы просматриваются один раз, дальше обход идет по графу имен схем:
+        прямые ссылки каждой схемы вычисляются один раз на коллектор
+        (см. _refs_of_schema), поэтому тела общих схем не обходятся заново
+        для каждого эндпоинта. Циклические ссылки обрываются проверкой
+        по уже собранным именам.
+        
+        Args:
+            nodes: Узлы для анализа (список используется как стек и изменяется)
+            collected: Множество для сбора имен схем
+        """
+        self._close_names(self._scan_refs(nodes), collected)
+    
+    def _close_names(self, pending: List[str], collected: Set[str]):
+        """
+        Добавляет в collected имена из pending и все схемы, достижимые из них.
+        
+        Args:
+            pending: Имена схем (список используется как стек и изменяется)
+            collected: Множество для сбора имен схем
+        """
+        pending_pop = pending.pop
+        pending_extend = pending.extend
+        refs_of_schema = self._refs_of_schema
+        
+        while pending:
+            schema_name = pending_pop()
+            if schema_name not in collected:
+                collected.add(schema_name)
+                pending_extend(refs_of_schema(schema_name))
+    
+    def collect_ordered(self, nodes: List) -> List[str]:
+        """
+        Возвращает имена схем, достижимых из узлов, в порядке обхода в глубину.
+        
+        Порядок совпадает с раскрытием каждой ссылки по месту: схема идет
+        сразу после первой ссылки на нее, перед схемами из следующих
+        ссылок. Обход идет по графу имен с кешем прямых ссылок
+        (см. _refs_of_schema), тела схем повторно не просматриваются.
+        
+        Args:
+            nodes: Узлы для анализа (список используется как стек и изменяется)
             
-            # Обработка комбинаторов схем
-            for key in ['allOf', 'anyOf', 'oneOf']:
-                if key in node:
-                    for item in node[key]:
-                        self._collect_from_node(item, collected)
+        Returns:
+            Список имен схем без повторов
+        """
+        refs_of_schema = self._refs_of_schema
+        visited: Set[str] = set()
+        ordered: List[str] = []
+        # Стек итераторов по спискам ссылок вместо рекурсии
+        stack = [iter(self._scan_refs(nodes))]
+        
+        while stack:
+            for schema_name in stack[-1]:
+                if schema_name not in visited:
+                    visited.add(schema_name)
+                    ordered.append(schema_name)
+                    stack.append(iter(refs_of_schema(schema_name)))
+                    break
+            else:
+                stack.pop()
+        
+        return ordered
+    
+    def _refs_of_schema(self, schema_name: str) -> Tuple[str, ...]:
+        """
+        Возвращает имена схем, на которые ссылается тело схемы.
+        
+        Тело берется через резолвер (с переходом по цепочке ссылок), как
+        и при обходе; ссылки внутри тела не разворачиваются.
+        
+        Args:
+            schema_name: Имя схемы из components/schemas
             
-            # Обработка свойств объектов
-            if 'properties' in node:
-                for prop in node['properties'].values():
-                    self._collect_from_node(prop, collected)
+        Returns:
+            Кортеж имен схем (с повторами, в порядке документа)
+        """
+        refs = self._schema_refs.get(schema_name)
+        if refs is None:
+            try:
+                schema_node = self.resolver.resolve('#/components/schemas/' + schema_name)
+            except Exception:
+                schema_node = None  # Игнорируем ошибки разрешения ссылок
+            refs = tuple(self._scan_refs([schema_node])) if schema_node else ()
+            self._schema_refs[schema_name] = refs
+        return refs
+    
+    def _key_kind(self, key) -> object:
+        """
+        Определяет и запоминает, как обходить значение ключа словаря.
+        
+        Args:
+            key: Ключ словаря спецификации
             
-            # Обработка элементов массивов
-            if 'items' in node:
-                self._collect_from_node(node['items'], collected)
+        Returns:
+            _KEY_SKIP, _KEY_NAME_MAP или _KEY_SCHEMA
+        """
+        if key in _NO_SCHEMA_KEYS or (type(key) is str and key.startswith('x-')):
+            kind = _KEY_SKIP
+        elif key in _NAME_MAP_KEYS:
+            kind = _KEY_NAME_MAP
+        else:
+            kind = _KEY_SCHEMA
+        self._key_kinds[key] = kind
+        return kind
+    
+    def _scan_refs(self, nodes: List) -> List[str]:
+        """
+        Находит ссылки на схемы из components/schemas внутри узлов.
+        
+        Обход выполняется с явным стеком, поэтому глубоко вложенные схемы
+        не упираются в лимит рекурсии Python. По ссылкам обход не переходит.
+        Дочерние узлы кладутся в стек в обратном порядке, поэтому ссылки
+        возвращаются в порядке документа (ссылка узла - раньше вложенных).
+        Контейнер, уже просмотренный в этом обходе (общий объект или цикл
+        в словаре, собранном вручную), повторно не обходится. Значения
+        ключевых слов-данных (example, enum, default, x-* и т.п., см.
+        _NO_SCHEMA_KEYS) пропускаются, кроме словарей имен вроде properties
+        или responses, где такие ключи - имена свойств или кодов.
+        
+        Args:
+            nodes: Узлы для анализа (список используется как стек и изменяется)
             
-            # Обработка additionalProperties
-            if 'additionalProperties' in node and isinstance(node['additionalProperties'], dict):
-                self._collect_from_node(node['additionalProperties'], collected)
+        Returns:
+            Список имен схем
+        """
+        get_schema_name = self.resolver.schema_ref_names.get
+        names: List[str] = []
+        names_append = names.append
+        stack = nodes
+        stack.reverse()
+        stack_pop = stack.pop
+        stack_push = stack.append
+        seen_ids: Set[int] = set()
+        seen_add = seen_ids.add
+        get_key_kind = self._key_kinds.get
+        key_kind = self._key_kind
+        
+        while stack:
+            node = stack_pop()
+            node_id = id(node)
+            if node_id in seen_ids:
+                continue
+            seen_add(node_id)
+            node_type = type(node)
             
-            # Рекурсивный обход
-            for key, value in node.items():
-                # Пропускаем уже обработанные ключи
-                if key in ['$ref', 'allOf', 'anyOf', 'oneOf', 'properties', 'items', 'additionalProperties']:
-                    continue
-                self._collect_from_node(value, collected)
+            # В стек попадают только контейнеры: скаляры не требуют обработки
+            if node_type is dict:
+                # Обработка ссылок (только на схемы из components/schemas)
+                ref = node.get('$ref')
+                if type(ref) is str:
+                    schema_name = get_schema_name(ref)
+                    if schema_name is not None:
+                        names_append(schema_name)
+                
+                # Комбинаторы, properties, items, additionalProperties
+                # и прочие ключи-схемы обходятся одинаково
+                for key, child in reversed(node.items()):
+                    child_type = type(child)
+                    if child_type is dict or child_type is list:
+                        kind = get_key_kind(key)
+                        if kind is None:
+                            kind = key_kind(key)
+                        if kind is _KEY_SKIP:
+                            continue
+                        if kind is _KEY_NAME_MAP and child_type is dict:
+                            # Ключи словаря имен - не ключевые слова: его
+                            # значения кладутся в стек без фильтрации
+                            for item in reversed(child.values()):
+                                item_type = type(item)
+                                if item_type is dict or item_type is list:
+                                    stack_push(item)
+                        else:
+                            stack_push(child)
+            elif node_type is list:
+                for child in reversed(node):
+                    child_type = type(child)
+                    if child_type is dict or child_type is list:
+                        stack_push(child)
         
-        elif isinstance(node, list):
-            for item in node:
-                self._collect_from_node(item, collected)
+        return names
@@ -1,6 +1,6 @@
 """Порт для загрузки фильтра эндпоинтов"""
 from abc import ABC, abstractmethod
-from typing import Set, Tuple
+from typing import AbstractSet, Tuple
 
 
 class EndpointsFilterLoader(ABC):
@@ -11,7 +11,7 @@ class EndpointsFilterLoader(ABC):
     """
     
     @abstractmethod
-    def load(self, source: str) -> Set[Tuple[str, str]]:
+    def load(self, source: str) -> AbstractSet[Tuple[str, str]]:
         """
         Загружает фильтр эндпоинтов из источника.
         
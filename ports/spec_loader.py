@@ -1,6 +1,7 @@
 """Порт для загрузки OpenAPI спецификаций"""
 from abc import ABC, abstractmethod
-from domain.models import OpenAPISpec
+from typing import AbstractSet, Dict, Iterator
+from domain.models import OpenAPISpec, Endpoint
 
 
 class SpecLoader(ABC):
@@ -30,3 +31,51 @@ class SpecLoader(ABC):
         """
         pass
 
+
+class StreamingSpecLoader(SpecLoader):
+    """
+    Порт загрузчика, умеющего отдавать эндпоинты потоком.
+    
+    Use cases, которым нужны только эндпоинты (без схем и прочих секций),
+    используют iter_endpoints, чтобы не держать в памяти всю спецификацию.
+    """
+    
+    @abstractmethod
+    def iter_endpoints(self, source: str) -> Iterator[Endpoint]:
+        """
+        Последовательно возвращает эндпоинты спецификации.
+        
+        Args:
+            source: Путь к источнику спецификации (файл, URL и т.д.)
+            
+        Returns:
+            Итератор эндпоинтов в порядке секции paths
+            
+        Raises:
+            FileNotFoundError: Если источник не найден
+            ValueError: Если спецификация невалидна
+            IOError: Если произошла ошибка при чтении
+        """
+        pass
+    
+    def load_path_items(self, source: str, paths: AbstractSet[str]) -> Dict[str, Dict]:
+        """
+        Возвращает элементы секции paths только для указанных путей.
+        
+        Реализация по умолчанию загружает всю спецификацию; адаптеры могут
+        переопределить метод, чтобы разбирать только нужные элементы.
+        
+        Args:
+            source: Путь к источнику спецификации (файл, URL и т.д.)
+            paths: Множество искомых путей
+            
+        Returns:
+            Словарь {путь: словарь методов} для найденных путей
+            
+        Raises:
+            FileNotFoundError: Если источник не найден
+            ValueError: Если спецификация невалидна
+            IOError: Если произошла ошибка при чтении
+        """
+        spec_paths = self.load(source).paths
+        return {path: spec_paths[path] for path in paths if path in spec_paths}
@@ -1,10 +1,38 @@
 """Форматтер для отчета по кодам ошибок эндпоинтов"""
-from typing import List, Dict
+from typing import List, Dict, Tuple
 
 
 class ErrorsReportFormatter:
     """Форматтер для генерации отчета по кодам ошибок эндпоинтов"""
     
+    @staticmethod
+    def _split(report_data: List[Dict[str, any]]) -> Tuple[List[Dict[str, any]], List[Dict[str, any]], int, List[str]]:
+        """
+        Разделяет эндпоинты по наличию ошибок и считает статистику за один проход.
+        
+        Args:
+            report_data: Список словарей с информацией об эндпоинтах
+        
+        Returns:
+            Кортеж (эндпоинты с ошибками, эндпоинты без ошибок,
+            всего кодов ошибок, отсортированные уникальные коды)
+        """
+        endpoints_with_errors = []
+        endpoints_without_errors = []
+        total_error_codes = 0
+        unique_error_codes = set()
+        
+        for item in report_data:
+            error_codes = item['error_codes']
+            if error_codes:
+                endpoints_with_errors.append(item)
+                total_error_codes += len(error_codes)
+                unique_error_codes.update(error_codes)
+            else:
+                endpoints_without_errors.append(item)
+        
+        return endpoints_with_errors, endpoints_without_errors, total_error_codes, sorted(unique_error_codes)
+    
     @staticmethod
     def format(report_data: List[Dict[str, any]]) -> str:
         """
@@ -27,54 +55,46 @@ class ErrorsReportFormatter:
         if not report_data:
             return "Эндпоинты не найдены."
         
-        lines = []
-        lines.append("Отчет по кодам ошибок эндпоинтов")
-        lines.append("=" * 60)
-        lines.append("")
+        lines = [
+            "Отчет по кодам ошибок эндпоинтов",
+            "=" * 60,
+            "",
+        ]
         
         # Группируем по наличию ошибок
-        endpoints_with_errors = []
-        endpoints_without_errors = []
-        
-        for item in report_data:
-            if item['error_codes']:
-                endpoints_with_errors.append(item)
-            else:
-                endpoints_without_errors.append(item)
+        endpoints_with_errors, endpoints_without_errors, total_error_codes, unique_error_codes = (
+            ErrorsReportFormatter._split(report_data)
+        )
         
         # Выводим эндпоинты с ошибками
         if endpoints_with_errors:
             lines.append(f"Эндпоинты с кодами ошибок ({len(endpoints_with_errors)}):")
             lines.append("-" * 60)
-            for item in endpoints_with_errors:
-                error_codes_str = ", ".join(item['error_codes'])
-                lines.append(f"{item['method']:6} {item['path']:40} [{error_codes_str}]")
+            lines.extend(
+                f"{item['method']:6} {item['path']:40} [{', '.join(item['error_codes'])}]"
+                for item in endpoints_with_errors
+            )
             lines.append("")
         
         # Выводим эндпоинты без ошибок (если есть)
         if endpoints_without_errors:
             lines.append(f"Эндпоинты без кодов ошибок ({len(endpoints_without_errors)}):")
             lines.append("-" * 60)
-            for item in endpoints_without_errors:
-                lines.append(f"{item['method']:6} {item['path']}")
+            lines.extend(f"{item['method']:6} {item['path']}" for item in endpoints_without_errors)
             lines.append("")
         
         # Итоговая статистика
-        total_endpoints = len(report_data)
-        total_error_codes = sum(len(item['error_codes']) for item in report_data)
-        unique_error_codes = set()
-        for item in report_data:
-            unique_error_codes.update(item['error_codes'])
-        
-        lines.append("Статистика:")
-        lines.append("-" * 60)
-        lines.append(f"Всего эндпоинтов: {total_endpoints}")
-        lines.append(f"Эндпоинтов с ошибками: {len(endpoints_with_errors)}")
-        lines.append(f"Эндпоинтов без ошибок: {len(endpoints_without_errors)}")
-        lines.append(f"Всего кодов ошибок: {total_error_codes}")
-        lines.append(f"Уникальных кодов ошибок: {len(unique_error_codes)}")
+        lines.extend((
+            "Статистика:",
+            "-" * 60,
+            f"Всего эндпоинтов: {len(report_data)}",
+            f"Эндпоинтов с ошибками: {len(endpoints_with_errors)}",
+            f"Эндпоинтов без ошибок: {len(endpoints_without_errors)}",
+            f"Всего кодов ошибок: {total_error_codes}",
+            f"Уникальных кодов ошибок: {len(unique_error_codes)}",
+        ))
         if unique_error_codes:
-            lines.append(f"Коды: {', '.join(sorted(unique_error_codes))}")
+            lines.append(f"Коды: {', '.join(unique_error_codes)}")
         
         return "\n".join(lines)
     
@@ -93,9 +113,10 @@ class ErrorsReportFormatter:
             return "method,path,error_codes"
         
         lines = ["method,path,error_codes"]
-        for item in report_data:
-            error_codes_str = ";".join(item['error_codes']) if item['error_codes'] else ""
-            lines.append(f"{item['method']},{item['path']},{error_codes_str}")
+        lines.extend(
+            f"{item['method']},{item['path']},{';'.join(item['error_codes'])}"
+            for item in report_data
+        )
         
         return "\n".join(lines)
     
@@ -113,58 +134,52 @@ class ErrorsReportFormatter:
         if not report_data:
             return "# Отчет по кодам ошибок эндпоинтов\n\nЭндпоинты не найдены."
         
-        lines = []
-        lines.append("# Отчет по кодам ошибок эндпоинтов")
-        lines.append("")
+        lines = [
+            "# Отчет по кодам ошибок эндпоинтов",
+            "",
+        ]
         
         # Группируем по наличию ошибок
-        endpoints_with_errors = []
-        endpoints_without_errors = []
-        
-        for item in report_data:
-            if item['error_codes']:
-                endpoints_with_errors.append(item)
-            else:
-                endpoints_without_errors.append(item)
+        endpoints_with_errors, endpoints_without_errors, total_error_codes, unique_error_codes = (
+            ErrorsReportFormatter._split(report_data)
+        )
         
         # Выводим эндпоинты с ошибками
         if endpoints_with_errors:
-            lines.append(f"## Эндпоинты с кодами ошибок ({len(endpoints_with_errors)})")
-            lines.append("")
-            lines.append("| Метод | Путь | Коды ошибок |")
-            lines.append("|-------|------|-------------|")
-            for item in endpoints_with_errors:
-                error_codes_str = ", ".join(item['error_codes'])
-                lines.append(f"| {item['method']} | `{item['path']}` | {error_codes_str} |")
+            lines.extend((
+                f"## Эндпоинты с кодами ошибок ({len(endpoints_with_errors)})",
+                "",
+                "| Метод | Путь | Коды ошибок |",
+                "|-------|------|-------------|",
+            ))
+            lines.extend(
+                f"| {item['method']} | `{item['path']}` | {', '.join(item['error_codes'])} |"
+                for item in endpoints_with_errors
+            )
             lines.append("")
         
         # Выводим эндпоинты без ошибок (если есть)
         if endpoints_without_errors:
-            lines.append(f"## Эндпоинты без кодов ошибок ({len(endpoints_without_errors)})")
-            lines.append("")
-            lines.append("| Метод | Путь |")
-            lines.append("|-------|------|")
-            for item in endpoints_without_errors:
-                lines.append(f"| {item['method']} | `{item['path']}` |")
+            lines.extend((
+                f"## Эндпоинты без кодов ошибок ({len(endpoints_without_errors)})",
+                "",
+                "| Метод | Путь |",
+                "|-------|------|",
+            ))
+            lines.extend(f"| {item['method']} | `{item['path']}` |" for item in endpoints_without_errors)
             lines.append("")
         
         # Итоговая статистика
-        total_endpoints = len(report_data)
-        total_error_codes = sum(len(item['error_codes']) for item in report_data)
-        unique_error_codes = set()
-        for item in report_data:
-            unique_error_codes.update(item['error_codes'])
-        
-        lines.append("## Статистика")
-        lines.append("")
-        lines.append(f"- **Всего эндпоинтов:** {total_endpoints}")
-        lines.append(f"- **Эндпоинтов с ошибками:** {len(endpoints_with_errors)}")
-        lines.append(f"- **Эндпоинтов без ошибок:** {len(endpoints_without_errors)}")
-        lines.append(f"- **Всего кодов ошибок:** {total_error_codes}")
-        lines.append(f"- **Уникальных кодов ошибок:** {len(unique_error_codes)}")
+        lines.extend((
+            "## Статистика",
+            "",
+            f"- **Всего эндпоинтов:** {len(report_data)}",
+            f"- **Эндпоинтов с ошибками:** {len(endpoints_with_errors)}",
+            f"- **Эндпоинтов без ошибок:** {len(endpoints_without_errors)}",
+            f"- **Всего кодов ошибок:** {total_error_codes}",
+            f"- **Уникальных кодов ошибок:** {len(unique_error_codes)}",
+        ))
         if unique_error_codes:
-            codes_list = ", ".join(sorted(unique_error_codes))
-            lines.append(f"- **Коды:** {codes_list}")
+            lines.append(f"- **Коды:** {', '.join(unique_error_codes)}")
         
         return "\n".join(lines)
-
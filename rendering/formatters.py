@@ -1,10 +1,107 @@
 """Форматтеры для рендеринга документации"""
 import json
 import re
-from collections import defaultdict
+from collections import Counter
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter
 from typing import Dict, List, Tuple, Optional
 from domain.models import Endpoint
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson опционален
+    orjson = None
+
+
+# Маркер отсутствующего ключа для dict.get там, где ключ обычно есть
+# и значение может быть любым (включая None)
+_MISSING = object()
+
+# Кодировщик для случаев без orjson: создается один раз на модуль
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, indent=2)
+
+
+def _dumps_indented(obj, max_length: Optional[int] = None) -> str:
+    """
+    Сериализует объект в JSON с отступом в 2 пробела без экранирования не-ASCII.
+    
+    Использует orjson, если он установлен и может сериализовать объект,
+    иначе стандартный json. Стандартный json с отступами кодирует объект
+    на Python по частям, поэтому при заданном max_length кодирование
+    останавливается, как только набрано больше max_length символов.
+    
+    Вывод orjson отличается от json.dumps(indent=2) только вещественными
+    числами: экспонента записывается короче (1e20 вместо 1e+20, 1e-7
+    вместо 1e-07), а NaN и Infinity записываются как null.
+    
+    Args:
+        obj: Объект для сериализации
+        max_length: Длина, после которой результат будет обрезан вызывающим
+            кодом (опционально)
+        
+    Returns:
+        JSON строка; при заданном max_length - возможно, только ее начало,
+        но всегда длиннее max_length, если длиннее полная строка
+        
+    Raises:
+        TypeError: Если объект не сериализуется в JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        except orjson.JSONEncodeError:
+            pass
+    
+    if max_length is None:
+        return _JSON_ENCODER.encode(obj)
+    
+    chunks = []
+    length = 0
+    for chunk in _JSON_ENCODER.iterencode(obj):
+        chunks.append(chunk)
+        length += len(chunk)
+        if length > max_length:
+            break
+    return ''.join(chunks)
+
+
+class RefFormatter:
+    """Форматтер для ссылок на схемы"""
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def info(ref: str) -> Tuple[str, str]:
+        """
+        Возвращает имя схемы из ссылки и якорь ее раздела в документе.
+        
+        Одни и те же ссылки встречаются в документе многократно, поэтому
+        результат кешируется по строке ссылки.
+        
+        Args:
+            ref: Ссылка ($ref или x-original-ref), например '#/components/schemas/User'
+            
+        Returns:
+            Кортеж (имя схемы, якорь в нижнем регистре)
+        """
+        name = ref.rpartition('/')[2]
+        return name, name.lower()
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def link(ref: str) -> str:
+        """
+        Форматирует ссылку на схему как Markdown ссылку на ее раздел.
+        
+        Args:
+            ref: Ссылка ($ref или x-original-ref)
+            
+        Returns:
+            Строка вида '[User](#user)'
+        """
+        name, anchor = RefFormatter.info(ref)
+        return f"[{name}](#{anchor})"
+
 
 class TypeFormatter:
     """Форматтер для форматирования типов схем"""
@@ -24,13 +121,11 @@ class TypeFormatter:
         if 'x-original-ref' in schema:
             ref = schema['x-original-ref']
             if ref.startswith('#/components/schemas/'):
-                ref_name = ref.split('/')[-1]
-                return f"[{ref_name}](#{ref_name.lower()})"
+                return RefFormatter.link(ref)
         
         # Обработка обычных ссылок
         if '$ref' in schema:
-            ref_name = schema['$ref'].split('/')[-1]
-            return f"[{ref_name}](#{ref_name.lower()})"
+            return RefFormatter.link(schema['$ref'])
         
         # Обработка additionalProperties
         if 'additionalProperties' in schema:
@@ -39,45 +134,40 @@ class TypeFormatter:
                 return f"object<string, {value_type}>"
             return "object"
         
-        # Обработка комбинаторов схем
+        # Обработка комбинаторов схем (метод связывается с локальным именем
+        # один раз на список вариантов)
         if 'anyOf' in schema:
-            types = [TypeFormatter.format(s) for s in schema['anyOf']]
+            format_type = TypeFormatter.format
+            types = [format_type(s) for s in schema['anyOf']]
             return f"anyOf<{' , '.join(types)}>"
         elif 'oneOf' in schema:
-            types = [TypeFormatter.format(s) for s in schema['oneOf']]
+            format_type = TypeFormatter.format
+            types = [format_type(s) for s in schema['oneOf']]
             return f"oneOf<{' , '.join(types)}>"
         elif 'allOf' in schema:
-            types = [TypeFormatter.format(s) for s in schema['allOf']]
+            format_type = TypeFormatter.format
+            types = [format_type(s) for s in schema['allOf']]
             return f"allOf<{' & '.join(types)}>"
         
-        # Обработка массивов
-        elif schema.get('type') == 'array' and 'items' in schema:
-            items_schema = schema['items']
-            
-            # Рекурсивный вызов для вложенных элементов
-            items_type = TypeFormatter.format(items_schema)
-            
-            # Определение типа элементов
-            if 'type' in items_schema:
-                base_type = items_schema['type']
-            elif 'x-original-ref' in items_schema:
-                ref_name = items_schema['x-original-ref'].split('/')[-1]
-                base_type = f"[{ref_name}](#{ref_name.lower()})"
-            elif '$ref' in items_schema:
-                ref_name = items_schema['$ref'].split('/')[-1]
-                base_type = f"[{ref_name}](#{ref_name.lower()})"
-            else:
-                base_type = 'object'
-            
-            # Форматирование для примитивных типов
+        # Тип читается один раз для проверок массива и объекта
+        schema_type = schema.get('type')
+        
+        # Обработка массивов (items у массива почти всегда есть, поэтому
+        # он читается одним get, а не проверкой и индексом)
+        items_schema = schema.get('items', _MISSING) if schema_type == 'array' else _MISSING
+        if items_schema is not _MISSING:
+            # Форматирование для примитивных типов: тип элементов уже известен,
+            # рекурсивный вызов не нужен
+            base_type = items_schema.get('type')
             if base_type in ['string', 'integer', 'number', 'boolean']:
                 return f"array<{base_type}>"
             
-            # Форматирование для сложных типов
-            return f"array<{items_type}>"
+            # Форматирование для сложных типов; ссылки в элементах обрабатывает
+            # тот же рекурсивный вызов
+            return f"array<{TypeFormatter.format(items_schema)}>"
         
         # Обработка объектов с properties
-        elif schema.get('type') == 'object' and 'properties' in schema:
+        elif schema_type == 'object' and 'properties' in schema:
             return "object"
         
         # Базовый тип
@@ -113,6 +203,10 @@ class DescriptionFormatter:
         """
         if s is None:
             return ""
+        # Большинство описаний однострочные: проверка вхождения дешевле
+        # вызова replace, и строка возвращается без копирования
+        if '\n' not in s and '  - ' not in s:
+            return s
         return s.replace('\n', '<br>').replace('  - ', '<br>- ')
 
 
@@ -136,7 +230,7 @@ class ExampleFormatter:
             
         if isinstance(example, (dict, list)):
             try:
-                example_str = json.dumps(example, ensure_ascii=False, indent=2)
+                example_str = _dumps_indented(example, max_length)
                 if len(example_str) > max_length:
                     return example_str[:max_length] + "..."
                 return example_str
@@ -223,25 +317,17 @@ class StatsFormatter:
         without_tags = sum(1 for e in endpoints if not e.tags)
         without_tags_percent = (without_tags / total * 100) if total > 0 else 0
         
+        # Подсчеты ведет Counter (цикл подсчета реализован на C);
+        # порядок ключей - порядок первого появления, как и раньше
+        
         # Статистика по методам HTTP
-        methods_count = defaultdict(int)
-        for e in endpoints:
-            methods_count[e.method] += 1
+        methods_count = Counter(map(attrgetter('method'), endpoints))
         
         # Статистика по версиям API
-        versions_count = defaultdict(int)
-        for e in endpoints:
-            version = StatsFormatter._extract_version(e.path)
-            versions_count[version] += 1
+        versions_count = Counter(map(StatsFormatter._extract_version, map(attrgetter('path'), endpoints)))
         
-        # Статистика по тегам
-        tags_count = defaultdict(int)
-        for e in endpoints:
-            if e.tags:
-                for tag in e.tags:
-                    tags_count[tag] += 1
-            else:
-                tags_count['Без тега'] += 1
+        # Статистика по тегам (эндпоинты без тегов попадают в группу "Без тега")
+        tags_count = Counter(chain.from_iterable(e.tags or ('Без тега',) for e in endpoints))
         
         # Статистика по deprecated
         deprecated_count = sum(1 for e in endpoints if e.operation.get('deprecated', False))
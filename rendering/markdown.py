@@ -2,12 +2,85 @@
 import os
 import json
 from collections import defaultdict
-from typing import Dict, Set, Optional, List
-from jinja2 import Environment, FileSystemLoader
+from typing import Callable, Dict, FrozenSet, Set, Optional, List, TextIO, Tuple
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+from jinja2.bccache import Bucket
+from jinja2.utils import htmlsafe_json_dumps
 
-from domain.models import OpenAPISpec, Endpoint, EndpointFilter
-from domain.services import SchemaResolver, SchemaCollector
-from rendering.formatters import TypeFormatter, ExampleFormatter, DescriptionFormatter
+from domain.models import OpenAPISpec, EndpointFilter
+from domain.services import HTTP_METHODS, SchemaResolver, SchemaCollector
+from rendering.formatters import RefFormatter, TypeFormatter, ExampleFormatter, DescriptionFormatter
+
+try:
+    import minijinja
+except ImportError:  # pragma: no cover - minijinja опционален
+    minijinja = None
+
+
+# Маркер отсутствующего ключа для dict.get там, где ключ обычно есть
+_MISSING = object()
+
+# Переменная окружения для выбора шаблонизатора: при значении "jinja2"
+# minijinja не используется, даже если установлен
+RENDERER_ENV_VAR = 'OPENAPI_SCRIBE_RENDERER'
+
+
+# Состояние процесса-воркера: генератор и спецификация создаются один раз
+# при запуске процесса, а не с каждым эндпоинтом
+_worker_generator: Optional['MarkdownGenerator'] = None
+_worker_spec: Optional[OpenAPISpec] = None
+_worker_resolver: Optional[SchemaResolver] = None
+
+
+def _init_worker(template_dir: str, spec: OpenAPISpec):
+    """
+    Инициализирует процесс-воркер для рендеринга секций эндпоинтов.
+    
+    Args:
+        template_dir: Путь к директории с шаблонами
+        spec: OpenAPI спецификация
+    """
+    global _worker_generator, _worker_spec, _worker_resolver
+    _worker_generator = MarkdownGenerator(template_dir)
+    _worker_spec = spec
+    _worker_resolver = SchemaResolver.for_spec(spec)
+
+
+def _render_sections_in_worker(key: Tuple[str, str]) -> Tuple[str, str, str, str]:
+    """
+    Рендерит секции эндпоинта в процессе-воркере.
+    
+    Args:
+        key: Путь и ключ метода в path item
+        
+    Returns:
+        Секции эндпоинта (см. MarkdownGenerator._render_sections)
+    """
+    path, method = key
+    operation = _worker_spec.paths[path][method]
+    return _worker_generator._render_sections(operation, _worker_spec, _worker_resolver)
+
+
+class _TolerantBytecodeCache(FileSystemBytecodeCache):
+    """
+    Дисковый кеш скомпилированных шаблонов.
+    
+    Создает каталог при первой записи; ошибки чтения и записи игнорируются,
+    так как кеш лишь ускоряет повторную компиляцию шаблонов.
+    """
+    
+    def load_bytecode(self, bucket: Bucket) -> None:
+        try:
+            super().load_bytecode(bucket)
+        except OSError:
+            pass
+    
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            super().dump_bytecode(bucket)
+        except OSError:
+            pass
 
 
 class MarkdownGenerator:
@@ -15,14 +88,25 @@ class MarkdownGenerator:
     Генератор Markdown документации из OpenAPI спецификации.
     
     Использует domain сервисы и форматтеры для генерации документации.
+    Шаблоны рендерятся через minijinja, если он установлен (и не выбран
+    Jinja2 через переменную окружения OPENAPI_SCRIBE_RENDERER=jinja2),
+    иначе через Jinja2.
     """
     
-    def __init__(self, template_dir: Optional[str] = None):
+    # Минимальное количество эндпоинтов, при котором запуск процессов окупается
+    PARALLEL_MIN_ENDPOINTS = 256
+    
+    # Количество эндпоинтов, передаваемых воркеру за одну отправку
+    PARALLEL_CHUNK_SIZE = 64
+    
+    def __init__(self, template_dir: Optional[str] = None, bytecode_cache_dir: Optional[str] = None):
         """
         Инициализирует генератор.
         
         Args:
             template_dir: Путь к директории с шаблонами (по умолчанию rendering/templates)
+            bytecode_cache_dir: Каталог дискового кеша скомпилированных шаблонов
+                (None - шаблоны компилируются при каждом запуске)
         """
         if template_dir is None:
             # Используем шаблоны из rendering/templates
@@ -30,23 +114,59 @@ class MarkdownGenerator:
                 os.path.dirname(__file__),
                 'templates'
             )
+        self._template_dir = template_dir
         
         self.env = Environment(
             loader=FileSystemLoader(template_dir),
             autoescape=False,
             trim_blocks=True,
-            lstrip_blocks=True
+            lstrip_blocks=True,
+            # Шаблоны не меняются во время работы генератора: без проверки
+            # mtime при каждом get_template и include для каждого эндпоинта
+            auto_reload=False
         )
+        self.bytecode_cache_dir = bytecode_cache_dir
+        # Загруженные шаблоны по имени (см. _template)
+        self._templates: Dict[str, Template] = {}
+        
+        # Результаты TypeFormatter.format по id схемы для текущей генерации;
+        # схема хранится рядом с результатом, чтобы ее id не был переиспользован
+        self._type_cache: Dict[int, Tuple[Dict, str]] = {}
+        # Результаты process_schema по id исходного узла для текущей генерации
+        self._processed_cache: Dict[int, Tuple[Dict, Dict]] = {}
+        # Результаты ExampleFormatter.extract по id узла для текущей генерации
+        self._examples_cache: Dict[int, Tuple[Dict, List]] = {}
+        # Коллектор схем последней спецификации (см. _get_collector)
+        self._collector: Optional[SchemaCollector] = None
         
         # Регистрация кастомных фильтров
-        self.env.filters['format_example'] = lambda ex, max_length=100: ExampleFormatter.format(ex, max_length)
-        self.env.filters['safe_replace'] = lambda s: DescriptionFormatter.safe_replace(s) if s else ""
+        filters = {
+            'format_example': lambda ex, max_length=100: ExampleFormatter.format(ex, max_length),
+            'safe_replace': lambda s: DescriptionFormatter.safe_replace(s) if s else "",
+        }
+        self.env.filters.update(filters)
+        
+        # Окружение minijinja (None - рендеринг через Jinja2)
+        self._minijinja_env = None
+        if minijinja is not None and os.environ.get(RENDERER_ENV_VAR, '').lower() != 'jinja2':
+            self._minijinja_env = self._create_minijinja_env(template_dir, filters)
+    
+    @property
+    def bytecode_cache_dir(self) -> Optional[str]:
+        """Каталог дискового кеша скомпилированных шаблонов (None - отключен)"""
+        return self._bytecode_cache_dir
+    
+    @bytecode_cache_dir.setter
+    def bytecode_cache_dir(self, cache_dir: Optional[str]):
+        self._bytecode_cache_dir = cache_dir
+        self.env.bytecode_cache = _TolerantBytecodeCache(cache_dir) if cache_dir is not None else None
     
     def generate(
         self,
         spec: OpenAPISpec,
         endpoints_filter: Optional[EndpointFilter] = None,
-        include_all_schemas: bool = False
+        include_all_schemas: bool = False,
+        max_workers: Optional[int] = None
     ) -> str:
         """
         Генерирует Markdown документацию из OpenAPI спецификации.
@@ -55,13 +175,100 @@ class MarkdownGenerator:
             spec: OpenAPI спецификация
             endpoints_filter: Фильтр эндпоинтов (опционально)
             include_all_schemas: Включить все схемы, а не только используемые
+            max_workers: Количество процессов для рендеринга секций эндпоинтов
+                (по умолчанию, а также при числе эндпоинтов меньше
+                PARALLEL_MIN_ENDPOINTS рендеринг выполняется последовательно)
             
         Returns:
             Сгенерированная Markdown документация
         """
-        # Инициализация domain сервисов
-        resolver = SchemaResolver(spec)
-        collector = SchemaCollector(spec, resolver)
+        context = self._build_context(spec, endpoints_filter, include_all_schemas, max_workers)
+        
+        # Рендеринг основного шаблона
+        return self._render('base.md.j2', context)
+    
+    def generate_to(
+        self,
+        output: TextIO,
+        spec: OpenAPISpec,
+        endpoints_filter: Optional[EndpointFilter] = None,
+        include_all_schemas: bool = False,
+        max_workers: Optional[int] = None
+    ) -> None:
+        """
+        Генерирует Markdown документацию и пишет ее в файл по частям.
+        
+        В отличие от generate не собирает документ в одну строку: фрагменты
+        основного шаблона записываются по мере рендеринга.
+        
+        Args:
+            output: Открытый текстовый файл для записи
+            spec: OpenAPI спецификация
+            endpoints_filter: Фильтр эндпоинтов (опционально)
+            include_all_schemas: Включить все схемы, а не только используемые
+            max_workers: Количество процессов для рендеринга секций эндпоинтов
+                (по умолчанию, а также при числе эндпоинтов меньше
+                PARALLEL_MIN_ENDPOINTS рендеринг выполняется последовательно)
+        """
+        context = self._build_context(spec, endpoints_filter, include_all_schemas, max_workers)
+        
+        if self._minijinja_env is not None:
+            # minijinja не рендерит шаблон по частям
+            output.write(self._render('base.md.j2', context))
+            return
+        
+        template = self._template('base.md.j2')
+        output.writelines(template.generate(context))
+    
+    def compile_emitter(
+        self,
+        spec: OpenAPISpec,
+        endpoints_filter: Optional[EndpointFilter] = None,
+        include_all_schemas: bool = False,
+        max_workers: Optional[int] = None
+    ) -> Callable[[], str]:
+        """
+        Подготавливает многократную генерацию документации для одной спецификации.
+        
+        Ссылки разрешаются, типы форматируются и секции эндпоинтов рендерятся
+        один раз; возвращаемая функция только рендерит основной шаблон по
+        готовому контексту. Подходит для повторной генерации неизменной
+        спецификации (например, в тестах или при нескольких выводах).
+        Изменения спецификации после подготовки в документ не попадают.
+        
+        Args:
+            spec: OpenAPI спецификация
+            endpoints_filter: Фильтр эндпоинтов (опционально)
+            include_all_schemas: Включить все схемы, а не только используемые
+            max_workers: Количество процессов для рендеринга секций эндпоинтов
+                (по умолчанию, а также при числе эндпоинтов меньше
+                PARALLEL_MIN_ENDPOINTS рендеринг выполняется последовательно)
+            
+        Returns:
+            Функция без аргументов, возвращающая Markdown документацию
+        """
+        context = self._build_context(spec, endpoints_filter, include_all_schemas, max_workers)
+        
+        def emit() -> str:
+            return self._render('base.md.j2', context)
+        
+        return emit
+    
+    def _build_context(
+        self,
+        spec: OpenAPISpec,
+        endpoints_filter: Optional[EndpointFilter],
+        include_all_schemas: bool,
+        max_workers: Optional[int] = None
+    ) -> Dict:
+        """Подготавливает контекст основного шаблона"""
+        # Инициализация domain сервисов: резолвер общий для спецификации,
+        # его кеш ссылок сохраняется между вызовами
+        resolver = SchemaResolver.for_spec(spec)
+        collector = self._get_collector(resolver)
+        self._type_cache = {}
+        self._processed_cache = {}
+        self._examples_cache = {}
         
         # Подготовка данных для основного шаблона
         context = {
@@ -69,56 +276,297 @@ class MarkdownGenerator:
             'version': spec.info.get('version', ''),
             'description': spec.info.get('description', ''),
             'endpoints_by_tag': defaultdict(list),
-            'schemas_section': '',
+            'schemas': None,
             'spec': spec.raw  # Передаем raw для обратной совместимости с шаблонами
         }
         
-        # Собираем все используемые схемы
-        used_schemas: Optional[Set[str]] = set() if not include_all_schemas else None
+        # Прямые ссылки на схемы из включенных эндпоинтов: операции
+        # просматриваются в том же проходе, что и рендеринг их секций
+        used_refs: Optional[List[str]] = [] if not include_all_schemas else None
+        endpoints_by_tag = context['endpoints_by_tag']
+        
+        # Пути фильтра сгруппированы по методу (см. EndpointFilter.paths_by_method);
+        # ключ пути без trailing slash вычисляется один раз на путь, а пути,
+        # которых нет в фильтре ни для одного метода, пропускаются целиком
+        filter_by_method: Optional[Dict[str, FrozenSet[str]]] = None
+        filter_paths: FrozenSet[str] = frozenset()
+        if endpoints_filter is not None:
+            filter_by_method = endpoints_filter.paths_by_method()
+            filter_paths = frozenset().union(*filter_by_method.values())
         
-        # Группировка эндпоинтов по тегам
+        # Отбор эндпоинтов: (путь, ключ метода, METHOD, операция)
+        included: List[Tuple[str, str, str, Dict]] = []
         for path, methods in spec.paths.items():
+            path_key = None
+            if filter_by_method is not None:
+                path_key = path.rstrip('/')
+                if path_key not in filter_paths:
+                    continue
             for method, operation in methods.items():
-                if method.lower() not in ['get', 'post', 'put', 'delete', 'patch', 'head', 'options']:
+                method_upper = method.upper()
+                if method_upper not in HTTP_METHODS:
                     continue
                 
                 # Проверка фильтра эндпоинтов
-                include_endpoint = True
-                if endpoints_filter:
-                    include_endpoint = endpoints_filter.matches(method, path)
+                if path_key is not None:
+                    allowed_paths = filter_by_method.get(method_upper)
+                    if allowed_paths is None or path_key not in allowed_paths:
+                        continue
                 
-                if include_endpoint:
-                    tags = operation.get('tags', ['Без тега'])
-                    endpoint = Endpoint(
-                        path=path,
-                        method=method,
-                        operation=operation,
-                        tags=tags
-                    )
-                    
-                    for tag in tags:
-                        endpoint_data = {
-                            'path': path,
-                            'method': method.upper(),
-                            'details': operation,
-                            'parameters_table': self._generate_parameters_table(operation.get('parameters', []), spec, resolver),
-                            'request_body': self._generate_request_body(operation.get('requestBody', {}), spec, resolver) if 'requestBody' in operation else "",
-                            'responses': self._generate_responses(operation.get('responses', {}), spec, resolver) if 'responses' in operation else "",
-                            'security': self._generate_security(operation.get('security', [])) if 'security' in operation else ""
-                        }
-                        context['endpoints_by_tag'][tag].append(endpoint_data)
-                    
-                    # Сбор схем
-                    if not include_all_schemas and used_schemas is not None:
-                        collected = collector.collect_from_endpoint(endpoint)
-                        used_schemas.update(collected)
+                included.append((path, method, method_upper, operation))
+                if used_refs is not None:
+                    used_refs.extend(collector.scan_operation(operation))
+        
+        # Группировка эндпоинтов по тегам. Секции эндпоинта рендерятся один
+        # раз; шаблоны только читают данные, поэтому один словарь
+        # используется во всех группах тегов
+        sections = self._render_all_sections(included, spec, resolver, max_workers)
+        for (path, _, method_upper, operation), endpoint_sections in zip(included, sections):
+            parameters_table, request_body, responses, security = endpoint_sections
+            endpoint_data = {
+                'path': path,
+                'method': method_upper,
+                'details': operation,
+                'parameters_table': parameters_table,
+                'request_body': request_body,
+                'responses': responses,
+                'security': security
+            }
+            for tag in operation.get('tags', ['Без тега']):
+                endpoints_by_tag[tag].append(endpoint_data)
+        
+        # Граф ссылок между схемами замыкается один раз для всех эндпоинтов
+        used_schemas: Optional[Set[str]] = None
+        if used_refs is not None:
+            used_schemas = collector.collect_from_names(used_refs)
         
         # Генерация секции схем
-        context['schemas_section'] = self._generate_schemas(spec, resolver, used_schemas)
+        # Секция схем рендерится вместе с основным шаблоном (include), без
+        # промежуточной строки: при потоковой записи она пишется по частям
+        context['schemas'] = self._generate_schemas(spec, resolver, used_schemas)
         
-        # Рендеринг основного шаблона
-        template = self.env.get_template('base.md.j2')
-        return template.render(context)
+        # Кеши нужны только на время подготовки контекста
+        self._type_cache.clear()
+        self._processed_cache.clear()
+        self._examples_cache.clear()
+        return context
+    
+    def _render_all_sections(
+        self,
+        included: List[Tuple[str, str, str, Dict]],
+        spec: OpenAPISpec,
+        resolver: SchemaResolver,
+        max_workers: Optional[int]
+    ) -> List[Tuple[str, str, str, str]]:
+        """
+        Рендерит секции отобранных эндпоинтов, при необходимости в процессах.
+        
+        Рендеринг упирается в CPU (обход словарей и шаблоны), поэтому
+        параллелится процессами; map сохраняет порядок эндпоинтов.
+        
+        Args:
+            included: Отобранные эндпоинты (путь, ключ метода, METHOD, операция)
+            spec: OpenAPI спецификация
+            resolver: Резолвер ссылок спецификации
+            max_workers: Количество процессов (None или 1 - последовательно)
+            
+        Returns:
+            Секции эндпоинтов в порядке included
+        """
+        if max_workers and max_workers > 1 and len(included) >= self.PARALLEL_MIN_ENDPOINTS:
+            # multiprocessing импортируется только при параллельной генерации,
+            # чтобы не замедлять запуск остальных команд CLI
+            from concurrent.futures import ProcessPoolExecutor
+            
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker,
+                initargs=(self._template_dir, spec)
+            ) as executor:
+                return list(executor.map(
+                    _render_sections_in_worker,
+                    [(path, method) for path, method, _, _ in included],
+                    chunksize=self.PARALLEL_CHUNK_SIZE
+                ))
+        
+        render_sections = self._render_sections
+        return [render_sections(operation, spec, resolver) for _, _, _, operation in included]
+    
+    def _render_sections(
+        self,
+        operation: Dict,
+        spec: OpenAPISpec,
+        resolver: SchemaResolver
+    ) -> Tuple[str, str, str, str]:
+        """
+        Рендерит секции эндпоинта.
+        
+        Args:
+            operation: Словарь операции из спецификации
+            spec: OpenAPI спецификация
+            resolver: Резолвер ссылок спецификации
+            
+        Returns:
+            Кортеж (таблица параметров, тело запроса, ответы, безопасность)
+        """
+        return (
+            self._generate_parameters_table(operation.get('parameters', []), spec, resolver),
+            self._generate_request_body(operation.get('requestBody', {}), spec, resolver) if 'requestBody' in operation else "",
+            self._generate_responses(operation.get('responses', {}), spec, resolver) if 'responses' in operation else "",
+            self._generate_security(operation.get('security', [])) if 'security' in operation else ""
+        )
+    
+    @staticmethod
+    def _create_minijinja_env(template_dir: str, filters: Dict[str, Callable]) -> "minijinja.Environment":
+        """
+        Создает окружение minijinja с теми же настройками, что и у Jinja2.
+        
+        Фильтр tojson заменяется реализацией Jinja2: встроенный фильтр
+        minijinja не сортирует ключи.
+        
+        Args:
+            template_dir: Путь к директории с шаблонами
+            filters: Кастомные фильтры
+            
+        Returns:
+            Окружение minijinja
+        """
+        def load_template(name: str) -> Optional[str]:
+            try:
+                with open(os.path.join(template_dir, name), encoding='utf-8') as f:
+                    return f.read()
+            except FileNotFoundError:
+                return None
+        
+        def tojson(value, indent=None):
+            return htmlsafe_json_dumps(value, indent=indent, sort_keys=True)
+        
+        return minijinja.Environment(
+            loader=load_template,
+            filters=dict(filters, tojson=tojson),
+            auto_escape_callback=lambda name: None,
+            trim_blocks=True,
+            lstrip_blocks=True,
+            pycompat=True
+        )
+    
+    def _render(self, name: str, context: Dict) -> str:
+        """
+        Рендерит шаблон выбранным шаблонизатором.
+        
+        Args:
+            name: Имя файла шаблона
+            context: Контекст шаблона
+            
+        Returns:
+            Результат рендеринга
+        """
+        if self._minijinja_env is not None:
+            return self._minijinja_env.render_template(name, **context)
+        return self._template(name).render(context)
+    
+    def _template(self, name: str) -> Template:
+        """
+        Возвращает шаблон по имени, загружая его из окружения один раз.
+        
+        Секции рендерятся для каждого эндпоинта, поэтому шаблоны хранятся
+        в словаре генератора вместо поиска через окружение при каждом вызове.
+        
+        Args:
+            name: Имя файла шаблона
+            
+        Returns:
+            Скомпилированный шаблон
+        """
+        template = self._templates.get(name)
+        if template is None:
+            template = self._templates[name] = self.env.get_template(name)
+        return template
+    
+    def _get_collector(self, resolver: SchemaResolver) -> SchemaCollector:
+        """
+        Возвращает коллектор схем для резолвера, переиспользуя его кеш ссылок.
+        
+        Прямые ссылки каждой схемы и результаты по операциям вычисляются
+        коллектором один раз и используются повторными генерациями той же
+        спецификации.
+        
+        Args:
+            resolver: Резолвер спецификации
+            
+        Returns:
+            SchemaCollector для спецификации резолвера
+        """
+        if self._collector is None or self._collector.resolver is not resolver:
+            self._collector = SchemaCollector(resolver.spec, resolver)
+        return self._collector
+    
+    def _process_schema(self, resolver: SchemaResolver, schema: Dict) -> Dict:
+        """
+        Обрабатывает схему через резолвер с кешированием по идентичности узла.
+        
+        Одни и те же узлы спецификации (схемы параметров, свойства компонентов)
+        обрабатываются в нескольких секциях документа; повторный вызов
+        возвращает готовый результат без обхода поддерева.
+        
+        Args:
+            resolver: Резолвер схем спецификации
+            schema: Узел схемы из спецификации
+            
+        Returns:
+            Обработанная схема
+        """
+        cached = self._processed_cache.get(id(schema))
+        if cached is not None:
+            return cached[1]
+        
+        processed = resolver.process_schema(schema)
+        self._processed_cache[id(schema)] = (schema, processed)
+        return processed
+    
+    def _format_type(self, schema: Dict) -> str:
+        """
+        Форматирует тип схемы с кешированием по идентичности словаря.
+        
+        Обработанные схемы общих компонентов - одни и те же объекты
+        (см. SchemaResolver.process_schema), поэтому тип каждой из них
+        вычисляется один раз за генерацию. Схемы не изменяются во время
+        генерации, так что кеш по id безопасен.
+        
+        Args:
+            schema: Словарь со схемой
+            
+        Returns:
+            Отформатированная строка типа
+        """
+        cached = self._type_cache.get(id(schema))
+        if cached is not None:
+            return cached[1]
+        
+        formatted = TypeFormatter.format(schema)
+        self._type_cache[id(schema)] = (schema, formatted)
+        return formatted
+    
+    def _extract_examples(self, node: Dict) -> List[Tuple[str, object]]:
+        """
+        Извлекает примеры узла с кешированием по идентичности словаря.
+        
+        Свойства общих схем попадают и в раздел схем, и в таблицы тел
+        запросов; шаблоны только читают список, поэтому он общий.
+        
+        Args:
+            node: Узел спецификации (параметр, свойство, media type)
+            
+        Returns:
+            Список кортежей (название, значение)
+        """
+        cached = self._examples_cache.get(id(node))
+        if cached is not None:
+            return cached[1]
+        
+        examples = ExampleFormatter.extract(node)
+        self._examples_cache[id(node)] = (node, examples)
+        return examples
     
     def _generate_parameters_table(
         self,
@@ -130,30 +578,45 @@ class MarkdownGenerator:
         if not parameters:
             return ""
         
+        # Методы, вызываемые для каждого параметра, связываются с локальными
+        # именами один раз на таблицу
+        process_schema = self._process_schema
+        format_type = self._format_type
+        format_description = DescriptionFormatter.format
+        extract_examples = self._extract_examples
+        
         # Подготовка данных для шаблона
         params_data = []
+        params_append = params_data.append
         for param in parameters:
-            # Обработка ссылок через SchemaResolver
-            resolved_param = param.copy()
-            if 'schema' in param and param['schema']:
-                resolved_schema = resolver.process_schema(param['schema'])
-                resolved_param['schema'] = resolved_schema
+            # Обработка ссылок через SchemaResolver; параметр копируется только
+            # если схема изменилась, чтобы примеры брались из обработанной схемы
+            examples_node = param
+            param_type = param_format = ''
+            schema = param.get('schema', _MISSING)
+            if schema is not _MISSING:
+                if schema:
+                    schema = process_schema(resolver, schema)
+                    if schema is not param['schema']:
+                        examples_node = param.copy()
+                        examples_node['schema'] = schema
+                param_type = format_type(schema)
+                param_format = schema.get('format', '')
             
             # Получение описания
-            description = DescriptionFormatter.format(resolved_param)
+            description = format_description(param)
             
-            params_data.append({
-                'name': resolved_param.get('name', ''),
-                'type': TypeFormatter.format(resolved_param.get('schema', {})) if 'schema' in resolved_param else '',
-                'in': resolved_param.get('in', ''),
-                'required': "✅" if resolved_param.get('required', False) else "❌",
+            params_append({
+                'name': param.get('name', ''),
+                'type': param_type,
+                'in': param.get('in', ''),
+                'required': "✅" if param.get('required', False) else "❌",
                 'description': description,
-                'examples': ExampleFormatter.extract(resolved_param),
-                'format': resolved_param.get('schema', {}).get('format', '') if 'schema' in resolved_param else ''
+                'examples': extract_examples(examples_node),
+                'format': param_format
             })
         
-        template = self.env.get_template('parameters_table.md.j2')
-        return template.render(parameters=params_data, spec=spec.raw)
+        return self._render('parameters_table.md.j2', {'parameters': params_data, 'spec': spec.raw})
     
     def _generate_request_body(
         self,
@@ -173,12 +636,12 @@ class MarkdownGenerator:
         for content_type, media in body.get('content', {}).items():
             content = {'content_type': content_type}
             
-            if 'schema' in media and media['schema']:
-                original_schema = media['schema']
-                schema = resolver.process_schema(original_schema)
+            original_schema = media.get('schema')
+            if original_schema:
+                schema = self._process_schema(resolver, original_schema)
                 
                 if '$ref' in original_schema:
-                    ref_name = original_schema['$ref'].split('/')[-1]
+                    ref_name, content['schema_anchor'] = RefFormatter.info(original_schema['$ref'])
                     try:
                         ref_schema = resolver.resolve(original_schema['$ref'])
                         if ref_schema:
@@ -187,32 +650,18 @@ class MarkdownGenerator:
                         content['schema_title'] = ''
                     content['schema_ref'] = ref_name
                 else:
-                    content['schema_type'] = TypeFormatter.format(schema) if schema else ''
+                    content['schema_type'] = self._format_type(schema) if schema else ''
                 
                 # Обработка свойств объектов
                 if schema and schema.get('type') == 'object' and 'properties' in schema:
-                    content['properties'] = []
-                    required_fields = schema.get('required', [])
-                    
-                    for prop_name, prop in schema['properties'].items():
-                        if prop is None:
-                            continue
-                        
-                        prop = resolver.process_schema(prop)
-                        content['properties'].append({
-                            'name': prop_name,
-                            'type': TypeFormatter.format(prop) if prop else '',
-                            'required': '✅' if prop_name in required_fields else '❌',
-                            'description': DescriptionFormatter.format(prop),
-                            'examples': ExampleFormatter.extract(prop),
-                            'format': prop.get('format', '') if prop else ''
-                        })
+                    content['properties'] = self._properties_data(
+                        resolver, schema['properties'], schema.get('required', [])
+                    )
             
-            content['examples'] = ExampleFormatter.extract(media)
+            content['examples'] = self._extract_examples(media)
             body_data['content'].append(content)
         
-        template = self.env.get_template('request_body.md.j2')
-        return template.render(body=body_data, spec=spec.raw)
+        return self._render('request_body.md.j2', {'body': body_data, 'spec': spec.raw})
     
     def _generate_responses(
         self,
@@ -224,6 +673,9 @@ class MarkdownGenerator:
         if not responses:
             return ""
         
+        ref_info = RefFormatter.info
+        extract_examples = self._extract_examples
+        
         responses_data = []
         for code, response in responses.items():
             if response is None:
@@ -241,10 +693,10 @@ class MarkdownGenerator:
                     
                 content = {'content_type': content_type}
                 
-                if 'schema' in media and media['schema']:
-                    schema = media['schema']
+                schema = media.get('schema')
+                if schema:
                     if '$ref' in schema:
-                        ref_name = schema['$ref'].split('/')[-1]
+                        ref_name, content['schema_anchor'] = ref_info(schema['$ref'])
                         try:
                             schema_ref = resolver.resolve(schema['$ref'])
                             if schema_ref:
@@ -253,16 +705,64 @@ class MarkdownGenerator:
                             content['schema_title'] = ''
                         content['schema_ref'] = ref_name
                     else:
-                        processed_schema = resolver.process_schema(schema)
-                        content['schema_type'] = TypeFormatter.format(processed_schema)
+                        processed_schema = self._process_schema(resolver, schema)
+                        content['schema_type'] = self._format_type(processed_schema)
                 
-                content['examples'] = ExampleFormatter.extract(media)
+                content['examples'] = extract_examples(media)
                 response_data['content'].append(content)
             
             responses_data.append(response_data)
         
-        template = self.env.get_template('responses.md.j2')
-        return template.render(responses=responses_data, spec=spec.raw)
+        return self._render('responses.md.j2', {'responses': responses_data, 'spec': spec.raw})
+    
+    def _properties_data(
+        self,
+        resolver: SchemaResolver,
+        properties: Dict,
+        required_fields: List[str]
+    ) -> List[Dict]:
+        """
+        Подготавливает строки таблицы свойств для шаблонов тела запроса и схем.
+        
+        Args:
+            resolver: Резолвер схем спецификации
+            properties: Словарь properties обработанной схемы
+            required_fields: Имена обязательных свойств
+            
+        Returns:
+            Список данных свойств (пропуская свойства со значением None)
+        """
+        # Методы, вызываемые для каждого свойства, связываются с локальными
+        # именами один раз на таблицу
+        process_schema = self._process_schema
+        format_type = self._format_type
+        format_description = DescriptionFormatter.format
+        extract_examples = self._extract_examples
+        
+        # Проверка обязательности - по множеству, а не по списку для каждого
+        # свойства; некорректный required (не список строк) проверяется как есть
+        if type(required_fields) is list:
+            try:
+                required_fields = frozenset(required_fields)
+            except TypeError:
+                pass
+        
+        rows = []
+        rows_append = rows.append
+        for prop_name, prop in properties.items():
+            if prop is None:
+                continue
+            
+            prop = process_schema(resolver, prop)
+            rows_append({
+                'name': prop_name,
+                'type': format_type(prop) if prop else '',
+                'required': '✅' if prop_name in required_fields else '❌',
+                'description': format_description(prop),
+                'examples': extract_examples(prop),
+                'format': prop.get('format', '') if prop else ''
+            })
+        return rows
     
     def _generate_security(self, security: List[Dict]) -> str:
         """Генерирует описание требований безопасности"""
@@ -286,17 +786,22 @@ class MarkdownGenerator:
         spec: OpenAPISpec,
         resolver: SchemaResolver,
         used_schemas: Optional[Set[str]] = None
-    ) -> str:
-        """Генерирует раздел со схемами данных через шаблон"""
+    ) -> Optional[List[Dict]]:
+        """
+        Подготавливает данные раздела схем для шаблона schemas.md.j2.
+        
+        Returns:
+            Список данных схем или None, если раздел схем не выводится
+        """
         schemas = spec.schemas
         if not schemas:
-            return ""
+            return None
         
         if used_schemas is not None:
             schemas = {name: schema for name, schema in schemas.items() if name in used_schemas}
         
         if not schemas:
-            return ""
+            return None
         
         schemas_data = []
         for name, schema in schemas.items():
@@ -304,7 +809,7 @@ class MarkdownGenerator:
                 continue
             
             # Обработка схемы через resolver
-            processed_schema = resolver.process_schema(schema)
+            processed_schema = self._process_schema(resolver, schema)
             
             schema_data = {
                 'name': name,
@@ -317,24 +822,11 @@ class MarkdownGenerator:
             }
             
             if 'properties' in processed_schema:
-                required_fields = processed_schema.get('required', [])
-                
-                for prop_name, prop in processed_schema['properties'].items():
-                    if prop is None:
-                        continue
-                    
-                    prop = resolver.process_schema(prop)
-                    schema_data['properties'].append({
-                        'name': prop_name,
-                        'type': TypeFormatter.format(prop) if prop else '',
-                        'required': '✅' if prop_name in required_fields else '❌',
-                        'description': DescriptionFormatter.format(prop),
-                        'examples': ExampleFormatter.extract(prop),
-                        'format': prop.get('format', '') if prop else ''
-                    })
+                schema_data['properties'] = self._properties_data(
+                    resolver, processed_schema['properties'], processed_schema.get('required', [])
+                )
             
             schemas_data.append(schema_data)
         
-        template = self.env.get_template('schemas.md.j2')
-        return template.render(schemas=schemas_data, spec=spec.raw)
+        return schemas_data
 
@@ -1,9 +1,52 @@
 """Верификатор для проверки информационных потерь в Markdown документации"""
 import json
 import re
-from typing import Dict, List, Set, Optional
+from typing import Dict, List, Set, Optional, Tuple
 from domain.models import Endpoint
 
+# Заголовок эндпоинта в сгенерированном Markdown: ### `METHOD` /path
+_ENDPOINT_HEADER_RE = re.compile(r"###\s*`([^`]*)`\s+(\S+)")
+
+
+class MarkdownIndex:
+    """
+    Индекс Markdown документации для проверки множества эндпоинтов.
+    
+    Строится одним проходом по документу и позволяет находить заголовки
+    эндпоинтов без повторного поиска регулярным выражением по всему тексту.
+    """
+    
+    def __init__(self, markdown: str):
+        """
+        Строит индекс заголовков эндпоинтов.
+        
+        Args:
+            markdown: Содержимое Markdown документации
+        """
+        self.markdown = markdown
+        self.lower = markdown.lower()
+        self.headers: Dict[str, List[Tuple[int, str]]] = {}
+        for match in _ENDPOINT_HEADER_RE.finditer(markdown):
+            self.headers.setdefault(match.group(1), []).append((match.start(), match.group(2)))
+    
+    def find_endpoint(self, method: str, path: str) -> Optional[int]:
+        """
+        Находит позицию первого заголовка эндпоинта.
+        
+        Как и поиск по шаблону ``###\\s*`METHOD`\\s+path``, путь сравнивается по префиксу.
+        
+        Args:
+            method: HTTP метод в верхнем регистре
+            path: Путь эндпоинта
+            
+        Returns:
+            Позиция начала заголовка или None
+        """
+        for start, header_path in self.headers.get(method, ()):
+            if header_path.startswith(path):
+                return start
+        return None
+
 
 class DocumentationVerifier:
     """
@@ -16,7 +59,8 @@ class DocumentationVerifier:
     def verify_endpoint(
         self,
         endpoint: Endpoint,
-        markdown_content: str
+        markdown_content: str,
+        index: Optional[MarkdownIndex] = None
     ) -> Dict:
         """
         Проверяет полноту информации об эндпоинте в Markdown.
@@ -24,10 +68,15 @@ class DocumentationVerifier:
         Args:
             endpoint: Эндпоинт из OpenAPI спецификации
             markdown_content: Содержимое Markdown документации
+            index: Предвычисленный индекс того же документа (опционально,
+                ускоряет проверку множества эндпоинтов)
             
         Returns:
             Словарь с результатами проверки и найденными потерями
         """
+        if index is None:
+            index = MarkdownIndex(markdown_content)
+        
         operation = endpoint.operation
         issues = []
         missing_items = {
@@ -42,13 +91,12 @@ class DocumentationVerifier:
         
         # Проверка security
         if 'security' in operation and operation['security']:
-            security_info = self._extract_security_from_markdown(markdown_content, endpoint)
+            security_info = self._extract_security_from_markdown(markdown_content, endpoint, index)
             if not security_info:
                 # Проверяем еще раз более точно
-                pattern = rf"###\s*`{endpoint.method}`\s+{re.escape(endpoint.path)}"
-                match = re.search(pattern, markdown_content)
-                if match:
-                    endpoint_section = markdown_content[match.start():match.start() + 3000]
+                start = self._find_endpoint_header(markdown_content, endpoint, index)
+                if start is not None:
+                    endpoint_section = markdown_content[start:start + 3000]
                     # Ищем "Требования безопасности" или "security"
                     if 'требования безопасности' in endpoint_section.lower() or 'security' in endpoint_section.lower():
                         security_info = True
@@ -63,7 +111,7 @@ class DocumentationVerifier:
         
         # Проверка deprecated
         if operation.get('deprecated', False):
-            if not self._check_deprecated_in_markdown(markdown_content, endpoint):
+            if not self._check_deprecated_in_markdown(markdown_content, endpoint, index):
                 missing_items['deprecated'] = True
                 issues.append({
                     'type': 'missing_deprecated',
@@ -83,7 +131,7 @@ class DocumentationVerifier:
         
         # Проверка description
         if 'description' in operation and operation['description']:
-            if not self._check_description_in_markdown(markdown_content, operation['description']):
+            if not self._check_description_in_markdown(markdown_content, operation['description'], index):
                 missing_items['description'] = True
                 issues.append({
                     'type': 'missing_description',
@@ -93,12 +141,12 @@ class DocumentationVerifier:
         
         # Проверка примеров в responses
         response_examples = self._extract_response_examples(operation.get('responses', {}))
-        markdown_response_examples = self._extract_examples_from_markdown_responses(markdown_content, endpoint)
+        markdown_response_examples = self._extract_examples_from_markdown_responses(markdown_content, endpoint, index)
         
         for code, examples in response_examples.items():
             markdown_examples = markdown_response_examples.get(code, [])
             # Получаем также значения примеров для сравнения
-            markdown_example_values = self._extract_example_values_from_markdown(markdown_content, endpoint, code)
+            markdown_example_values = self._extract_example_values_from_markdown(markdown_content, endpoint, code, index)
             
             for example_name, example_info in examples.items():
                 # Получаем значение и summary
@@ -147,7 +195,7 @@ class DocumentationVerifier:
         
         # Проверка примеров в parameters
         parameter_examples = self._extract_parameter_examples(operation.get('parameters', []))
-        markdown_param_examples = self._extract_examples_from_markdown_parameters(markdown_content, endpoint)
+        markdown_param_examples = self._extract_examples_from_markdown_parameters(markdown_content, endpoint, index)
         
         for param_name, examples in parameter_examples.items():
             markdown_examples = markdown_param_examples.get(param_name, [])
@@ -165,7 +213,7 @@ class DocumentationVerifier:
         
         # Проверка примеров в requestBody
         request_body_examples = self._extract_request_body_examples(operation.get('requestBody', {}))
-        markdown_body_examples = self._extract_examples_from_markdown_request_body(markdown_content, endpoint)
+        markdown_body_examples = self._extract_examples_from_markdown_request_body(markdown_content, endpoint, index)
         
         for example_name, example_value in request_body_examples.items():
             if example_name not in markdown_body_examples:
@@ -188,33 +236,60 @@ class DocumentationVerifier:
             'summary': self._generate_summary(issues)
         }
     
-    def _extract_security_from_markdown(self, markdown: str, endpoint: Endpoint) -> bool:
-        """Проверяет наличие security информации в Markdown"""
-        # Ищем секцию security в Markdown
+    def _find_endpoint_header(
+        self,
+        markdown: str,
+        endpoint: Endpoint,
+        index: Optional[MarkdownIndex] = None
+    ) -> Optional[int]:
+        """Находит позицию заголовка эндпоинта в Markdown"""
+        if index is not None:
+            return index.find_endpoint(endpoint.method, endpoint.path)
+        
         pattern = rf"###\s*`{endpoint.method}`\s+{re.escape(endpoint.path)}"
         match = re.search(pattern, markdown)
-        if not match:
+        return match.start() if match else None
+    
+    def _extract_security_from_markdown(
+        self,
+        markdown: str,
+        endpoint: Endpoint,
+        index: Optional[MarkdownIndex] = None
+    ) -> bool:
+        """Проверяет наличие security информации в Markdown"""
+        # Ищем секцию security в Markdown
+        start = self._find_endpoint_header(markdown, endpoint, index)
+        if start is None:
             return False
         
         # Ищем security после заголовка эндпоинта
-        endpoint_section = markdown[match.start():match.start() + 2000]
+        endpoint_section = markdown[start:start + 2000]
         return 'security' in endpoint_section.lower() or 'авторизация' in endpoint_section.lower() or 'аутентификация' in endpoint_section.lower()
     
-    def _check_deprecated_in_markdown(self, markdown: str, endpoint: Endpoint) -> bool:
+    def _check_deprecated_in_markdown(
+        self,
+        markdown: str,
+        endpoint: Endpoint,
+        index: Optional[MarkdownIndex] = None
+    ) -> bool:
         """Проверяет наличие deprecated статуса в Markdown"""
-        pattern = rf"###\s*`{endpoint.method}`\s+{re.escape(endpoint.path)}"
-        match = re.search(pattern, markdown)
-        if not match:
+        start = self._find_endpoint_header(markdown, endpoint, index)
+        if start is None:
             return False
         
-        endpoint_section = markdown[match.start():match.start() + 500]
+        endpoint_section = markdown[start:start + 500]
         return 'устарел' in endpoint_section.lower() or 'deprecated' in endpoint_section.lower() or '⚠️' in endpoint_section
     
     def _check_operation_id_in_markdown(self, markdown: str, operation_id: str) -> bool:
         """Проверяет наличие operationId в Markdown"""
         return operation_id in markdown
     
-    def _check_description_in_markdown(self, markdown: str, description: str) -> bool:
+    def _check_description_in_markdown(
+        self,
+        markdown: str,
+        description: str,
+        index: Optional[MarkdownIndex] = None
+    ) -> bool:
         """Проверяет наличие description в Markdown"""
         # Берем первые 50 символов описания для поиска
         description_snippet = description[:50].strip()
@@ -222,7 +297,8 @@ class DocumentationVerifier:
             return True  # Пустое описание не считается потерей
         
         # Ищем описание в Markdown (может быть сокращено или отформатировано)
-        return description_snippet.lower() in markdown.lower()
+        markdown_lower = index.lower if index is not None else markdown.lower()
+        return description_snippet.lower() in markdown_lower
     
     def _extract_response_examples(self, responses: Dict) -> Dict[str, Dict]:
         """Извлекает примеры из responses"""
@@ -249,17 +325,21 @@ class DocumentationVerifier:
         
         return examples
     
-    def _extract_examples_from_markdown_responses(self, markdown: str, endpoint: Endpoint) -> Dict[str, List[str]]:
+    def _extract_examples_from_markdown_responses(
+        self,
+        markdown: str,
+        endpoint: Endpoint,
+        index: Optional[MarkdownIndex] = None
+    ) -> Dict[str, List[str]]:
         """Извлекает примеры из секции responses в Markdown"""
         examples = {}
         
         # Ищем секцию с ответами для этого эндпоинта
-        pattern = rf"###\s*`{endpoint.method}`\s+{re.escape(endpoint.path)}"
-        match = re.search(pattern, markdown)
-        if not match:
+        start = self._find_endpoint_header(markdown, endpoint, index)
+        if start is None:
             return examples
         
-        endpoint_section = markdown[match.start():]
+        endpoint_section = markdown[start:]
         
         # Ищем коды ответов
         response_pattern = r"######\s*\*\*Код\s+(\d+):\*\*"
@@ -273,17 +353,22 @@ class DocumentationVerifier:
         
         return examples
     
-    def _extract_example_values_from_markdown(self, markdown: str, endpoint: Endpoint, code: str) -> List:
+    def _extract_example_values_from_markdown(
+        self,
+        markdown: str,
+        endpoint: Endpoint,
+        code: str,
+        index: Optional[MarkdownIndex] = None
+    ) -> List:
         """Извлекает значения примеров из Markdown для сравнения"""
         values = []
         
         # Ищем секцию с ответами для этого эндпоинта
-        pattern = rf"###\s*`{endpoint.method}`\s+{re.escape(endpoint.path)}"
-        match = re.search(pattern, markdown)
-        if not match:
+        start = self._find_endpoint_header(markdown, endpoint, index)
+        if start is None:
             return values
         
-        endpoint_section = markdown[match.start():]
+        endpoint_section = markdown[start:]
         
         # Ищем код ответа
         response_pattern = rf"######\s*\*\*Код\s+{code}:\*\*"
@@ -338,16 +423,20 @@ class DocumentationVerifier:
         
         return examples
     
-    def _extract_examples_from_markdown_parameters(self, markdown: str, endpoint: Endpoint) -> Dict[str, List]:
+    def _extract_examples_from_markdown_parameters(
+        self,
+        markdown: str,
+        endpoint: Endpoint,
+        index: Optional[MarkdownIndex] = None
+    ) -> Dict[str, List]:
         """Извлекает примеры из секции parameters в Markdown"""
         examples = {}
         
-        pattern = rf"###\s*`{endpoint.method}`\s+{re.escape(endpoint.path)}"
-        match = re.search(pattern, markdown)
-        if not match:
+        start = self._find_endpoint_header(markdown, endpoint, index)
+        if start is None:
             return examples
         
-        endpoint_section = markdown[match.start():match.start() + 3000]
+        endpoint_section = markdown[start:start + 3000]
         
         # Ищем секцию с примерами параметров
         param_examples_pattern = r"#### Примеры параметров\s*\*\*([^*]+)\*\*\s*\*\*Пример\s+\d+:\*\*\s*`([^`]+)`"
@@ -376,16 +465,20 @@ class DocumentationVerifier:
         
         return examples
     
-    def _extract_examples_from_markdown_request_body(self, markdown: str, endpoint: Endpoint) -> List[str]:
+    def _extract_examples_from_markdown_request_body(
+        self,
+        markdown: str,
+        endpoint: Endpoint,
+        index: Optional[MarkdownIndex] = None
+    ) -> List[str]:
         """Извлекает примеры из секции requestBody в Markdown"""
         examples = []
         
-        pattern = rf"###\s*`{endpoint.method}`\s+{re.escape(endpoint.path)}"
-        match = re.search(pattern, markdown)
-        if not match:
+        start = self._find_endpoint_header(markdown, endpoint, index)
+        if start is None:
             return examples
         
-        endpoint_section = markdown[match.start():match.start() + 5000]
+        endpoint_section = markdown[start:start + 5000]
         
         # Ищем примеры в секции requestBody
         example_pattern = r'\*\*([^*]+):\*\*'
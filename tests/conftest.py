@@ -5,6 +5,14 @@ from pathlib import Path
 from typing import Dict, Set, Tuple
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_home(tmp_path, monkeypatch):
+    """Направляет дисковые кеши CLI во временный каталог вместо ~/.cache"""
+    cache_home = tmp_path / "xdg-cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home
+
+
 @pytest.fixture
 def fixtures_dir():
     """Возвращает путь к директории с фикстурами"""
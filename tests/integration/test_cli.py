@@ -1,9 +1,11 @@
 """Тесты для CLI команд в cli.py (объединенный интерфейс)"""
+import io
+import sys
 import pytest
 import json
 from pathlib import Path
 from click.testing import CliRunner
-from cli import cli
+from cli import cli, _echo_lines
 
 
 @pytest.mark.integration
@@ -23,6 +25,75 @@ class TestEndpointCommand:
         assert "/api/v1/users" in result.output
         assert "get_users" in result.output or "Get users" in result.output
     
+    def test_endpoint_command_json_output(self, sample_spec_path):
+        """Тест что операция выводится как JSON с отступом в 2 пробела"""
+        runner = CliRunner()
+        result = runner.invoke(
+            cli,
+            ['endpoint', '--spec', sample_spec_path, '--path', '/api/v1/users', '--method', 'get']
+        )
+        
+        spec = json.loads(Path(sample_spec_path).read_text(encoding='utf-8'))
+        operation = spec['paths']['/api/v1/users']['get']
+        assert result.exit_code == 0
+        assert json.dumps(operation, indent=2, ensure_ascii=False) in result.output
+    
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_endpoint_command_json_output_with_floats(self, tmp_path, monkeypatch, use_orjson):
+        """Тест вывода вещественных чисел с экспонентой через orjson и через json"""
+        if use_orjson:
+            pytest.importorskip("orjson")
+            expected_number = '"maximum": 1e20'
+        else:
+            monkeypatch.setattr('cli.orjson', None)
+            expected_number = '"maximum": 1e+20'
+        operation = {
+            "summary": "Get value",
+            "parameters": [{
+                "name": "value",
+                "in": "query",
+                "schema": {"type": "number", "maximum": 1e20, "minimum": 1e-07, "default": 0.5}
+            }]
+        }
+        spec_path = tmp_path / "openapi.json"
+        spec_path.write_text(json.dumps({
+            "openapi": "3.0.0",
+            "info": {"title": "Test", "version": "1.0.0"},
+            "paths": {"/value": {"get": operation}}
+        }), encoding='utf-8')
+        
+        runner = CliRunner()
+        result = runner.invoke(
+            cli,
+            ['endpoint', '--spec', str(spec_path), '--path', '/value', '--method', 'get']
+        )
+        
+        assert result.exit_code == 0
+        assert expected_number in result.output
+        start = result.output.index('{')
+        end = result.output.rindex('}') + 1
+        assert json.loads(result.output[start:end]) == operation
+    
+    def test_endpoint_command_non_utf8_stdout(self, sample_spec_path):
+        """Тест вывода кириллицы в stdout с кодировкой, отличной от UTF-8"""
+        runner = CliRunner(charset='cp1251')
+        result = runner.invoke(
+            cli,
+            ['endpoint', '--spec', sample_spec_path, '--path', '/api/v1/users', '--method', 'get']
+        )
+        
+        assert result.exit_code == 0
+        assert "Информация для GET /api/v1/users:" in result.output
+    
+    def test_echo_lines_without_binary_buffer(self, monkeypatch):
+        """Тест вывода в stdout без бинарного буфера"""
+        stdout = io.StringIO()
+        monkeypatch.setattr(sys, 'stdout', stdout)
+        
+        _echo_lines(["Схема 'User':".encode('utf-8'), b'{}'])
+        
+        assert stdout.getvalue() == "Схема 'User':\n{}\n"
+    
     def test_endpoint_command_not_found_path(self, sample_spec_path):
         """Тест когда путь эндпоинта не найден"""
         runner = CliRunner()
@@ -400,6 +471,25 @@ class TestGenerateMdCommand:
         assert "Sample API" in content
         assert len(content) > 0
     
+    def test_generate_md_command_error_keeps_output(self, tmp_path):
+        """Тест что при ошибке существующий файл вывода не перезаписывается"""
+        runner = CliRunner()
+        output_file = tmp_path / "documentation.md"
+        output_file.write_text("old", encoding='utf-8')
+        
+        result = runner.invoke(
+            cli,
+            [
+                'generate-md',
+                '--spec', str(tmp_path / "missing.json"),
+                '--output', str(output_file)
+            ]
+        )
+        
+        assert result.exit_code != 0
+        assert output_file.read_text(encoding='utf-8') == "old"
+        assert list(tmp_path.iterdir()) == [output_file]
+    
     def test_generate_md_command_all_schemas(self, sample_spec_path):
         """Тест генерации со всеми схемами"""
         runner = CliRunner()
@@ -600,3 +690,26 @@ class TestCLIErrorHandling:
         assert result.exit_code == 1
         assert "не найден" in result.output.lower() or "not found" in result.output.lower()
 
+
+
+@pytest.mark.integration
+class TestVerifyCommand:
+    """Тесты для команды verify"""
+    
+    def test_verify_command_saves_json_report(self, sample_spec_path, tmp_path):
+        """Тест сохранения отчета проверки в JSON"""
+        markdown_file = tmp_path / "api.md"
+        output_file = tmp_path / "report.json"
+        runner = CliRunner()
+        runner.invoke(cli, ['generate-md', '--spec', sample_spec_path, '--output', str(markdown_file)])
+        
+        result = runner.invoke(
+            cli,
+            ['verify', '--spec', sample_spec_path, '--markdown', str(markdown_file),
+             '--output', str(output_file)]
+        )
+        
+        assert result.exit_code == 0
+        report = json.loads(output_file.read_text(encoding='utf-8'))
+        assert report['total_endpoints'] > 0
+        assert output_file.read_text(encoding='utf-8') == json.dumps(report, indent=2, ensure_ascii=False)
@@ -0,0 +1,120 @@
+"""Тесты для adapters/input/endpoints_filter_loader.py"""
+import pytest
+from adapters.input.endpoints_filter_loader import (
+    FileEndpointsFilterLoader,
+    load_endpoints_filter
+)
+from ports.endpoints_filter_loader import EndpointsFilterLoader
+
+
+@pytest.mark.unit
+class TestFileEndpointsFilterLoader:
+    """Тесты для FileEndpointsFilterLoader"""
+    
+    def test_implements_interface(self):
+        """Тест что FileEndpointsFilterLoader реализует EndpointsFilterLoader"""
+        loader = FileEndpointsFilterLoader()
+        assert isinstance(loader, EndpointsFilterLoader)
+    
+    def test_load_success(self, endpoints_filter_file, expected_endpoints_filter):
+        """Тест успешной загрузки фильтра"""
+        loader = FileEndpointsFilterLoader()
+        endpoints = loader.load(endpoints_filter_file)
+        
+        assert endpoints == expected_endpoints_filter
+    
+    def test_load_skips_comments_and_empty_lines(self, endpoints_filter_with_comments):
+        """Тест пропуска комментариев и пустых строк"""
+        loader = FileEndpointsFilterLoader()
+        endpoints = loader.load(endpoints_filter_with_comments)
+        
+        assert len(endpoints) == 3
+        assert ("GET", "/api/v1/users") in endpoints
+    
+    def test_load_normalizes_method_and_whitespace(self, tmp_path):
+        """Тест нормализации метода и пробельных символов"""
+        filter_file = tmp_path / "endpoints.txt"
+        filter_file.write_bytes(b"  get\t/api/v1/users  \r\npost /api/v1/posts\r\n")
+        
+        loader = FileEndpointsFilterLoader()
+        endpoints = loader.load(str(filter_file))
+        
+        assert endpoints == {("GET", "/api/v1/users"), ("POST", "/api/v1/posts")}
+    
+    def test_load_ignores_invalid_lines(self, endpoints_filter_invalid_format):
+        """Тест игнорирования строк без пути"""
+        loader = FileEndpointsFilterLoader()
+        endpoints = loader.load(endpoints_filter_invalid_format)
+        
+        assert endpoints == {("GET", "/api/v1/users"), ("POST", "/api/v1/posts")}
+    
+    def test_load_utf8_path(self, tmp_path):
+        """Тест чтения пути с не-ASCII символами"""
+        filter_file = tmp_path / "endpoints.txt"
+        filter_file.write_text("GET /api/v1/пользователи\n", encoding='utf-8')
+        
+        loader = FileEndpointsFilterLoader()
+        assert loader.load(str(filter_file)) == {("GET", "/api/v1/пользователи")}
+    
+    def test_load_empty_source(self):
+        """Тест пустого источника"""
+        loader = FileEndpointsFilterLoader()
+        assert loader.load("") == set()
+    
+    def test_load_file_not_found(self):
+        """Тест обработки отсутствующего файла"""
+        loader = FileEndpointsFilterLoader()
+        
+        with pytest.raises(FileNotFoundError, match="не найден"):
+            loader.load("/nonexistent/endpoints.txt")
+    
+    def test_legacy_function(self, endpoints_filter_file):
+        """Тест legacy функции load_endpoints_filter"""
+        endpoints = load_endpoints_filter(endpoints_filter_file)
+        assert ("GET", "/api/v1/users") in endpoints
+    
+    def test_load_indented_comment_and_path_with_spaces(self, tmp_path):
+        """Тест отступа перед комментарием и пробелов внутри пути"""
+        filter_file = tmp_path / "endpoints.txt"
+        filter_file.write_text("   # GET /skipped\nGET /api/v1/a b\n", encoding='utf-8')
+        
+        loader = FileEndpointsFilterLoader()
+        assert loader.load(str(filter_file)) == {("GET", "/api/v1/a b")}
+    
+    def test_load_uses_cache_for_unchanged_file(self, endpoints_filter_file):
+        """Тест что повторная загрузка неизмененного файла берется из кеша"""
+        loader = FileEndpointsFilterLoader()
+        first = loader.load(endpoints_filter_file)
+        second = loader.load(endpoints_filter_file)
+        
+        assert isinstance(first, frozenset)
+        assert first is second
+    
+    def test_load_reloads_modified_file(self, tmp_path):
+        """Тест что измененный файл фильтра загружается заново"""
+        loader = FileEndpointsFilterLoader()
+        filter_file = tmp_path / "endpoints.txt"
+        filter_file.write_text("GET /a\n", encoding='utf-8')
+        first = loader.load(str(filter_file))
+        
+        filter_file.write_text("POST /bb\n", encoding='utf-8')
+        second = loader.load(str(filter_file))
+        
+        assert first == {("GET", "/a")}
+        assert second == {("POST", "/bb")}
+    
+    def test_load_shares_method_strings(self, tmp_path):
+        """Тест что одинаковые методы представлены одной строкой"""
+        filter_file = tmp_path / "endpoints.txt"
+        filter_file.write_text("get /a\nGET /b\nPurge /c\npurge /d\n", encoding='utf-8')
+        
+        loader = FileEndpointsFilterLoader()
+        methods = {path: method for method, path in loader.load(str(filter_file))}
+        
+        assert methods["/a"] is methods["/b"]
+        assert methods["/c"] == "PURGE"
+        assert methods["/c"] is methods["/d"]
+    
+    def test_legacy_function_reuses_loader_cache(self, endpoints_filter_file):
+        """Тест что legacy функция использует общий загрузчик с кешем"""
+        assert load_endpoints_filter(endpoints_filter_file) is load_endpoints_filter(endpoints_filter_file)
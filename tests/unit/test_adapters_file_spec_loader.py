@@ -4,9 +4,10 @@ import json
 import tempfile
 from pathlib import Path
 from unittest.mock import patch, mock_open
-from adapters.input.file_spec_loader import FileSpecLoader
+from adapters.input.file_spec_loader import FileSpecLoader, _has_long_number
 from domain.models import OpenAPISpec
-from ports.spec_loader import SpecLoader
+from ports.spec_loader import SpecLoader, StreamingSpecLoader
+from domain.services import EndpointFinder
 
 
 @pytest.mark.unit
@@ -17,6 +18,7 @@ class TestFileSpecLoader:
         """Тест что FileSpecLoader реализует SpecLoader"""
         loader = FileSpecLoader()
         assert isinstance(loader, SpecLoader)
+        assert isinstance(loader, StreamingSpecLoader)
     
     def test_load_success(self, sample_spec_path):
         """Тест успешной загрузки спецификации"""
@@ -151,3 +153,225 @@ class TestFileSpecLoader:
         assert spec.info['title'] == "Тест API"
         assert "русскими" in spec.info['description']
 
+    
+    def test_load_without_orjson_fallback(self, sample_spec_path, monkeypatch):
+        """Тест загрузки через стандартный json при отсутствии orjson"""
+        monkeypatch.setattr('adapters.input.file_spec_loader.orjson', None)
+        monkeypatch.setattr('adapters.input.file_spec_loader.ujson', None)
+        loader = FileSpecLoader()
+        spec = loader.load(sample_spec_path)
+        
+        assert isinstance(spec, OpenAPISpec)
+        assert spec.info['title'] == "Sample API"
+    
+    def test_load_with_ujson_fallback(self, sample_spec_path, monkeypatch):
+        """Тест загрузки через ujson при отсутствии orjson"""
+        pytest.importorskip('ujson')
+        monkeypatch.setattr('adapters.input.file_spec_loader.orjson', None)
+        spec = FileSpecLoader().load(sample_spec_path)
+        
+        assert spec.info['title'] == "Sample API"
+    
+    def test_load_invalid_json_with_ujson(self, tmp_path, monkeypatch):
+        """Тест обработки невалидного JSON при разборе через ujson"""
+        pytest.importorskip('ujson')
+        monkeypatch.setattr('adapters.input.file_spec_loader.orjson', None)
+        test_file = tmp_path / "invalid.json"
+        test_file.write_text('{"paths": ', encoding='utf-8')
+        
+        with pytest.raises(ValueError, match="Невалидный JSON"):
+            FileSpecLoader().load(str(test_file))
+    
+    def test_load_uses_cache_for_unchanged_file(self, sample_spec_path):
+        """Тест что повторная загрузка неизмененного файла берется из кеша"""
+        loader = FileSpecLoader()
+        first = loader.load(sample_spec_path)
+        second = loader.load(sample_spec_path)
+        
+        assert first is second
+    
+    def test_load_reloads_modified_file(self, tmp_path):
+        """Тест что измененный файл загружается заново"""
+        loader = FileSpecLoader()
+        test_file = tmp_path / "test.json"
+        test_file.write_text('{"info": {"title": "Old"}}', encoding='utf-8')
+        first = loader.load(str(test_file))
+        
+        test_file.write_text('{"info": {"title": "New title"}}', encoding='utf-8')
+        second = loader.load(str(test_file))
+        
+        assert first.info['title'] == "Old"
+        assert second.info['title'] == "New title"
+    
+    def test_cache_is_bounded(self, tmp_path):
+        """Тест что кеш не превышает CACHE_SIZE"""
+        loader = FileSpecLoader()
+        for i in range(FileSpecLoader.CACHE_SIZE + 2):
+            test_file = tmp_path / f"spec_{i}.json"
+            test_file.write_text('{"paths": {}}', encoding='utf-8')
+            loader.load(str(test_file))
+        
+        assert len(loader._cache) == FileSpecLoader.CACHE_SIZE
+    
+    def test_load_large_file_via_mmap(self, tmp_path, monkeypatch):
+        """Тест загрузки файла больше порога через mmap"""
+        monkeypatch.setattr(FileSpecLoader, 'MMAP_THRESHOLD', 10)
+        loader = FileSpecLoader()
+        test_file = tmp_path / "large.json"
+        test_file.write_text('{"info": {"title": "Большой API"}}', encoding='utf-8')
+        
+        spec = loader.load(str(test_file))
+        assert spec.info['title'] == "Большой API"
+    
+    def test_load_large_invalid_json_via_mmap(self, tmp_path, monkeypatch):
+        """Тест обработки невалидного JSON при загрузке через mmap"""
+        monkeypatch.setattr(FileSpecLoader, 'MMAP_THRESHOLD', 10)
+        loader = FileSpecLoader()
+        test_file = tmp_path / "large.json"
+        test_file.write_text("{ invalid json, invalid json }", encoding='utf-8')
+
+        with pytest.raises(ValueError, match="Невалидный JSON"):
+            loader.load(str(test_file))
+
+    @pytest.mark.parametrize("mmap_threshold", [1 << 30, 10])
+    def test_load_nan_and_infinity(self, tmp_path, monkeypatch, mmap_threshold):
+        """Тест загрузки NaN и Infinity, которые допускает стандартный json"""
+        monkeypatch.setattr(FileSpecLoader, 'MMAP_THRESHOLD', mmap_threshold)
+        test_file = tmp_path / "nan.json"
+        test_file.write_text('{"info": {"title": "NaN API"}, "x-limits": [NaN, Infinity, -Infinity]}', encoding='utf-8')
+
+        spec = FileSpecLoader().load(str(test_file))
+
+        nan, inf, neg_inf = spec.raw['x-limits']
+        assert nan != nan
+        assert (inf, neg_inf) == (float('inf'), float('-inf'))
+
+    def test_load_big_integer_without_orjson(self, tmp_path, monkeypatch):
+        """Тест что без orjson целые числа больше 64 бит читаются точно"""
+        monkeypatch.setattr('adapters.input.file_spec_loader.orjson', None)
+        test_file = tmp_path / "big_int.json"
+        test_file.write_text('{"components": {"schemas": {"N": {"maximum": 36893488147419103232}}}}', encoding='utf-8')
+
+        spec = FileSpecLoader().load(str(test_file))
+
+        assert spec.schemas['N']['maximum'] == 36893488147419103232
+
+    @pytest.mark.parametrize("mmap_threshold", [1 << 30, 10])
+    def test_load_big_integer_exact(self, tmp_path, monkeypatch, mmap_threshold):
+        """Тест что целые числа больше 64 бит читаются точно и при установленном orjson"""
+        monkeypatch.setattr(FileSpecLoader, 'MMAP_THRESHOLD', mmap_threshold)
+        test_file = tmp_path / "big_int.json"
+        test_file.write_text('{"info": {"title": "API"}, "x-id": 123456789012345678901234567890}', encoding='utf-8')
+
+        spec = FileSpecLoader().load(str(test_file))
+
+        assert spec.raw['x-id'] == 123456789012345678901234567890
+        assert type(spec.raw['x-id']) is int
+
+    def test_has_long_number_across_chunks(self, monkeypatch):
+        """Тест поиска длинного числа на границе блоков проверки"""
+        monkeypatch.setattr('adapters.input.file_spec_loader._SCAN_CHUNK_SIZE', 16)
+        data = b'{"a": "' + b'x' * 5 + b'", "b": ' + b'1' * 20 + b'}'
+
+        assert _has_long_number(data) is True
+        assert _has_long_number(data.replace(b'1' * 20, b'1' * 19)) is False
+
+    def test_iter_endpoints_small_file(self, sample_spec_path):
+        """Тест iter_endpoints для файла меньше порога потокового чтения"""
+        loader = FileSpecLoader()
+        endpoints = list(loader.iter_endpoints(sample_spec_path))
+        
+        expected = EndpointFinder.list_all(loader.load(sample_spec_path))
+        assert endpoints == expected
+    
+    def test_iter_endpoints_streaming(self, sample_spec_path, monkeypatch):
+        """Тест потокового чтения эндпоинтов через ijson"""
+        pytest.importorskip('ijson')
+        monkeypatch.setattr(FileSpecLoader, 'STREAM_THRESHOLD', 0)
+        loader = FileSpecLoader()
+        endpoints = list(loader.iter_endpoints(sample_spec_path))
+        
+        expected = EndpointFinder.list_all(FileSpecLoader().load(sample_spec_path))
+        assert endpoints == expected
+        assert not loader._cache
+    
+    def test_iter_endpoints_streaming_invalid_json(self, tmp_path, monkeypatch):
+        """Тест обработки невалидного JSON при потоковом чтении"""
+        pytest.importorskip('ijson')
+        monkeypatch.setattr(FileSpecLoader, 'STREAM_THRESHOLD', 0)
+        test_file = tmp_path / "invalid.json"
+        test_file.write_text('{"paths": {"/a": {"get": }}}', encoding='utf-8')
+        
+        with pytest.raises(ValueError, match="Невалидный JSON"):
+            list(FileSpecLoader().iter_endpoints(str(test_file)))
+    
+    def test_iter_endpoints_file_not_found(self):
+        """Тест iter_endpoints для отсутствующего файла"""
+        with pytest.raises(FileNotFoundError, match="не найден"):
+            FileSpecLoader().iter_endpoints("/nonexistent/file.json")
+    
+    def test_load_path_items(self, sample_spec_path):
+        """Тест получения элементов paths для указанных путей"""
+        loader = FileSpecLoader()
+        spec = loader.load(sample_spec_path)
+        
+        items = loader.load_path_items(sample_spec_path, {"/api/v1/users", "/missing"})
+        
+        assert items == {"/api/v1/users": spec.paths["/api/v1/users"]}
+    
+    def test_load_path_items_streaming(self, sample_spec_path, monkeypatch):
+        """Тест потокового получения элементов paths через ijson"""
+        pytest.importorskip('ijson')
+        monkeypatch.setattr(FileSpecLoader, 'STREAM_THRESHOLD', 0)
+        loader = FileSpecLoader()
+        
+        items = loader.load_path_items(sample_spec_path, {"/api/v1/users", "/missing"})
+        
+        expected = FileSpecLoader().load(sample_spec_path).paths["/api/v1/users"]
+        assert items == {"/api/v1/users": expected}
+        assert not loader._cache
+    
+    def test_disk_cache_disabled_by_default(self, sample_spec_path, monkeypatch):
+        """Тест что без cache_dir дисковый кеш не используется"""
+        monkeypatch.setattr(FileSpecLoader, 'DISK_CACHE_THRESHOLD', 0)
+        loader = FileSpecLoader()
+        
+        assert loader.cache_dir is None
+        assert loader.load(sample_spec_path).paths
+    
+    def test_disk_cache_reused_across_loaders(self, sample_spec_path, tmp_path, monkeypatch):
+        """Тест что дисковый кеш используется новым экземпляром загрузчика"""
+        monkeypatch.setattr(FileSpecLoader, 'DISK_CACHE_THRESHOLD', 0)
+        cache_dir = tmp_path / "cache"
+        expected = FileSpecLoader(cache_dir=str(cache_dir)).load(sample_spec_path).raw
+        assert len(list(cache_dir.glob("*.pkl"))) == 1
+        
+        def fail_parse(data):
+            raise AssertionError("JSON не должен парситься повторно")
+        monkeypatch.setattr('adapters.input.file_spec_loader._parse_json', fail_parse)
+        
+        spec = FileSpecLoader(cache_dir=str(cache_dir)).load(sample_spec_path)
+        assert spec.raw == expected
+    
+    def test_disk_cache_ignores_corrupted_entry(self, sample_spec_path, tmp_path, monkeypatch):
+        """Тест что поврежденная запись дискового кеша считается промахом"""
+        monkeypatch.setattr(FileSpecLoader, 'DISK_CACHE_THRESHOLD', 0)
+        cache_dir = tmp_path / "cache"
+        FileSpecLoader(cache_dir=str(cache_dir)).load(sample_spec_path)
+        for entry in cache_dir.glob("*.pkl"):
+            entry.write_bytes(b"not a pickle")
+        
+        spec = FileSpecLoader(cache_dir=str(cache_dir)).load(sample_spec_path)
+        assert "/api/v1/users" in spec.paths
+    
+    def test_disk_cache_is_bounded(self, tmp_path, monkeypatch):
+        """Тест что дисковый кеш не превышает DISK_CACHE_MAX_BYTES"""
+        monkeypatch.setattr(FileSpecLoader, 'DISK_CACHE_THRESHOLD', 0)
+        monkeypatch.setattr(FileSpecLoader, 'DISK_CACHE_MAX_BYTES', 1)
+        cache_dir = tmp_path / "cache"
+        test_file = tmp_path / "spec.json"
+        test_file.write_text('{"openapi": "3.0.0", "paths": {}}', encoding='utf-8')
+        
+        FileSpecLoader(cache_dir=str(cache_dir)).load(str(test_file))
+        
+        assert not list(cache_dir.glob("*.pkl"))
@@ -1,4 +1,6 @@
 """Тесты для domain/models.py"""
+import copy
+import pickle
 import pytest
 from domain.models import OpenAPISpec, Endpoint, Schema, EndpointFilter
 
@@ -47,6 +49,43 @@ class TestOpenAPISpec:
         
         with pytest.raises(Exception):
             spec.paths = {}
+    
+    def test_sections_are_read_only_views(self, sample_openapi_spec):
+        """Тест что секции - представления raw только для чтения, без копирования"""
+        spec = OpenAPISpec.from_dict(sample_openapi_spec)
+        
+        with pytest.raises(TypeError):
+            spec.paths["/new"] = {}
+        
+        sample_openapi_spec["paths"]["/added"] = {}
+        assert "/added" in spec.paths
+    
+    def test_pickle_and_copy(self, sample_openapi_spec):
+        """Тест что OpenAPISpec поддерживает pickle и deepcopy"""
+        spec = OpenAPISpec.from_dict(sample_openapi_spec)
+        
+        assert pickle.loads(pickle.dumps(spec)) == spec
+        assert copy.deepcopy(spec) == spec
+    
+    def test_paths_normalized(self):
+        """Тест индекса путей без trailing slash"""
+        spec = OpenAPISpec.from_dict({
+            "openapi": "3.0.0",
+            "info": {"title": "Test", "version": "1.0.0"},
+            "paths": {
+                "/items/": {"get": {}},
+                "/items": {"post": {}},
+                "/orders/": {"get": {}},
+                "/": {"get": {}}
+            }
+        })
+        index = spec.paths_normalized
+        
+        assert index["/items"] == ("/items", {"post": {}})
+        assert index["/orders"] == ("/orders/", {"get": {}})
+        assert index[""] == ("/", {"get": {}})
+        assert spec.paths_normalized is index
+        assert spec == OpenAPISpec.from_dict(spec.raw)
 
 
 @pytest.mark.unit
@@ -84,6 +123,15 @@ class TestEndpoint:
         
         assert endpoint.method == "POST"
     
+    def test_method_strings_are_shared(self):
+        """Тест что эндпоинты с одним методом разделяют строку метода"""
+        first = Endpoint(path="/a", method="get", operation={}, tags=[])
+        second = Endpoint(path="/b", method="".join(["g", "et"]), operation={}, tags=[])
+        custom = Endpoint(path="/c", method="purge", operation={}, tags=[])
+        
+        assert first.method is second.method
+        assert custom.method == "PURGE"
+    
     def test_immutability(self):
         """Тест неизменяемости Endpoint"""
         operation = {"tags": ["test"]}
@@ -96,6 +144,19 @@ class TestEndpoint:
         
         with pytest.raises(Exception):
             endpoint.path = "/new"
+    
+    def test_slots_without_instance_dict(self):
+        """Тест что Endpoint хранит поля в __slots__ без __dict__"""
+        endpoint = Endpoint(path="/test", method="get", operation={}, tags=[])
+        
+        assert not hasattr(endpoint, '__dict__')
+    
+    def test_pickle_and_copy(self):
+        """Тест что Endpoint со __slots__ поддерживает pickle и deepcopy"""
+        endpoint = Endpoint(path="/test", method="get", operation={"summary": "s"}, tags=["t"])
+        
+        assert pickle.loads(pickle.dumps(endpoint)) == endpoint
+        assert copy.deepcopy(endpoint) == endpoint
 
 
 @pytest.mark.unit
@@ -176,6 +237,46 @@ class TestEndpointFilter:
         assert ("POST", "/test2") in filter_obj.endpoints
         assert ("get", "/test") not in filter_obj.endpoints
     
+    def test_from_set_stores_both_slash_variants(self):
+        """Тест что для каждого пути хранятся варианты с trailing slash и без"""
+        filter_obj = EndpointFilter.from_set({("get", "/test/"), ("GET", "/")})
+        
+        assert filter_obj.endpoints == frozenset({
+            ("GET", "/test"), ("GET", "/test/"), ("GET", ""), ("GET", "/")
+        })
+        assert filter_obj.matches("GET", "/") is True
+    
+    def test_endpoints_list_converted_to_frozenset(self):
+        """Тест что коллекция, переданная напрямую, хранится как frozenset"""
+        filter_obj = EndpointFilter(endpoints=[("GET", "/test"), ("GET", "/test")])
+        
+        assert type(filter_obj.endpoints) is frozenset
+        assert filter_obj.matches("GET", "/test/") is True
+
+    def test_direct_construction_with_trailing_slash(self):
+        """Тест что фильтр, созданный напрямую с trailing slash, совпадает с обоими вариантами пути"""
+        filter_obj = EndpointFilter(endpoints={("GET", "/users/")})
+
+        assert filter_obj.matches("GET", "/users/") is True
+        assert filter_obj.matches("GET", "/users") is True
+        assert filter_obj == EndpointFilter.from_set({("GET", "/users")})
+
+    def test_from_set_accepts_list(self):
+        """Тест создания фильтра из списка кортежей"""
+        filter_obj = EndpointFilter.from_set([("post", "/users")])
+        
+        assert filter_obj.matches("POST", "/users") is True
+
+    def test_paths_by_method(self):
+        """Тест группировки путей фильтра по методу"""
+        filter_obj = EndpointFilter.from_set([("get", "/users/"), ("GET", "/posts"), ("POST", "/users")])
+
+        assert filter_obj.paths_by_method() == {
+            "GET": frozenset({"/users", "/users/", "/posts", "/posts/"}),
+            "POST": frozenset({"/users", "/users/"}),
+        }
+        assert EndpointFilter.empty().paths_by_method() == {}
+
     def test_empty_filter(self):
         """Тест пустого фильтра"""
         filter_obj = EndpointFilter.empty()
@@ -1,7 +1,7 @@
 """Тесты для domain/services.py"""
 import pytest
 from domain.models import OpenAPISpec, Endpoint
-from domain.services import EndpointFinder, SchemaResolver, SchemaCollector
+from domain.services import EndpointFinder, SchemaResolver, SchemaCollector, _NOT_FOUND
 
 
 @pytest.mark.unit
@@ -72,6 +72,71 @@ class TestEndpointFinder:
         
         assert len(endpoints) > 0
         assert all(isinstance(e, Endpoint) for e in endpoints)
+    
+    def test_list_all_with_filter_set(self, sample_openapi_spec):
+        """Тест получения списка эндпоинтов с фильтром"""
+        spec = OpenAPISpec.from_dict(sample_openapi_spec)
+        endpoints = EndpointFinder.list_all(spec, frozenset({("POST", "/api/v1/users")}))
+        
+        assert [(e.method, e.path) for e in endpoints] == [("POST", "/api/v1/users")]
+    
+    def test_untagged_endpoints_get_default_tags_list(self):
+        """Тест что эндпоинты без тегов получают отдельный список с тегом по умолчанию"""
+        spec = OpenAPISpec.from_dict({
+            "openapi": "3.0.0",
+            "info": {"title": "Test", "version": "1.0"},
+            "paths": {
+                "/a": {"get": {"responses": {}}},
+                "/b": {"get": {"tags": [], "responses": {}}},
+                "/c": {"get": {"responses": {}}}
+            }
+        })
+        first, empty, second = EndpointFinder.list_all(spec)
+        found = EndpointFinder.find(spec, "/a", "GET")
+        
+        assert first.tags == ["Без тега"]
+        assert type(first.tags) is list
+        assert first.tags is not second.tags
+        assert empty.tags == []
+        assert found.tags == ["Без тега"]
+        assert type(found.tags) is list
+    
+    def test_iter_all(self, sample_openapi_spec):
+        """Тест ленивого обхода эндпоинтов"""
+        spec = OpenAPISpec.from_dict(sample_openapi_spec)
+        endpoints = EndpointFinder.iter_all(spec)
+        
+        assert not isinstance(endpoints, list)
+        assert [(e.method, e.path) for e in endpoints] == [
+            (e.method, e.path) for e in EndpointFinder.list_all(spec)
+        ]
+    
+    def test_list_keys(self, sample_openapi_spec):
+        """Тест получения параллельных списков методов и путей"""
+        spec = OpenAPISpec.from_dict(sample_openapi_spec)
+        methods, paths = EndpointFinder.list_keys(spec)
+        
+        endpoints = EndpointFinder.list_all(spec)
+        assert list(zip(methods, paths)) == [(e.method, e.path) for e in endpoints]
+    
+    def test_list_keys_skips_non_method_keys(self):
+        """Тест пропуска не-HTTP ключей и нормализации регистра методов"""
+        spec = OpenAPISpec.from_dict({
+            "openapi": "3.0.0",
+            "info": {"title": "Test", "version": "1.0"},
+            "paths": {
+                "/items": {
+                    "parameters": [],
+                    "summary": "Items",
+                    "Get": {"responses": {}},
+                    "post": {"responses": {}},
+                }
+            }
+        })
+        methods, paths = EndpointFinder.list_keys(spec)
+        
+        assert methods == ["GET", "POST"]
+        assert paths == ["/items", "/items"]
 
 
 @pytest.mark.unit
@@ -119,6 +184,51 @@ class TestSchemaResolver:
         # Должен использовать кеш
         assert resolved1 == resolved2
     
+    def test_resolve_returns_spec_dict_by_reference(self, sample_openapi_spec):
+        """Тест что резолвер возвращает словарь спецификации без копирования"""
+        spec = OpenAPISpec.from_dict(sample_openapi_spec)
+        resolver = SchemaResolver(spec)
+        
+        resolved = resolver.resolve("#/components/schemas/User")
+        
+        assert resolved is sample_openapi_spec["components"]["schemas"]["User"]
+    
+    def test_resolve_caches_missing_refs(self, sample_openapi_spec):
+        """Тест что неразрешенные ссылки тоже кешируются"""
+        spec = OpenAPISpec.from_dict(sample_openapi_spec)
+        resolver = SchemaResolver(spec)
+        
+        first = resolver.resolve("#/components/schemas/Nonexistent")
+        
+        assert resolver._cache["#/components/schemas/Nonexistent"] is _NOT_FOUND
+        second = resolver.resolve("#/components/schemas/Nonexistent")
+        assert first == second == {}
+        # Вызывающий код получает собственный словарь, а не общий
+        assert first is not second
+    
+    def test_resolve_cache_is_bounded(self, sample_openapi_spec, monkeypatch):
+        """Тест вытеснения давно использованных ссылок из кеша"""
+        monkeypatch.setattr(SchemaResolver, 'CACHE_SIZE', 2)
+        spec = OpenAPISpec.from_dict(sample_openapi_spec)
+        resolver = SchemaResolver(spec)
+        
+        resolver.resolve("#/components/schemas/A")
+        resolver.resolve("#/components/schemas/B")
+        resolver.resolve("#/components/schemas/A")
+        resolver.resolve("#/components/schemas/C")
+        
+        assert list(resolver._cache) == ["#/components/schemas/A", "#/components/schemas/C"]
+    
+    def test_resolve_schema_name(self, sample_openapi_spec):
+        """Тест получения имени схемы по ссылке"""
+        spec = OpenAPISpec.from_dict(sample_openapi_spec)
+        resolver = SchemaResolver(spec)
+        
+        assert resolver.resolve_schema_name("#/components/schemas/User") == "User"
+        assert resolver.resolve_schema_name("#/components/schemas/Nonexistent") is None
+        assert resolver.resolve_schema_name("#/components/parameters/User") is None
+        assert set(resolver.schema_ref_names.values()) == set(spec.schemas)
+    
     def test_resolve_max_depth(self, sample_openapi_spec):
         """Тест защиты от глубокой рекурсии"""
         spec = OpenAPISpec.from_dict(sample_openapi_spec)
@@ -151,6 +261,87 @@ class TestSchemaResolver:
         assert isinstance(processed, dict)
         assert 'x-original-ref' in processed or processed != schema
     
+    def test_process_schema_ref_is_memoized(self, sample_openapi_spec):
+        """Тест что узел из одной ссылки обрабатывается один раз"""
+        spec = OpenAPISpec.from_dict(sample_openapi_spec)
+        resolver = SchemaResolver(spec)
+        
+        first = resolver.process_schema({"$ref": "#/components/schemas/User"})
+        second = resolver.process_schema({"$ref": "#/components/schemas/User"})
+        
+        assert first is second
+        assert first['x-original-ref'] == "#/components/schemas/User"
+        
+        resolver.clear_cache()
+        assert not resolver._processed_refs
+    
+    def test_process_schema_unresolved_ref(self, sample_openapi_spec):
+        """Тест что неразрешенная ссылка возвращается без изменений"""
+        spec = OpenAPISpec.from_dict(sample_openapi_spec)
+        resolver = SchemaResolver(spec)
+        
+        processed = resolver.process_schema({"$ref": "#/components/schemas/Missing"})
+        
+        assert processed == {"$ref": "#/components/schemas/Missing"}
+    
+    def test_process_schema_reuses_nodes_without_refs(self, sample_openapi_spec):
+        """Тест что узлы без ссылок не копируются"""
+        spec = OpenAPISpec.from_dict(sample_openapi_spec)
+        resolver = SchemaResolver(spec)
+        
+        plain = {"type": "object", "properties": {"tags": {"type": "array", "items": {"type": "string"}}}}
+        assert resolver.process_schema(plain) is plain
+        
+        schema = {
+            "type": "object",
+            "properties": {
+                "user": {"$ref": "#/components/schemas/User"},
+                "name": {"type": "string"}
+            }
+        }
+        processed = resolver.process_schema(schema)
+        
+        assert processed is not schema
+        assert "$ref" in schema["properties"]["user"]
+        assert processed["properties"]["user"]["x-original-ref"] == "#/components/schemas/User"
+        assert processed["properties"]["name"] is schema["properties"]["name"]
+    
+    def test_process_schema_expands_nested_refs(self):
+        """Тест раскрытия ссылок внутри разрешенной схемы без изменения спецификации"""
+        spec = OpenAPISpec.from_dict({
+            "openapi": "3.0.0",
+            "info": {"title": "Test", "version": "1.0"},
+            "paths": {},
+            "components": {"schemas": {
+                "Order": {"type": "object", "properties": {"item": {"$ref": "#/components/schemas/Item"}}},
+                "Item": {"type": "string"}
+            }}
+        })
+        resolver = SchemaResolver(spec)
+        
+        processed = resolver.process_schema({"$ref": "#/components/schemas/Order"})
+        
+        assert processed["properties"]["item"]["x-original-ref"] == "#/components/schemas/Item"
+        assert spec.schemas["Order"]["properties"]["item"] == {"$ref": "#/components/schemas/Item"}
+    
+    def test_for_spec_shares_resolver(self, sample_openapi_spec):
+        """Тест что for_spec возвращает общий резолвер для той же спецификации"""
+        spec = OpenAPISpec.from_dict(sample_openapi_spec)
+        resolver = SchemaResolver.for_spec(spec)
+        
+        assert SchemaResolver.for_spec(spec) is resolver
+        assert resolver.spec is spec
+        assert SchemaResolver.for_spec(OpenAPISpec.from_dict(sample_openapi_spec)) is not resolver
+    
+    def test_for_spec_is_bounded(self, sample_openapi_spec):
+        """Тест что for_spec хранит ограниченное число резолверов"""
+        specs = [OpenAPISpec.from_dict(sample_openapi_spec) for _ in range(SchemaResolver.SHARED_CACHE_SIZE + 2)]
+        for spec in specs:
+            SchemaResolver.for_spec(spec)
+        
+        assert len(SchemaResolver._shared) == SchemaResolver.SHARED_CACHE_SIZE
+        assert SchemaResolver.for_spec(specs[-1]).spec is specs[-1]
+    
     def test_clear_cache(self, sample_openapi_spec):
         """Тест очистки кеша"""
         spec = OpenAPISpec.from_dict(sample_openapi_spec)
@@ -193,6 +384,72 @@ class TestSchemaCollector:
             
             assert isinstance(schemas, set)
     
+    def test_scan_operation_and_collect_from_names(self):
+        """Тест сбора схем по прямым ссылкам операций"""
+        spec = OpenAPISpec.from_dict({
+            "paths": {"/orders": {"get": {
+                "parameters": [{"name": "q", "in": "query", "schema": {"$ref": "#/components/schemas/Query"}}],
+                "responses": {"200": {"content": {"application/json": {
+                    "schema": {"$ref": "#/components/schemas/Order"}
+                }}}}
+            }}},
+            "components": {"schemas": {
+                "Query": {"type": "string"},
+                "Order": {"type": "object", "properties": {"item": {"$ref": "#/components/schemas/Item"}}},
+                "Item": {"type": "string"}
+            }}
+        })
+        collector = SchemaCollector(spec, SchemaResolver(spec))
+        operation = spec.paths["/orders"]["get"]
+        
+        refs = collector.scan_operation(operation)
+        
+        assert refs == ["Query", "Order"]
+        assert collector.collect_from_names(refs) == {"Query", "Order", "Item"}
+    
+    def test_collect_from_endpoint_is_cached(self):
+        """Тест кеширования схем операции и прямых ссылок схем"""
+        spec = OpenAPISpec.from_dict({
+            "paths": {"/orders": {"get": {"responses": {"200": {"content": {"application/json": {
+                "schema": {"$ref": "#/components/schemas/Order"}
+            }}}}}}},
+            "components": {"schemas": {
+                "Order": {"type": "object", "properties": {"item": {"$ref": "#/components/schemas/Item"}}},
+                "Item": {"type": "string"}
+            }}
+        })
+        collector = SchemaCollector(spec, SchemaResolver(spec))
+        endpoint = EndpointFinder.find(spec, "/orders", "GET")
+        
+        first = collector.collect_from_endpoint(endpoint)
+        first.add("Other")
+        second = collector.collect_from_endpoint(endpoint)
+        
+        assert second == {"Order", "Item"}
+        assert collector._schema_refs["Order"] == ("Item",)
+    
+    def test_collect_ordered(self):
+        """Тест порядка обхода в глубину с раскрытием ссылок по месту"""
+        spec = OpenAPISpec.from_dict({
+            "components": {"schemas": {
+                "A": {"type": "object", "properties": {
+                    "b": {"$ref": "#/components/schemas/B"},
+                    "c": {"$ref": "#/components/schemas/C"}
+                }},
+                "B": {"type": "array", "items": {"$ref": "#/components/schemas/D"}},
+                "C": {"$ref": "#/components/schemas/A"},
+                "D": {"type": "string"}
+            }}
+        })
+        collector = SchemaCollector(spec, SchemaResolver(spec))
+        
+        ordered = collector.collect_ordered([
+            {"$ref": "#/components/schemas/A"},
+            {"$ref": "#/components/schemas/D"}
+        ])
+        
+        assert ordered == ["A", "B", "D", "C"]
+    
     def test_collect_recursive(self, sample_openapi_spec):
         """Тест рекурсивного сбора схем"""
         spec = OpenAPISpec.from_dict(sample_openapi_spec)
@@ -232,6 +489,111 @@ class TestSchemaCollector:
         
         assert "User" in collected or "UserRole" in collected
     
+    def test_collect_from_node_recursive_schema(self):
+        """Тест что циклические ссылки не приводят к зацикливанию"""
+        spec = OpenAPISpec.from_dict({
+            "components": {"schemas": {
+                "Node": {
+                    "type": "object",
+                    "properties": {
+                        "children": {"type": "array", "items": {"$ref": "#/components/schemas/Node"}},
+                        "meta": {"$ref": "#/components/schemas/Meta"}
+                    }
+                },
+                "Meta": {"type": "object", "properties": {"owner": {"$ref": "#/components/schemas/Node"}}}
+            }}
+        })
+        collector = SchemaCollector(spec, SchemaResolver(spec))
+        
+        collected = set()
+        collector._collect_from_node({"$ref": "#/components/schemas/Node"}, collected)
+        
+        assert collected == {"Node", "Meta"}
+    
+    def test_collect_from_node_deep_nesting(self):
+        """Тест что глубокая вложенность не превышает лимит рекурсии"""
+        spec = OpenAPISpec.from_dict({
+            "components": {"schemas": {"Leaf": {"type": "string"}}}
+        })
+        collector = SchemaCollector(spec, SchemaResolver(spec))
+        
+        node = {"$ref": "#/components/schemas/Leaf"}
+        for _ in range(5000):
+            node = {"type": "array", "items": node}
+        
+        collected = set()
+        collector._collect_from_node(node, collected)
+        
+        assert collected == {"Leaf"}
+    
+    def test_collect_from_node_cyclic_container(self):
+        """Тест что цикл между объектами узла не приводит к зацикливанию"""
+        spec = OpenAPISpec.from_dict({
+            "components": {"schemas": {"Leaf": {"type": "string"}}}
+        })
+        collector = SchemaCollector(spec, SchemaResolver(spec))
+        
+        node = {"type": "object", "properties": {"leaf": {"$ref": "#/components/schemas/Leaf"}}}
+        node["properties"]["self"] = node
+        
+        collected = set()
+        collector._collect_from_node(node, collected)
+        
+        assert collected == {"Leaf"}
+    
+    def test_collect_skips_example_and_extension_values(self):
+        """Тест что ссылки внутри примеров, enum, default и x-* не собираются"""
+        spec = OpenAPISpec.from_dict({
+            "components": {"schemas": {"A": {"type": "string"}, "B": {"type": "string"}}}
+        })
+        collector = SchemaCollector(spec, SchemaResolver(spec))
+        ref = {"$ref": "#/components/schemas/A"}
+        node = {
+            "type": "object",
+            "example": {"link": ref},
+            "examples": [ref],
+            "enum": [ref],
+            "default": ref,
+            "x-extra": ref,
+            "properties": {"b": {"$ref": "#/components/schemas/B"}}
+        }
+        
+        collected = set()
+        collector._collect_from_node(node, collected)
+        
+        assert collected == {"B"}
+    
+    def test_collect_keyword_names_in_name_maps(self):
+        """Тест что свойства, коды ответов и заголовки с именами ключевых слов обходятся"""
+        spec = OpenAPISpec.from_dict({
+            "components": {"schemas": {
+                "Default": {"type": "string"},
+                "Meta": {"type": "string"},
+                "Error": {"type": "string"},
+                "Limit": {"type": "integer"}
+            }}
+        })
+        collector = SchemaCollector(spec, SchemaResolver(spec))
+        operation = {
+            "requestBody": {"content": {"application/json": {"schema": {
+                "type": "object",
+                "properties": {
+                    "default": {"$ref": "#/components/schemas/Default"},
+                    "x-meta": {"$ref": "#/components/schemas/Meta"}
+                }
+            }}}},
+            "responses": {
+                "default": {
+                    "headers": {"x-rate-limit": {"schema": {"$ref": "#/components/schemas/Limit"}}},
+                    "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Error"}}}
+                }
+            }
+        }
+        
+        refs = collector.scan_operation(operation)
+        
+        assert refs == ["Default", "Meta", "Limit", "Error"]
+    
     def test_collect_with_anyof(self, sample_openapi_spec):
         """Тест сбора схем из anyOf"""
         spec = OpenAPISpec.from_dict(sample_openapi_spec)
@@ -1,7 +1,7 @@
 """Тесты для ports/spec_loader.py"""
 import pytest
 from unittest.mock import Mock, patch
-from ports.spec_loader import SpecLoader
+from ports.spec_loader import SpecLoader, StreamingSpecLoader
 from domain.models import OpenAPISpec
 
 
@@ -135,3 +135,18 @@ class TestSpecLoader:
         assert SpecLoader.load.__doc__ is not None
         assert len(SpecLoader.load.__doc__.strip()) > 0
 
+
+
+@pytest.mark.unit
+class TestStreamingSpecLoader:
+    """Тесты для абстрактного порта StreamingSpecLoader"""
+    
+    def test_streaming_spec_loader_is_abstract(self):
+        """Тест что StreamingSpecLoader является абстрактным классом"""
+        with pytest.raises(TypeError):
+            StreamingSpecLoader()
+    
+    def test_streaming_spec_loader_extends_spec_loader(self):
+        """Тест что StreamingSpecLoader расширяет SpecLoader"""
+        assert issubclass(StreamingSpecLoader, SpecLoader)
+        assert callable(getattr(StreamingSpecLoader, 'iter_endpoints'))
@@ -1,9 +1,36 @@
 """Тесты для rendering/formatters.py"""
+import json
 import pytest
-from rendering.formatters import TypeFormatter, ExampleFormatter, DescriptionFormatter, StatsFormatter
+from rendering.formatters import RefFormatter, TypeFormatter, ExampleFormatter, DescriptionFormatter, StatsFormatter
 from domain.models import Endpoint
 
 
+@pytest.mark.unit
+class TestRefFormatter:
+    """Тесты для RefFormatter"""
+    
+    def test_info(self):
+        """Тест имени схемы и якоря из ссылки"""
+        assert RefFormatter.info('#/components/schemas/UserRole') == ('UserRole', 'userrole')
+    
+    def test_info_without_slash(self):
+        """Тест ссылки без разделителей"""
+        assert RefFormatter.info('User') == ('User', 'user')
+    
+    def test_link(self):
+        """Тест Markdown ссылки на раздел схемы"""
+        assert RefFormatter.link('#/components/schemas/UserRole') == '[UserRole](#userrole)'
+    
+    def test_link_matches_type_formatter(self, sample_openapi_spec):
+        """Тест что ссылки в типах совпадают с RefFormatter.link для всех схем"""
+        for name in sample_openapi_spec['components']['schemas']:
+            ref = '#/components/schemas/' + name
+            link = RefFormatter.link(ref)
+            assert TypeFormatter.format({'$ref': ref}) == link
+            assert TypeFormatter.format({'x-original-ref': ref, 'type': 'object'}) == link
+            assert TypeFormatter.format({'type': 'array', 'items': {'$ref': ref}}) == f"array<{link}>"
+
+
 @pytest.mark.unit
 class TestTypeFormatter:
     """Тесты для TypeFormatter"""
@@ -107,6 +134,59 @@ class TestExampleFormatter:
         assert len(result) <= 53  # 50 + "..."
         assert result.endswith("...")
     
+    def test_format_dict_matches_stdlib_json(self):
+        """Тест что словарь с целым больше 64 бит форматируется через json.dumps с отступом 2"""
+        example = {'name': 'Иван', 'ids': [1, 2], 'id': 2 ** 70, 'meta': {}}
+        result = ExampleFormatter.format(example, max_length=1000)
+        assert result == json.dumps(example, ensure_ascii=False, indent=2)
+    
+    def test_format_with_orjson_float_exponents(self):
+        """Тест что orjson записывает экспоненту короче, чем json.dumps"""
+        orjson = pytest.importorskip('orjson')
+        example = {'name': 'Иван', 'max': 1e20, 'min': 1e-07, 'ratio': 0.5}
+        result = ExampleFormatter.format(example, max_length=1000)
+        
+        assert result == orjson.dumps(example, option=orjson.OPT_INDENT_2).decode('utf-8')
+        assert '"max": 1e20' in result
+        assert '"min": 1e-7' in result
+        assert result != json.dumps(example, ensure_ascii=False, indent=2)
+        assert json.loads(result) == example
+    
+    def test_format_without_orjson_float_exponents(self, monkeypatch):
+        """Тест что без orjson экспонента записывается как в json.dumps"""
+        monkeypatch.setattr('rendering.formatters.orjson', None)
+        example = {'max': 1e20, 'min': 1e-07}
+        result = ExampleFormatter.format(example, max_length=1000)
+        
+        assert result == json.dumps(example, ensure_ascii=False, indent=2)
+        assert '"max": 1e+20' in result
+    
+    @pytest.mark.parametrize('max_length', [0, 5, 40, 10000])
+    def test_format_without_orjson_matches_stdlib_json(self, monkeypatch, max_length):
+        """Тест обрезки примера без orjson: результат как у полного json.dumps"""
+        monkeypatch.setattr('rendering.formatters.orjson', None)
+        example = {'items': [{'id': i, 'name': 'Товар'} for i in range(50)]}
+        full = json.dumps(example, ensure_ascii=False, indent=2)
+        expected = full[:max_length] + "..." if len(full) > max_length else full
+        
+        assert ExampleFormatter.format(example, max_length=max_length) == expected
+    
+    def test_format_without_orjson_stops_encoding_early(self, monkeypatch):
+        """Тест что без orjson большой пример не кодируется целиком"""
+        monkeypatch.setattr('rendering.formatters.orjson', None)
+        
+        def items():
+            for i in range(10):
+                yield i
+            raise AssertionError("Кодирование не остановилось")
+        
+        class Lazy(list):
+            def __iter__(self):
+                return items()
+        
+        result = ExampleFormatter.format(Lazy([0]), max_length=10)
+        assert result.endswith("...")
+    
     def test_extract_single_example(self):
         """Тест извлечения одиночного примера"""
         node = {'example': 'test_value'}
@@ -178,6 +258,16 @@ class TestDescriptionFormatter:
         text = "Item 1  - Item 2"
         result = DescriptionFormatter.safe_replace(text)
         assert '<br>- ' in result
+    
+    def test_safe_replace_plain_text_unchanged(self):
+        """Тест что строка без переносов и маркеров возвращается как есть"""
+        text = "Идентификатор пользователя"
+        assert DescriptionFormatter.safe_replace(text) is text
+    
+    def test_safe_replace_mixed(self):
+        """Тест замены переносов и маркеров в одной строке"""
+        text = "Статусы:\n  - active\n  - blocked"
+        assert DescriptionFormatter.safe_replace(text) == "Статусы:<br><br>- active<br><br>- blocked"
 
 
 @pytest.mark.unit
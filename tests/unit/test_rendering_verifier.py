@@ -1,6 +1,6 @@
 """Тесты для rendering/verifier.py"""
 import pytest
-from rendering.verifier import DocumentationVerifier
+from rendering.verifier import DocumentationVerifier, MarkdownIndex
 from domain.models import Endpoint
 
 
@@ -238,3 +238,41 @@ class TestDocumentationVerifier:
         assert "200" in examples
         assert len(examples["200"]) > 0
 
+
+
+@pytest.mark.unit
+class TestMarkdownIndex:
+    """Тесты для MarkdownIndex"""
+    
+    def test_find_endpoint(self):
+        """Тест поиска заголовка эндпоинта по индексу"""
+        markdown = "# API\n### `GET` /api/v1/users\ntext\n### `POST` /api/v1/users\n"
+        index = MarkdownIndex(markdown)
+        
+        assert index.find_endpoint("GET", "/api/v1/users") == markdown.index("### `GET`")
+        assert index.find_endpoint("POST", "/api/v1/users") == markdown.index("### `POST`")
+        assert index.find_endpoint("DELETE", "/api/v1/users") is None
+    
+    def test_find_endpoint_matches_prefix_like_regex(self):
+        """Тест что путь сравнивается по префиксу, как при поиске регулярным выражением"""
+        markdown = "### `GET` /api/v1/users/{id}\n### `GET` /api/v1/users\n"
+        index = MarkdownIndex(markdown)
+        
+        assert index.find_endpoint("GET", "/api/v1/users") == 0
+    
+    def test_verify_endpoint_with_index(self):
+        """Тест что проверка с индексом дает тот же результат"""
+        verifier = DocumentationVerifier()
+        endpoint = Endpoint(
+            path="/api/v1/users",
+            method="GET",
+            operation={"deprecated": True, "description": "Список пользователей"},
+            tags=[]
+        )
+        markdown = "### `GET` /api/v1/users\n> ⚠️ **Устарел**\n*Расширенное описание:* Список пользователей\n"
+        
+        with_index = verifier.verify_endpoint(endpoint, markdown, MarkdownIndex(markdown))
+        without_index = verifier.verify_endpoint(endpoint, markdown)
+        
+        assert with_index == without_index
+        assert not with_index['has_issues']
@@ -0,0 +1,95 @@
+"""Тесты для application/use_cases/errors_report.py"""
+import pytest
+from unittest.mock import Mock
+from application.use_cases.errors_report import ErrorsReportUseCase
+from domain.models import OpenAPISpec, Endpoint
+from ports.spec_loader import SpecLoader
+
+
+@pytest.mark.unit
+class TestErrorsReportUseCase:
+    """Тесты для ErrorsReportUseCase"""
+    
+    def test_execute_success(self, sample_openapi_spec):
+        """Тест успешного выполнения use case"""
+        mock_loader = Mock(spec=SpecLoader)
+        mock_loader.load.return_value = OpenAPISpec.from_dict(sample_openapi_spec)
+        
+        use_case = ErrorsReportUseCase(mock_loader)
+        report = use_case.execute("test.json")
+        
+        assert isinstance(report, list)
+        assert all({'path', 'method', 'error_codes'} <= set(item) for item in report)
+        mock_loader.load.assert_called_once_with("test.json")
+    
+    def test_extract_error_codes(self):
+        """Тест извлечения кодов ошибок и диапазонов"""
+        use_case = ErrorsReportUseCase(Mock(spec=SpecLoader))
+        endpoint = Endpoint(
+            path="/api/v1/users",
+            method="GET",
+            operation={
+                "responses": {
+                    "200": {}, "2XX": {}, "default": {},
+                    "400": {}, "404": {}, "599": {}, "600": {},
+                    "4xx": {}, "5XX": {}
+                }
+            },
+            tags=[]
+        )
+        
+        assert use_case._extract_error_codes(endpoint) == {"400", "404", "599", "4XX", "5XX"}
+    
+    def test_extract_error_codes_without_responses(self):
+        """Тест эндпоинта без responses"""
+        use_case = ErrorsReportUseCase(Mock(spec=SpecLoader))
+        endpoint = Endpoint(path="/", method="GET", operation={}, tags=[])
+        
+        assert use_case._extract_error_codes(endpoint) == set()
+    
+    def test_execute_sorts_error_codes(self):
+        """Тест сортировки кодов ошибок: коды по возрастанию, диапазон после своих кодов"""
+        spec_dict = {
+            "paths": {
+                "/a": {"get": {"responses": {"5XX": {}, "500": {}, "4XX": {}, "404": {}, "400": {}}}},
+                "/b": {"get": {"responses": {"200": {}}}}
+            }
+        }
+        mock_loader = Mock(spec=SpecLoader)
+        mock_loader.load.return_value = OpenAPISpec.from_dict(spec_dict)
+        
+        report = ErrorsReportUseCase(mock_loader).execute("test.json")
+        
+        assert report[0]['error_codes'] == ["400", "404", "4XX", "500", "5XX"]
+        assert report[1]['error_codes'] == []
+    
+    def test_format_report_statistics(self):
+        """Тест группировки и статистики в текстовом и Markdown отчетах"""
+        report_data = [
+            {'path': '/a', 'method': 'GET', 'error_codes': ['400', '404']},
+            {'path': '/b', 'method': 'POST', 'error_codes': []},
+            {'path': '/c', 'method': 'PUT', 'error_codes': ['404', '500']},
+        ]
+        use_case = ErrorsReportUseCase(Mock(spec=SpecLoader))
+        
+        text = use_case.format_report(report_data)
+        markdown = use_case.format_report(report_data, 'md')
+        
+        assert "Эндпоинты с кодами ошибок (2):" in text
+        assert "GET    /a                                       [400, 404]" in text
+        assert "POST   /b" in text
+        assert text.endswith("Всего кодов ошибок: 4\nУникальных кодов ошибок: 3\nКоды: 400, 404, 500")
+        assert "| PUT | `/c` | 404, 500 |" in markdown
+        assert "## Эндпоинты без кодов ошибок (1)" in markdown
+        assert markdown.endswith("- **Уникальных кодов ошибок:** 3\n- **Коды:** 400, 404, 500")
+    
+    def test_format_report_csv(self):
+        """Тест CSV отчета: коды через ';', пустое поле для эндпоинта без ошибок"""
+        report_data = [
+            {'path': '/a', 'method': 'GET', 'error_codes': ['400', '404']},
+            {'path': '/b', 'method': 'POST', 'error_codes': []},
+        ]
+        
+        csv = ErrorsReportUseCase(Mock(spec=SpecLoader)).format_report(report_data, 'csv')
+        
+        assert csv == "method,path,error_codes\nGET,/a,400;404\nPOST,/b,"
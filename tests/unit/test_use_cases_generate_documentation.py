@@ -1,8 +1,10 @@
 """Тесты для application/use_cases/generate_documentation.py"""
+import io
 import pytest
 from unittest.mock import Mock, patch
 from application.use_cases.generate_documentation import GenerateDocumentationUseCase
 from domain.models import OpenAPISpec, EndpointFilter
+from rendering.markdown import MarkdownGenerator
 from ports.spec_loader import SpecLoader
 from ports.endpoints_filter_loader import EndpointsFilterLoader
 
@@ -119,3 +121,171 @@ class TestGenerateDocumentationUseCase:
         with pytest.raises(IOError):
             use_case.execute("test.json")
 
+    
+    def test_execute_to_matches_execute(self, sample_openapi_spec):
+        """Тест что потоковая запись дает тот же документ, что и execute"""
+        mock_loader = Mock(spec=SpecLoader)
+        mock_loader.load.return_value = OpenAPISpec.from_dict(sample_openapi_spec)
+        
+        use_case = GenerateDocumentationUseCase(mock_loader)
+        output = io.StringIO()
+        use_case.execute_to(output, "test.json")
+        
+        assert output.getvalue() == use_case.execute("test.json")
+    
+    def test_execute_to_file_not_found(self):
+        """Тест что при ошибке загрузки в файл ничего не пишется"""
+        mock_loader = Mock(spec=SpecLoader)
+        mock_loader.load.side_effect = FileNotFoundError("Файл не найден")
+        
+        use_case = GenerateDocumentationUseCase(mock_loader)
+        output = io.StringIO()
+        
+        with pytest.raises(FileNotFoundError):
+            use_case.execute_to(output, "nonexistent.json")
+        assert output.getvalue() == ""
+    
+    def test_execute_marks_required_properties(self):
+        """Тест отметки обязательных свойств в таблице схемы"""
+        mock_loader = Mock(spec=SpecLoader)
+        mock_loader.load.return_value = OpenAPISpec.from_dict({
+            "openapi": "3.0.0",
+            "info": {"title": "API", "version": "1.0"},
+            "paths": {},
+            "components": {"schemas": {"User": {
+                "type": "object",
+                "required": ["id"],
+                "properties": {"id": {"type": "integer"}, "name": {"type": "string"}}
+            }}}
+        })
+        
+        use_case = GenerateDocumentationUseCase(mock_loader)
+        result = use_case.execute("test.json", include_all_schemas=True)
+        
+        assert "| `id` | integer | ✅ |" in result
+        assert "| `name` | string | ❌ |" in result
+
+    def test_execute_parameter_examples_from_ref_schema(self):
+        """Тест что примеры параметра берутся из схемы, подключенной через $ref"""
+        mock_loader = Mock(spec=SpecLoader)
+        mock_loader.load.return_value = OpenAPISpec.from_dict({
+            "openapi": "3.0.0",
+            "info": {"title": "API", "version": "1.0"},
+            "paths": {"/items": {"get": {
+                "parameters": [
+                    {"name": "code", "in": "query", "schema": {"$ref": "#/components/schemas/Code"}},
+                    {"name": "page", "in": "query", "example": 5,
+                     "schema": {"$ref": "#/components/schemas/Page"}}
+                ],
+                "responses": {}
+            }}},
+            "components": {"schemas": {
+                "Code": {"type": "string", "example": "ex"},
+                "Page": {"type": "object", "example": {"size": 10}}
+            }}
+        })
+        
+        use_case = GenerateDocumentationUseCase(mock_loader)
+        result = use_case.execute("test.json")
+        
+        assert "**Пример:** `ex`" in result
+        assert "`5`<br>" in result
+        assert '"size": 10' in result
+        assert "Пример отсутсвует" not in result
+
+
+@pytest.mark.unit
+class TestMarkdownGeneratorCompileEmitter:
+    """Тесты для MarkdownGenerator.compile_emitter"""
+    
+    def test_emitter_matches_generate(self, sample_openapi_spec):
+        """Тест что подготовленная генерация дает тот же документ при повторных вызовах"""
+        spec = OpenAPISpec.from_dict(sample_openapi_spec)
+        generator = MarkdownGenerator()
+        
+        emit = generator.compile_emitter(spec)
+        expected = generator.generate(spec)
+        
+        assert emit() == expected
+        assert emit() == expected
+    
+    def test_emitter_does_not_rebuild_context(self, sample_openapi_spec):
+        """Тест что повторный вызов не разрешает схемы заново"""
+        spec = OpenAPISpec.from_dict(sample_openapi_spec)
+        generator = MarkdownGenerator()
+        emit = generator.compile_emitter(spec, include_all_schemas=True)
+        
+        with patch.object(generator, '_build_context') as build_context:
+            emit()
+        
+        build_context.assert_not_called()
+    
+    def test_collector_reused_for_same_spec(self, sample_openapi_spec):
+        """Тест что коллектор схем переиспользуется повторными генерациями"""
+        spec = OpenAPISpec.from_dict(sample_openapi_spec)
+        generator = MarkdownGenerator()
+        
+        generator.generate(spec)
+        collector = generator._collector
+        generator.generate(spec)
+        
+        assert generator._collector is collector
+        generator.generate(OpenAPISpec.from_dict(sample_openapi_spec))
+        assert generator._collector is not collector
+    
+    def test_bytecode_cache_reused_between_generators(self, sample_openapi_spec, tmp_path, monkeypatch):
+        """Тест что скомпилированные шаблоны сохраняются на диск и дают тот же документ"""
+        monkeypatch.setenv('OPENAPI_SCRIBE_RENDERER', 'jinja2')
+        spec = OpenAPISpec.from_dict(sample_openapi_spec)
+        cache_dir = tmp_path / 'templates'
+        expected = MarkdownGenerator().generate(spec)
+        
+        assert MarkdownGenerator(bytecode_cache_dir=str(cache_dir)).generate(spec) == expected
+        assert any(cache_dir.iterdir())
+        assert MarkdownGenerator(bytecode_cache_dir=str(cache_dir)).generate(spec) == expected
+    
+    def test_bytecode_cache_write_errors_ignored(self, sample_openapi_spec, tmp_path):
+        """Тест что недоступный каталог кеша шаблонов не мешает генерации"""
+        spec = OpenAPISpec.from_dict(sample_openapi_spec)
+        blocker = tmp_path / 'file'
+        blocker.write_text('')
+        
+        generator = MarkdownGenerator(bytecode_cache_dir=str(blocker / 'templates'))
+        
+        assert generator.generate(spec) == MarkdownGenerator().generate(spec)
+
+    
+    def test_minijinja_matches_jinja2(self, sample_openapi_spec, monkeypatch):
+        """Тест что minijinja дает тот же документ, что и Jinja2"""
+        pytest.importorskip('minijinja')
+        sample_openapi_spec['components']['schemas']['User']['example'] = {'name': 'Иван', 'id': 1, 'tags': ['<a>']}
+        spec = OpenAPISpec.from_dict(sample_openapi_spec)
+        generator = MarkdownGenerator()
+        monkeypatch.setenv('OPENAPI_SCRIBE_RENDERER', 'jinja2')
+        jinja_generator = MarkdownGenerator()
+        
+        assert generator._minijinja_env is not None
+        assert jinja_generator._minijinja_env is None
+        assert generator.generate(spec, include_all_schemas=True) == jinja_generator.generate(spec, include_all_schemas=True)
+        output = io.StringIO()
+        generator.generate_to(output, spec)
+        assert output.getvalue() == jinja_generator.generate(spec)
+    
+    def test_jinja2_used_without_minijinja(self, sample_openapi_spec, monkeypatch):
+        """Тест рендеринга через Jinja2 при отсутствии minijinja"""
+        monkeypatch.setattr('rendering.markdown.minijinja', None)
+        generator = MarkdownGenerator()
+        
+        assert generator._minijinja_env is None
+        assert '## 📖 Схемы данных' in generator.generate(OpenAPISpec.from_dict(sample_openapi_spec))
+    
+    def test_parallel_generation_matches_sequential(self, sample_openapi_spec, monkeypatch):
+        """Тест что рендеринг эндпоинтов в процессах дает тот же документ"""
+        monkeypatch.setattr(MarkdownGenerator, 'PARALLEL_MIN_ENDPOINTS', 0)
+        spec = OpenAPISpec.from_dict(sample_openapi_spec)
+        generator = MarkdownGenerator()
+        
+        sequential = generator.generate(spec)
+        parallel = generator.generate(spec, max_workers=2)
+        
+        assert parallel == sequential
@@ -3,7 +3,7 @@ import pytest
 from unittest.mock import Mock
 from application.use_cases.get_endpoint_info import GetEndpointInfoUseCase
 from domain.models import OpenAPISpec, Endpoint
-from ports.spec_loader import SpecLoader
+from ports.spec_loader import SpecLoader, StreamingSpecLoader
 
 
 @pytest.mark.unit
@@ -52,6 +52,23 @@ class TestGetEndpointInfoUseCase:
         with pytest.raises(ValueError, match="Метод"):
             use_case.execute("test.json", "/api/v1/users", "DELETE")
     
+    def test_execute_streaming_loader_loads_only_path_items(self, sample_openapi_spec):
+        """Тест что потоковый загрузчик запрашивает только нужные элементы paths"""
+        mock_loader = Mock(spec=StreamingSpecLoader)
+        mock_loader.load_path_items.return_value = {
+            "/api/v1/users": sample_openapi_spec["paths"]["/api/v1/users"]
+        }
+        
+        use_case = GetEndpointInfoUseCase(mock_loader)
+        result = use_case.execute("test.json", "/api/v1/users/", "GET")
+        
+        assert result.path == "/api/v1/users"
+        assert result.operation == sample_openapi_spec["paths"]["/api/v1/users"]["get"]
+        mock_loader.load_path_items.assert_called_once_with(
+            "test.json", {"/api/v1/users", "/api/v1/users/"}
+        )
+        mock_loader.load.assert_not_called()
+    
     def test_execute_file_not_found(self):
         """Тест обработки случая, когда файл не найден"""
         mock_loader = Mock(spec=SpecLoader)
@@ -72,3 +89,109 @@ class TestGetEndpointInfoUseCase:
         with pytest.raises(IOError):
             use_case.execute("test.json", "/api/v1/users", "GET")
 
+    
+    def test_get_related_schemas(self, sample_openapi_spec):
+        """Тест поиска связанных схем в порядке обхода"""
+        mock_loader = Mock(spec=SpecLoader)
+        mock_loader.load.return_value = OpenAPISpec.from_dict(sample_openapi_spec)
+        
+        use_case = GetEndpointInfoUseCase(mock_loader)
+        endpoint = use_case.execute("test.json", "/api/v1/users/{userId}", "GET")
+        related = use_case.get_related_schemas("test.json", endpoint)
+        
+        assert [s['name'] for s in related] == ['User', 'UserRole', 'Error']
+        assert related[0]['definition'] == sample_openapi_spec['components']['schemas']['User']
+    
+    def test_get_related_schemas_deep_nesting(self):
+        """Тест обхода глубоко вложенной схемы без RecursionError"""
+        node = {"$ref": "#/components/schemas/Leaf"}
+        for _ in range(5000):
+            node = {"type": "array", "items": node}
+        spec_dict = {
+            "paths": {},
+            "components": {"schemas": {"Leaf": {"type": "string"}}}
+        }
+        mock_loader = Mock(spec=SpecLoader)
+        mock_loader.load.return_value = OpenAPISpec.from_dict(spec_dict)
+        endpoint = Endpoint(
+            path="/deep",
+            method="post",
+            operation={"requestBody": {"content": {"application/json": {"schema": node}}}},
+            tags=[]
+        )
+        
+        use_case = GetEndpointInfoUseCase(mock_loader)
+        related = use_case.get_related_schemas("test.json", endpoint)
+        
+        assert [s['name'] for s in related] == ['Leaf']
+    
+    def test_execute_with_schemas_loads_spec_once(self, sample_openapi_spec):
+        """Тест что execute_with_schemas загружает спецификацию один раз"""
+        mock_loader = Mock(spec=SpecLoader)
+        mock_loader.load.return_value = OpenAPISpec.from_dict(sample_openapi_spec)
+        
+        use_case = GetEndpointInfoUseCase(mock_loader)
+        endpoint, related = use_case.execute_with_schemas("test.json", "/api/v1/users", "POST")
+        
+        assert endpoint.method == "POST"
+        assert [s['name'] for s in related] == ['User', 'UserRole']
+        mock_loader.load.assert_called_once_with("test.json")
+    
+    def test_resolver_reused_for_same_spec(self, sample_openapi_spec):
+        """Тест что резолвер переиспользуется для того же объекта спецификации"""
+        mock_loader = Mock(spec=SpecLoader)
+        spec_obj = OpenAPISpec.from_dict(sample_openapi_spec)
+        mock_loader.load.return_value = spec_obj
+        
+        use_case = GetEndpointInfoUseCase(mock_loader)
+        resolver = use_case._get_resolver(spec_obj)
+        
+        assert use_case._get_resolver(spec_obj) is resolver
+        assert use_case._get_resolver(OpenAPISpec.from_dict(sample_openapi_spec)) is not resolver
+    
+    def test_get_related_schemas_skips_unknown_refs(self):
+        """Тест что ссылки на отсутствующие схемы пропускаются"""
+        spec_dict = {
+            "paths": {},
+            "components": {"schemas": {"Known": {"type": "string"}}}
+        }
+        mock_loader = Mock(spec=SpecLoader)
+        mock_loader.load.return_value = OpenAPISpec.from_dict(spec_dict)
+        endpoint = Endpoint(
+            path="/items",
+            method="get",
+            operation={"responses": {"200": {"content": {"application/json": {"schema": {
+                "anyOf": [
+                    {"$ref": "#/components/schemas/Missing"},
+                    {"$ref": "#/components/schemas/Known"},
+                    {"$ref": "#/components/schemas/Known"}
+                ]
+            }}}}}},
+            tags=[]
+        )
+        
+        related = GetEndpointInfoUseCase(mock_loader).get_related_schemas("test.json", endpoint)
+        
+        assert [s['name'] for s in related] == ['Known']
+    
+    def test_get_related_schemas_default_response(self):
+        """Тест что схема ответа 'default' попадает в связанные схемы"""
+        spec_dict = {
+            "paths": {},
+            "components": {"schemas": {"Item": {"type": "string"}, "Error": {"type": "string"}}}
+        }
+        mock_loader = Mock(spec=SpecLoader)
+        mock_loader.load.return_value = OpenAPISpec.from_dict(spec_dict)
+        endpoint = Endpoint(
+            path="/items",
+            method="get",
+            operation={"responses": {
+                "200": {"content": {"application/json": {"schema": {"$ref": "#/components/schemas/Item"}}}},
+                "default": {"content": {"application/json": {"schema": {"$ref": "#/components/schemas/Error"}}}}
+            }},
+            tags=[]
+        )
+        
+        related = GetEndpointInfoUseCase(mock_loader).get_related_schemas("test.json", endpoint)
+        
+        assert [s['name'] for s in related] == ['Item', 'Error']
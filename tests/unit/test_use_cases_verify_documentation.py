@@ -143,3 +143,37 @@ class TestVerifyDocumentationUseCase:
                 markdown_file="/nonexistent/file.md"
             )
 
+    
+    def test_read_markdown_normalizes_newlines(self, tmp_path):
+        """Тест что Markdown с CRLF читается с переводами строк \\n"""
+        md_file = tmp_path / "test.md"
+        md_file.write_bytes("### `GET` /api/v1/users\r\n*Описание*\r\n".encode('utf-8'))
+        
+        use_case = VerifyDocumentationUseCase(Mock(spec=SpecLoader))
+        
+        assert use_case._read_markdown(str(md_file)) == "### `GET` /api/v1/users\n*Описание*\n"
+    
+    def test_read_markdown_large_file_via_mmap(self, tmp_path, monkeypatch):
+        """Тест чтения большого Markdown файла через mmap"""
+        monkeypatch.setattr(VerifyDocumentationUseCase, 'MMAP_THRESHOLD', 0)
+        md_file = tmp_path / "test.md"
+        md_file.write_bytes("### `GET` /api/v1/users\r\n*Описание*\r\n".encode('utf-8'))
+        
+        use_case = VerifyDocumentationUseCase(Mock(spec=SpecLoader))
+        
+        assert use_case._read_markdown(str(md_file)) == "### `GET` /api/v1/users\n*Описание*\n"
+    
+    def test_verify_all_endpoints_parallel_matches_sequential(self, sample_openapi_spec, tmp_path, monkeypatch):
+        """Тест что параллельная проверка дает тот же результат, что и последовательная"""
+        monkeypatch.setattr(VerifyDocumentationUseCase, 'PARALLEL_MIN_ENDPOINTS', 0)
+        mock_loader = Mock(spec=SpecLoader)
+        mock_loader.load.return_value = OpenAPISpec.from_dict(sample_openapi_spec)
+        
+        md_file = tmp_path / "test.md"
+        md_file.write_text("### `GET` /api/v1/users\n*Tag: users*\n", encoding='utf-8')
+        
+        use_case = VerifyDocumentationUseCase(mock_loader)
+        sequential = use_case.verify_all_endpoints("test.json", str(md_file))
+        parallel = use_case.verify_all_endpoints("test.json", str(md_file), max_workers=4)
+        
+        assert parallel == sequential